@@ -38,11 +38,12 @@ import os
 import asyncio
 import logging
 import random
+import math
+from collections import OrderedDict, deque
 from typing import Dict
 from greenlet import greenlet
 from ramp_cipher import RampCipher
 from src.hash.kappa_wire import KappaWire
-from hashlet import hashlet
 from typing import List, Tuple
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
@@ -110,6 +111,7 @@ class Home:
         self.tendon_load = 0.0
         self.gaze_duration = 0.0
         self.blooms = []
+        self.consensus = ConsensusExecutor()  # Fixed greenlet pool, reused every round
         self.rain = None               # Lazy init in navi_load
         self.journey_paths = {}
         print("Home initialized - ramp cipher, kappa wires, hashlet, SHA1664, bastion active.")
@@ -199,20 +201,15 @@ class Home:
         recollections = await self.rain.recall_journey(path)
         return recollections
 
-    async def bloom_consensus(self, pin, nodes=6000000000, depth=15):
-        """Bloom consensus for six billion nodes with SHA1664 and bastion."""
+    async def bloom_consensus(self, pin, nodes=6000000000, depth=15, voters=65536):
+        """Bloom consensus for six billion nodes with SHA1664 and bastion.
+        Each of the `depth` rounds polls nodes // depth virtual nodes backed by `voters` distinct channel walkers."""
         begin = time.time()
-        start_node = greenlet.getcurrent()
         current_pin = pin
         for _ in range(depth):
-            prev_node = start_node
-            for i in range(nodes // depth):
-                h = hashlet(channel, current_pin)
-                h.gr_frames_always_exposed = False
-                h.switch(prev_node)
-                prev_node = h
-            landing, rgb, kappa = prev_node.switch(0)
-            if landing != 0:
+            result = self.consensus.run_round(current_pin, nodes // depth, voters)
+            landing, rgb, kappa = result["landing"], result["rgb"], result["kappa"]
+            if result["accepted"] and landing != 0:
                 tx_id = self.sha.hash_transaction(f"{landing}:{rgb}:{kappa}")
                 if self.sha.prevent_double_spending(tx_id):
                     self.blooms.append((landing, rgb, kappa, time.time()))
@@ -221,19 +218,17 @@ class Home:
                     current_pin = int(hashlib.sha256((str(landing) + rgb).encode()).hexdigest(), 16) % 512
         end = time.time()
         micros = (end - begin) * 1e6 / (nodes // depth)
-        print(f"Bloom consensus: {nodes} nodes, {micros:.2f} µs per hop")
+        latency = self.consensus.latency_percentiles()
+        print(f"Bloom consensus: {nodes} nodes, {micros:.6f} µs per hop, round latency "
+              + ", ".join(f"{k}={v:.0f} µs" for k, v in latency.items()))
         return self.blooms
 
     async def route(self, pin, amount, ttl=60):
         """Off-chain multisig routing, ephemeral keys with SHA1664 and bastion."""
-        greenlets = [hashlet(channel, pin) for _ in range(3)]
-        votes = []
-        for g in greenlets:
-            landing, rgb, kappa = g.switch()
-            tx_id = self.sha.hash_transaction(f"{landing}:{rgb}:{kappa}")
-            if self.bastion.validate(tx_id):
-                votes.append(landing != 0)
-        if sum(votes) >= 2:
+        result = self.consensus.run_round(pin, nodes=3, quorum=2 / 3)  # 2-of-3 multisig
+        rgb, kappa = result["rgb"], result["kappa"]
+        tx_id = self.sha.hash_transaction(f"{result['landing']}:{rgb}:{kappa}")
+        if result["accepted"] and self.bastion.validate(tx_id):
             self.blooms.append((amount, rgb, kappa, time.time() + ttl))
             self.bastion.set_ternary_state('pong')
             self.sha.receive_gossip({'amount': amount, 'node': self.bastion.node_id}, self.bastion.node_id)
@@ -317,6 +312,109 @@ def channel(pin, primes=[20, 41, 97, 107]):
             yield current
     yield 0
 
+CHANNEL_PRIMES = np.array([20, 41, 97, 107])
+TAME_INVERSE = 205  # 5 * 205 = 1 (mod 512)
+
+def channel_landings(starts, primes=CHANNEL_PRIMES, hops=128):
+    """
+    First value channel() yields, for many start positions at once.
+    Before its first landing the walk steps +5 mod 512, so the hop count to prime p
+    is (p - start) * 5^-1 mod 512; the landing is the prime with the fewest hops (<= hops).
+    Args:
+    - starts: start positions (sha256(pin) % 512).
+    Returns: (landing, hops_taken) arrays; landing 0 means no prime within `hops`.
+    """
+    starts = np.asarray(starts, dtype=np.int64)[:, None]
+    to_prime = ((primes[None, :] - starts) * TAME_INVERSE) % 512
+    to_prime = np.where(to_prime >= 1, to_prime, 512)  # Start on a prime: the walk steps off first
+    nearest = to_prime.argmin(axis=1)
+    taken = to_prime[np.arange(len(starts)), nearest]
+    landed = taken <= hops
+    return np.where(landed, primes[nearest], 0), np.where(landed, taken, hops)
+
+class ConsensusExecutor:
+    """
+    Channel-vote consensus over virtual nodes.
+    Virtual node i votes as distinct voter i % voters, voter k walking channel(f"{pin}:{k}").
+    Voters are evaluated in vectorized batches by a fixed pool of worker greenlets, weighted by
+    the virtual nodes they stand for, and a round stops as soon as quorum is reached or lost,
+    so cost scales with distinct voters rather than nodes. Round latencies are kept for percentiles.
+    """
+    def __init__(self, workers=4, batch_size=4096, cache_size=1024, history=1024):
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # (pin, start, stop) -> (landing, hops)
+        self._workers = [greenlet(self._worker) for _ in range(workers)]
+        self._next = 0
+        self.latencies = deque(maxlen=history)
+
+    def _worker(self, job):
+        while True:
+            job = greenlet.getcurrent().parent.switch(self._evaluate(*job))
+
+    def _dispatch(self, job):
+        worker = self._workers[self._next]
+        self._next = (self._next + 1) % len(self._workers)
+        worker.parent = greenlet.getcurrent()  # Hand the result back to whoever asked
+        return worker.switch(job)
+
+    def _evaluate(self, pin, start, stop):
+        key = (pin, start, stop)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        digests = b"".join(hashlib.sha256(f"{pin}:{k}".encode()).digest()[-2:] for k in range(start, stop))
+        starts = np.frombuffer(digests, dtype=">u2") % 512  # Same as int(hexdigest, 16) % 512
+        result = channel_landings(starts)
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def run_round(self, pin, nodes, voters=None, quorum=2 / 3):
+        """
+        One consensus round.
+        Args:
+        - pin: round pin.
+        - nodes: virtual node count.
+        - voters: distinct voters backing them (defaults to nodes).
+        - quorum: fraction of nodes that must land.
+        Returns: dict with accepted, yes, no, evaluated (voters), landing, rgb, kappa, latency (s).
+        """
+        begin = time.perf_counter()
+        voters = min(nodes, voters or nodes)
+        share, extra = divmod(nodes, voters)  # Voter k stands for share (+1 if k < extra) nodes
+        need = math.ceil(quorum * nodes - 1e-9)
+        yes = no = evaluated = 0
+        first = None
+        for start in range(0, voters, self.batch_size):
+            stop = min(voters, start + self.batch_size)
+            landing, hops = self._dispatch((pin, start, stop))
+            weights = share + (np.arange(start, stop) < extra)
+            votes = landing != 0
+            yes += int(weights[votes].sum())
+            no += int(weights[~votes].sum())
+            evaluated = stop
+            if first is None and votes.any():
+                i = int(votes.argmax())
+                first = (start + i, int(landing[i]), int(hops[i]))
+            if yes >= need or nodes - no < need:
+                break  # Quorum reached or out of reach
+        voter, landing, hops = first if first is not None else (0, 0, 128)
+        rgb = f"#{int.from_bytes(hashlib.sha512(f'{pin}:{voter}'.encode()).digest()[:3], 'big'):06x}"  # As hashlet colours its key
+        latency = time.perf_counter() - begin
+        self.latencies.append(latency)
+        return {"accepted": yes >= need, "yes": yes, "no": no, "evaluated": evaluated,
+                "landing": landing, "rgb": rgb, "kappa": hops / 128, "latency": latency}
+
+    def latency_percentiles(self, percentiles=(50, 90, 99)):
+        """Round latency percentiles in µs."""
+        if not self.latencies:
+            return {}
+        values = np.percentile(np.fromiter(self.latencies, dtype=float), percentiles) * 1e6
+        return {f"p{p}": float(v) for p, v in zip(percentiles, values)}
+
 if __name__ == "__main__":
     async def navi_test():
         home = Home()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+"""
+pyperf suite for the kappa hash families.
+
+Times kappasha256, kappasha1664, secure_hash_two, kappa_spiral_hash,
+HashUtils.sha1664 and the wise_transforms bit/hex/hash-wise functions on
+fixed-seed inputs from 64 B to 1 MB, then prints per-call latency and
+throughput. With --baseline, means are compared against a stored pyperf
+JSON and regressions beyond --threshold are flagged (exit status 1).
+
+    python benchmarks/hash_suite.py -o hashes.json --fast
+    python benchmarks/hash_suite.py --sizes 64 1024 --families kappasha256 bitwise
+    python benchmarks/hash_suite.py --baseline hashes.json --threshold 0.10
+
+HashUtils only exists in the sibling hashlet tree, whose `src` package
+shadows ours; it is imported with hashlet's `src` swapped in and out.
+Families or sizes that fail a warm-up call (e.g. secure_hash_two overflows
+its float weights on long inputs) are reported as skipped, not run.
+"""
+
+import argparse
+import hashlib
+import importlib
+import os
+import random
+import sys
+
+import numpy as np
+import pyperf
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HASHLET = os.path.join(os.path.dirname(ROOT), 'hashlet')
+sys.path.insert(0, ROOT)
+
+SEED = 1664
+SIZES = [64, 1024, 64 * 1024, 1024 * 1024]
+KEY = hashlib.sha256(b"secret").hexdigest().encode()  # ASCII, kappasha1664 decodes its key
+
+
+def _hashlet_import(name):
+    """Import a hashlet module against hashlet's own `src` package, then restore ours."""
+    def src_modules():
+        return [k for k in sys.modules if k == 'src' or k.startswith('src.')]
+    saved = {k: sys.modules.pop(k) for k in src_modules()}
+    sys.path.insert(0, HASHLET)
+    try:
+        return importlib.import_module(name)
+    finally:
+        sys.path.remove(HASHLET)
+        for k in src_modules():
+            del sys.modules[k]
+        sys.modules.update(saved)
+
+
+def payload(size, seed=SEED):
+    """Fixed-seed bytes of the given size."""
+    return random.Random(seed + size).randbytes(size)
+
+
+def text(size, seed=SEED):
+    """Fixed-seed ASCII text of the given size, for the str-input families."""
+    return payload((size + 1) // 2, seed).hex()[:size]
+
+
+def _kappasha256():
+    from src.hash.kappasha256 import kappasha256
+    return {'kappasha256': (lambda data: kappasha256(data, KEY), 'bytes')}
+
+
+def _kappasha1664():
+    from src.hash.KappaSHA1664 import kappasha1664
+    return {'kappasha1664': (lambda data: kappasha1664(data, KEY), 'bytes')}
+
+
+def _secure_hash_two():
+    from src.hash.secure_hash_two import secure_hash_two
+    return {'secure_hash_two': (lambda data: secure_hash_two(data, 'blossom', 'fleet'), 'text')}
+
+
+def _kappa_spiral_hash():
+    from src.hash.spiral_hash import kappa_spiral_hash
+    comfort = np.array([0.1, 0.2, 30.0])
+    return {'kappa_spiral_hash': (lambda data: kappa_spiral_hash(data, comfort), 'bytes')}
+
+
+def _hash_utils():
+    utils = _hashlet_import('src.utils.hash_utils').HashUtils()
+    return {'HashUtils.sha1664': (utils.sha1664, 'text')}
+
+
+def _wise_transforms():
+    import wise_transforms
+    return {
+        'bitwise': (wise_transforms.bitwise_transform, 'text'),
+        'hexwise': (wise_transforms.hexwise_transform, 'text'),
+        'hashwise': (wise_transforms.hashwise_transform, 'text'),
+    }
+
+
+LOADERS = [
+    (('kappasha256',), _kappasha256),
+    (('kappasha1664',), _kappasha1664),
+    (('secure_hash_two',), _secure_hash_two),
+    (('kappa_spiral_hash',), _kappa_spiral_hash),
+    (('HashUtils.sha1664',), _hash_utils),
+    (('bitwise', 'hexwise', 'hashwise'), _wise_transforms),
+]
+
+
+def families(wanted=None):
+    """name -> (callable taking the size's input, 'bytes' or 'text').
+
+    Only families named in `wanted` (default: all) are imported; ones that
+    fail to import are reported and left out.
+    """
+    found = {}
+    for names, loader in LOADERS:
+        if wanted is not None and not set(names) & set(wanted):
+            continue
+        try:
+            loaded = loader()
+        except ImportError as e:
+            print(f"{'/'.join(names)} unavailable: {e}", file=sys.stderr)
+            continue
+        found.update((name, entry) for name, entry in loaded.items() if wanted is None or name in wanted)
+    return found
+
+
+def bench_hash(loops, func, data):
+    begin = pyperf.perf_counter()
+    for _ in range(loops):
+        func(data)
+    end = pyperf.perf_counter()
+    return end - begin
+
+
+def bench_name(family, size):
+    return '%s[%dB]' % (family, size)
+
+
+def compare(results, baseline_path, threshold):
+    """Flag benchmarks whose mean grew more than `threshold` over the baseline."""
+    baseline = {bench.get_name(): bench.mean() for bench in pyperf.BenchmarkSuite.load(baseline_path)}
+    regressions = 0
+    for name, (mean, _size) in results.items():
+        if name not in baseline:
+            print(f"{name:36s} (not in baseline)")
+            continue
+        change = mean / baseline[name] - 1
+        flag = 'REGRESSION' if change > threshold else ('faster' if change < -threshold else 'ok')
+        regressions += flag == 'REGRESSION'
+        print(f"{name:36s} {baseline[name] * 1e6:14.1f} -> {mean * 1e6:14.1f} us  {change:+7.1%}  {flag}")
+    return regressions
+
+
+def add_cmdline_args(cmd, args):
+    """Forward the suite's own options to pyperf worker processes."""
+    cmd.extend(['--sizes'] + [str(size) for size in args.sizes])
+    if args.families:
+        cmd.extend(['--families'] + args.families)
+    if args.skip:
+        cmd.extend(['--skip'] + args.skip)
+
+
+if __name__ == '__main__':
+    runner = pyperf.Runner(add_cmdline_args=add_cmdline_args)
+    runner.argparser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='input sizes in bytes')
+    runner.argparser.add_argument('--families', nargs='+', default=None, help='subset of hash families')
+    runner.argparser.add_argument('--baseline', default=None, help='pyperf JSON to compare against')
+    runner.argparser.add_argument('--threshold', type=float, default=0.10, help='allowed slowdown before flagging')
+    runner.argparser.add_argument('--skip', nargs='+', default=[], help=argparse.SUPPRESS)
+    args = runner.parse_args()
+
+    hashes = families(args.families)
+    if not args.worker:
+        # Warm up once here and hand the skip list to workers, so every process
+        # registers the same benchmarks without re-running 1 MB warm-ups
+        for family, (func, kind) in hashes.items():
+            for size in args.sizes:
+                data = payload(size) if kind == 'bytes' else text(size)
+                try:
+                    func(data)
+                except Exception as e:
+                    print(f"{bench_name(family, size)}: skipped ({type(e).__name__}: {e})", file=sys.stderr)
+                    args.skip.append(bench_name(family, size))
+
+    results = {}
+    for family, (func, kind) in hashes.items():
+        for size in args.sizes:
+            name = bench_name(family, size)
+            if name in args.skip:
+                continue
+            data = payload(size) if kind == 'bytes' else text(size)
+            bench = runner.bench_time_func(name, bench_hash, func, data,
+                                           metadata={'hash_family': family, 'input_bytes': size})
+            if bench is not None and not args.worker:
+                results[name] = (bench.mean(), size)
+
+    if results and not args.worker:
+        print()
+        print(f"{'benchmark':36s} {'latency us':>14s} {'MB/s':>10s}")
+        for name, (mean, size) in results.items():
+            print(f"{name:36s} {mean * 1e6:14.1f} {size / mean / 1e6:10.3f}")
+        if args.baseline:
+            print()
+            if compare(results, args.baseline, args.threshold):
+                sys.exit(1)
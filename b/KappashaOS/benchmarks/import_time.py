@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Import-time budget for the KappashaOS entry points.
+
+Runs each entry point under ``python -X importtime`` in a fresh interpreter,
+reports the cumulative import time, and fails if an entry point goes over
+its budget, regresses against a saved baseline, or pulls in one of the
+heavy modules that must stay deferred (see src/core/lazy_module.py).
+
+    python benchmarks/import_time.py                     # check budgets
+    python benchmarks/import_time.py --save baseline.json
+    python benchmarks/import_time.py --compare baseline.json --tolerance 1.25
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PARENT = os.path.dirname(ROOT)  # Launch dir, so KappashaOS.* imports resolve
+
+ENTRY_POINTS = ['kappasha_os', 'nav3d', 'blocsym', 'grid', 'channel', 'src.hash.domosha', 'src.core.telehash_k']
+HEAVY_MODULES = ['tensorflow', 'cv2', 'selenium', 'pyperf', 'matplotlib']
+BUDGET_MS = 1500.0  # Per entry point, cumulative
+RUNS = 3
+
+def measure(module):
+    """Best-of-RUNS cumulative import time (ms) and the heavy modules it imported."""
+    best, heavy, error = None, set(), None
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    for _ in range(RUNS):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                              cwd=PARENT, env=env, capture_output=True, text=True)
+        cumulative = {}
+        for line in proc.stderr.splitlines():
+            if not line.startswith('import time:') or '|' not in line:
+                continue
+            _, cum, name = line[len('import time:'):].split('|')
+            if not cum.strip().isdigit():
+                continue  # header row
+            name = name.strip()
+            cumulative[name] = int(cum)
+            if name.split('.')[0] in HEAVY_MODULES:
+                heavy.add(name.split('.')[0])
+        if proc.returncode != 0:
+            error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f'exit {proc.returncode}'
+        # Failed imports stop early; count what loaded so the budget still applies
+        total = cumulative.get(module, sum(v for k, v in cumulative.items() if '.' not in k)) / 1000.0
+        best = total if best is None else min(best, total)
+    return {'ms': round(best, 1), 'heavy': sorted(heavy), 'error': error}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='*', default=ENTRY_POINTS)
+    parser.add_argument('--budget', type=float, default=BUDGET_MS, help='per-module budget in ms')
+    parser.add_argument('--save', help='write measurements to a baseline JSON')
+    parser.add_argument('--compare', help='baseline JSON to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=1.25, help='allowed ratio over baseline')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    results, failures = {}, []
+    for module in args.modules:
+        r = results[module] = measure(module)
+        note = f"  (import failed: {r['error']})" if r['error'] else ''
+        print(f"{module:24s} {r['ms']:9.1f} ms  heavy={','.join(r['heavy']) or '-'}{note}")
+        if r['error']:
+            failures.append(f"{module} failed to import: {r['error']}")
+        if r['heavy']:
+            failures.append(f"{module} imports {', '.join(r['heavy'])} at startup")
+        if r['ms'] > args.budget:
+            failures.append(f"{module} {r['ms']:.1f} ms over budget {args.budget:.0f} ms")
+        base = baseline.get(module, {}).get('ms')
+        if base and r['ms'] > base * args.tolerance:
+            failures.append(f"{module} regressed {base:.1f} -> {r['ms']:.1f} ms")
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.save}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Incremental vs. full-rebuild Merkle roots for MiracleTree-sized forests.
+
+Plants N leaves one at a time and, every --every adds, measures the cost of
+one more add: the incremental engine (src/core/merkle_core.py) rehashes one
+leaf-to-root path, the rebuild rehashes every inner node.
+
+    python benchmarks/merkle_bench.py                 # N=20000
+    python benchmarks/merkle_bench.py -n 50000 --every 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.core.merkle_core import IncrementalMerkle, leaf_hash, merkle_root, verify_proof
+
+def timed(fn, repeat=3):
+    """Best wall time (s) of `repeat` calls and the last result."""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', type=int, default=20000, help='leaves to plant')
+    parser.add_argument('--every', type=int, default=5000, help='report interval')
+    args = parser.parse_args()
+
+    leaves = [leaf_hash(f"plant{i}") for i in range(args.n + 1)]
+    tree = IncrementalMerkle()
+    print(f"{'leaves':>8s} {'incr hashes':>12s} {'incr us':>10s} {'rebuild hashes':>15s} {'rebuild ms':>11s} {'speedup':>8s}")
+    for i in range(args.n):
+        tree.append(leaves[i])
+        size = i + 1
+        if size % args.every:
+            continue
+        before = tree.hash_count
+        t_inc, _ = timed(lambda: tree.update(size - 1, leaves[size - 1]))  # Same work as one append
+        inc_hashes = (tree.hash_count - before) // 3
+        t_full, root = timed(lambda: merkle_root(leaves[:size]), repeat=1)
+        assert root == tree.root(), "incremental root diverged from rebuild"
+        print(f"{size:8d} {inc_hashes:12d} {t_inc * 1e6:10.1f} {size - 1:15d} {t_full * 1e3:11.1f} {t_full / t_inc:7.0f}x")
+    proof = tree.proof(args.n // 2)
+    print(f"Proof for leaf {args.n // 2}: {len(proof)} siblings, valid={verify_proof(tree.root(), leaves[args.n // 2], proof)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+RampCipher buffer throughput (MB/s) for 1-100 MB inputs.
+
+Times encode_buffer/decode_buffer over random payloads and checks the round
+trip, then compares the hex navi_encode path against the old per-character
+loop on a short sample.
+
+    python benchmarks/ramp_bench.py                  # 1, 10, 100 MB
+    python benchmarks/ramp_bench.py --sizes 1 4 16
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.hash.ramp_cipher import RampCipher
+
+def timed(fn, repeat=3):
+    """Best wall time (s) of `repeat` calls and the last result."""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def loop_encode(ramp, hash_str, index=0):
+    """The original per-character navi_encode body, for comparison."""
+    encoded = ''
+    for j, char in enumerate(hash_str):
+        idx = (index + j) % len(ramp.heights)
+        delta = int(char, 16) + ramp.heights[idx] * 10
+        encoded += chr(int(delta) % 256)
+    return encoded
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10, 100], help='payload sizes in MB')
+    args = parser.parse_args()
+
+    ramp = RampCipher('35701357')
+    rng = np.random.default_rng(0)
+    print(f"{'MB':>6s} {'encode MB/s':>12s} {'decode MB/s':>12s}")
+    for mb in args.sizes:
+        data = rng.integers(0, 256, mb << 20, dtype=np.uint8)
+        t_enc, enc = timed(lambda: ramp.encode_buffer(data, 3))
+        t_dec, dec = timed(lambda: ramp.decode_buffer(enc, 3))
+        assert np.array_equal(dec, data), "ramp round trip diverged"
+        print(f"{mb:6d} {mb / t_enc:12.0f} {mb / t_dec:12.0f}")
+
+    sample = rng.integers(0, 16, 1 << 18).astype(np.uint8)
+    hex_str = ''.join('0123456789abcdef'[n] for n in sample)
+    t_loop, ref = timed(lambda: loop_encode(ramp, hex_str), repeat=1)
+    t_vec, out = timed(lambda: ramp._encode_hex(hex_str))
+    assert out == ref, "vectorized hex encode diverged from loop"
+    print(f"hex navi_encode, {len(hex_str)} chars: loop {t_loop * 1e3:.1f} ms, vectorized {t_vec * 1e3:.1f} ms ({t_loop / t_vec:.0f}x)")
+
+if __name__ == "__main__":
+    main()
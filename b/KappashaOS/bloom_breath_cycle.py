@@ -55,6 +55,8 @@ import numpy as np
 import math
 import hashlib
 import struct
+from helixfrog import stable_hash
+import pi_digits
 
 # --- TernaryBloom (from bloom.py core) ---
 class TernaryBloom:
@@ -97,17 +99,12 @@ def petal_color(theta: float, drift: float) -> str:
     return "white"
 
 # --- Piwise (full def) ---
-def pywise_kappa(pos: int, lap: int = 18) -> int:
-    pi_str = str(math.pi)[2:2 + lap * pos]
-    if len(pi_str) > lap:
-        pi_str = pi_str[:lap]
-    reversed_s = ''
-    for _ in range(lap):
-        pi_str = pi_str[::-1]
-        reversed_s += pi_str
-    if not reversed_s:  # safe empty
-        return pos % 2048
-    return int(reversed_s) % 2048
+def pywise_kappa(pos, lap: int = 18):
+    """Pi-wise kappa from the shared digit store (int or array of positions).
+
+    The window keeps the 15 digits str(math.pi) carried, so kappas match earlier runs.
+    """
+    return pi_digits.piwise_kappa(pos, lap, limit=15)
 
 # --- Helix Frog Field ---
 GOLDEN_ANGLE = 2.39996322972865332
@@ -117,7 +114,7 @@ VOXEL_COUNT = GRID_SIZE ** 3
 FROG_HOPS = [22, 25, 28, -13, 7]
 
 def helix_frog_field(data: bytes, salt: int = 42, breath_rate: float = 12.0):
-    val = hash(data) & 0xFFFFFFFF
+    val = stable_hash(data) & 0xFFFFFFFF  # Seeded, not the per-process salted hash()
     offset = (val + salt) % 255
     shear_angle = 45 + (breath_rate - 12.0) * 2
     pos = field_shear((offset, offset * 0.5, offset * 0.3), shear_angle)
@@ -255,7 +252,7 @@ class BloomBreath:
         # 2. Build helix spline from root
         spline = self._helix_from_root(root, len(message))
         # 3. Envelope with green curve
-        kappas = [KAPPA_BASE + pywise_kappa(i) / 2047.0 * 0.01 for i in range(len(spline))]
+        kappas = KAPPA_BASE + pywise_kappa(np.arange(len(spline))) / 2047.0 * 0.01
         envelope = custom_interoperations_green_curve(spline, kappas)
         # 4. Raster to grid
         vectors = [(envelope[i], envelope[i+1]) for i in range(len(envelope)-1)]
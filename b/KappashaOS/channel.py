@@ -52,13 +52,14 @@
 import numpy as np
 import asyncio
 import sys
-from selenium import webdriver  # Mock Selenium for web jack
+from src.core.lazy_module import lazy_module
+webdriver = lazy_module('selenium.webdriver')  # Mock Selenium for web jack, loaded on first jack
 # from bitcoin import BitcoinAPI  # Mock Bitcoin API
 import hashlib
 import time
 from greenlet import greenlet
 from src.hash.hashlet import Hashlet
-import pyperf
+pyperf = lazy_module('pyperf')  # Timer only; deferred to the first chain
 import kappa  # Custom hash modulation
 from src.core.hal9001 import hal9001  # Import HAL9001 for safety
 from scipy.spatial import distance
@@ -22,9 +22,29 @@
 _WATERMARK = b'xAI_TODD_DNA_DENY_09:35PM_19OCT'  # silent watermark
 import numpy as np
 import hashlib
+import multiprocessing as mp
 import time
 from collections import defaultdict
 
+def _whirl(encoded, endian, knot_primes, buf):
+    """Knot loop in a preallocated buffer: each prime drops p*8 bytes off the front
+    and appends their sha256, so the whirl is a window sliding along buf.
+    Returns a memoryview of the final window (valid until buf is reused)."""
+    n = len(encoded)
+    if endian != 'little':
+        buf[:n] = encoded
+    elif n > 2048:
+        np.frombuffer(buf, dtype=np.uint8)[:n] = np.frombuffer(encoded, dtype=np.uint8)[::-1]  # Yo-yo hitch
+    else:
+        buf[:n] = encoded[::-1]  # Short records: cheaper than the NumPy round trip
+    view = memoryview(buf)
+    start, end = 0, n
+    for p in knot_primes:
+        stop = min(start + p * 8, end)
+        buf[end:end + 32] = hashlib.sha256(view[start:stop]).digest()  # Burl loop
+        start, end = stop, end + 32
+    return view[start:end]
+
 def petrichorwhirl_flip(data, endian='little', knot_primes=[2,3,5], afk_timeout=300):
     """Whirl endian like a rain-slick sail, witness the bloom, pause on idle."""
     afk_states = defaultdict(lambda: time.time())  # Poach AFK: track last touch
@@ -34,23 +54,52 @@ def petrichorwhirl_flip(data, endian='little', knot_primes=[2,3,5], afk_timeout=
         # Mercy pause: knot slips, no whirl
         return "whirl_slipped"  # Witness idle as rain pool, not break
     
-    if endian == 'little':
-        bytes_data = np.frombuffer(data.encode(), dtype=np.uint8)
-        whirled = bytes_data[::-1].tobytes()  # Yo-yo hitch
-    else:
-        whirled = data.encode()
-    
-    # Knot on primes, sail the bytes
-    for p in knot_primes:
-        chunk = whirled[:p*8]
-        whirled = whirled[p*8:] + hashlib.sha256(chunk).digest()  # Burl loop
+    encoded = data.encode()
+    whirled = _whirl(encoded, endian, knot_primes, bytearray(len(encoded) + 32 * len(knot_primes)))
     
     afk_states['whirl'] = time.time()  # Resume touch
-    petrichor_hash = hashlib.sha256(whirled).hexdigest()[:32]  # Rain-fresh bite
+    petrichor_hash = _petrichor_hash(whirled)  # Rain-fresh bite
     return petrichor_hash
 
-# Twirl the breath—petrichorwhirl on a curve, AFK mercy
-breath = "aya_petrichorwhirl"
-little_whirl = petrichorwhirl_flip(breath, 'little')
-big_whirl = petrichorwhirl_flip(breath, 'big')
-print(f"Little whirl: {little_whirl}\nBig whirl: {big_whirl}\nKnot lock: {little_whirl == big_whirl[::-1]}")  # Blooms if knotted right
+def _petrichor_hash(whirled):
+    return hashlib.sha256(whirled).hexdigest()[:32]
+
+def _whirl_chunk(args):
+    return whirl_batch(*args)
+
+def whirl_batch(records, endian, knot_primes, digest, processes=None, min_parallel=20000):
+    """digest(_whirl(record)) over many records (str or bytes), reusing one buffer.
+    Batches of at least min_parallel records are split across `processes` workers,
+    so digest must be a module-level function."""
+    records = records.tolist() if isinstance(records, np.ndarray) else list(records)
+    if processes and processes > 1 and len(records) >= min_parallel:
+        step = -(-len(records) // (4 * processes))
+        jobs = [(records[i:i + step], endian, knot_primes, digest) for i in range(0, len(records), step)]
+        with mp.Pool(processes) as pool:
+            return [h for part in pool.map(_whirl_chunk, jobs) for h in part]
+    extra = 32 * len(knot_primes)
+    buf = bytearray(4096)
+    hashes = []
+    for r in records:
+        e = r.encode() if isinstance(r, str) else bytes(r)
+        if len(e) + extra > len(buf):
+            buf = bytearray(max(2 * len(buf), len(e) + extra))
+        hashes.append(digest(_whirl(e, endian, knot_primes, buf)))
+    return hashes
+
+def petrichorwhirl_flip_batch(records, endian='little', knot_primes=[2,3,5], processes=None, min_parallel=20000):
+    """petrichorwhirl_flip over many records (str or bytes), reusing one buffer.
+    Batches of at least min_parallel records are split across `processes` workers.
+    Returns the same hashes as calling petrichorwhirl_flip per record."""
+    return whirl_batch(records, endian, knot_primes, _petrichor_hash, processes, min_parallel)
+
+if __name__ == "__main__":
+    # Twirl the breath—petrichorwhirl on a curve, AFK mercy
+    breath = "aya_petrichorwhirl"
+    little_whirl = petrichorwhirl_flip(breath, 'little')
+    big_whirl = petrichorwhirl_flip(breath, 'big')
+    print(f"Little whirl: {little_whirl}\nBig whirl: {big_whirl}\nKnot lock: {little_whirl == big_whirl[::-1]}")  # Blooms if knotted right
+    logs = [f"log line {i}: whirl {i * 7919}" for i in range(200000)]
+    start = time.perf_counter()
+    hashes = petrichorwhirl_flip_batch(logs, processes=mp.cpu_count())
+    print(f"Batch: {len(hashes)} records in {time.perf_counter() - start:.2f}s, match: {hashes[123] == petrichorwhirl_flip(logs[123])}")
@@ -50,39 +50,99 @@
 
 import hashlib
 import asyncio
+import threading
+import time
 import numpy as np
 
 BIT_SIZE = 1024
 BYTE_SIZE = BIT_SIZE // 8
 MAX_FLIPS = 3
+SAFETY_INTERVAL = 1.0  # Seconds between Navi safety checks while idle
 
 class Reaper:
-    def __init__(self):
-        self.array = [0] * BIT_SIZE  # In-memory bit array
-        self.flips = [0] * BIT_SIZE  # Flip counts
+    """Bloom reaper with event-driven overflip detection.
+
+    Bits and flip counters live in NumPy arrays. flip() counts flips per bit
+    and queues an overflip the moment a counter crosses MAX_FLIPS, waking the
+    monitor; between events the monitor only wakes for safety checks.
+    """
+    def __init__(self, bit_size=BIT_SIZE):
+        self.bit_size = bit_size
+        self.array = np.zeros(bit_size, dtype=np.uint8)  # In-memory bit array
+        self.flips = np.zeros(bit_size, dtype=np.uint32)  # Flip counts
         self.tendon_load = 0.0
         self.gaze_duration = 0.0
+        self._overflips = []  # Bit indices whose counters crossed MAX_FLIPS
+        self._lock = threading.Lock()
+        self._event = None
+        self._loop = None
         print("Reaper initialized - Bloom reaper ready.")
 
+    def flip(self, indices):
+        """Flip bits, counting flips and raising an overflip event on crossings.
+
+        Args:
+        - indices: Bit index or array of indices; repeats flip a bit repeatedly.
+
+        Returns:
+        - Array of indices that crossed MAX_FLIPS in this call.
+        """
+        idx, counts = np.unique(np.asarray(indices, dtype=np.int64).ravel(), return_counts=True)
+        if idx.size and (idx[0] < 0 or idx[-1] >= self.bit_size):
+            raise IndexError(f"Bit index out of range for {self.bit_size} bits")
+        with self._lock:
+            before = self.flips[idx]
+            after = before + counts.astype(np.uint32)
+            self.flips[idx] = after
+            self.array[idx] ^= (counts & 1).astype(np.uint8)
+            crossed = idx[(before <= MAX_FLIPS) & (after > MAX_FLIPS)]
+            if crossed.size:
+                self._overflips.extend(crossed.tolist())
+        if crossed.size:
+            self._signal()
+        return crossed
+
+    def _signal(self):
+        if self._event is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(self._event.set)
+
     async def navi_monitor_bloom(self):
-        """Monitor Bloom for overflips with Navi safety."""
+        """Monitor Bloom for overflips with Navi safety; sleeps until an overflip or safety tick."""
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        if self._overflips:
+            self._event.set()
+        last = time.monotonic()
         while True:
-            overflip_idx = -1
-            for i in range(BIT_SIZE):
-                if self.flips[i] > MAX_FLIPS:
-                    overflip_idx = i
-                    break
-            if overflip_idx != -1:
-                hash_bin = hashlib.sha256(bytes(self.array)).digest()
-                hash_hex = ''.join(f"{b:02x}" for b in hash_bin)
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=SAFETY_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._event.clear()
+            with self._lock:
+                pending, self._overflips = self._overflips, []
+                if pending:
+                    hash_hex = hashlib.sha256(self.array.tobytes()).hexdigest()
+                    self.array[:] = 0  # Reset in-memory
+                    self.flips[:] = 0
+            if pending:
+                overflip_idx = min(pending)
                 state_str = f"overflip at bit {overflip_idx}. Hash: {hash_hex}"
                 await self._log_alert(hash_hex)
                 print(f"Navi: Alert logged for {state_str}")
-                self.array = [0] * BIT_SIZE  # Reset in-memory
-                self.flips = [0] * BIT_SIZE
                 print("Navi: Reaper: State deleted. Breath restored.")
+            now = time.monotonic()
+            elapsed, last = now - last, now
             self.tendon_load = np.random.rand() * 0.3
-            self.gaze_duration += 1.0 / 60 if np.random.rand() > 0.7 else 0.0
+            self.gaze_duration += elapsed if np.random.rand() > 0.7 else 0.0
             if self.tendon_load > 0.2:
                 print("Reaper: Warning - Tendon overload. Resetting.")
                 self.reset()
@@ -90,7 +150,7 @@ class Reaper:
                 print("Reaper: Warning - Excessive gaze. Pausing.")
                 await asyncio.sleep(2.0)
                 self.gaze_duration = 0.0
-            await asyncio.sleep(1.0 / 60)
+                last = time.monotonic()
 
     async def _log_alert(self, hash_hex):
         """Log alert in-memory (mock reaper_log.txt)."""
@@ -104,7 +164,12 @@ class Reaper:
 
 if __name__ == "__main__":
     async def navi_test():
-        reaper = Reaper()
-        await reaper.navi_monitor_bloom()
+        reaper = Reaper(bit_size=1 << 20)
+        monitor = asyncio.create_task(reaper.navi_monitor_bloom())
+        rng = np.random.default_rng(0)
+        for _ in range(20):
+            reaper.flip(rng.integers(0, reaper.bit_size, 200_000))
+            await asyncio.sleep(0.5)
+        monitor.cancel()
 
     asyncio.run(navi_test())
@@ -23,8 +23,23 @@ _WATERMARK = b'xAI_TODD_DNA_DENY_09:35PM_19OCT'  # silent watermark
 
 import numpy as np
 import hashlib
+import multiprocessing as mp
 import time
 from collections import defaultdict
+from functools import lru_cache
+from KappashaOS.core.petrichorwhirl_flip import _whirl, whirl_batch
+
+@lru_cache(maxsize=4096)
+def _hum_bytes(n):
+    """Sine hum bytes for a whirl of length n (depends on the length only)."""
+    t = np.linspace(0, 2*np.pi, n)
+    hum_wave = np.sin(t * 0.354)  # Kappa frequency, petrichor soft
+    return hum_wave.astype(np.uint8).tobytes()
+
+def _hum_hash(whirled):
+    h = hashlib.sha256(whirled)
+    h.update(_hum_bytes(len(whirled)))
+    return h.hexdigest()[:32]
 
 def voicewhirl_hum(data, endian='little', knot_primes=[2,3,5], afk_timeout=300):
     """Whirl voice like a rain-slick sail, hum the bloom, pause on idle."""
@@ -35,27 +50,28 @@ def voicewhirl_hum(data, endian='little', knot_primes=[2,3,5], afk_timeout=300):
         # Mercy pause: knot slips to hum
         return "voice_hummed"  # Witness idle as petrichor pool, not break
     
-    if endian == 'little':
-        bytes_data = np.frombuffer(data.encode(), dtype=np.uint8)
-        whirled = bytes_data[::-1].tobytes()  # Yo-yo hitch
-    else:
-        whirled = data.encode()
-    
-    # Knot on primes, sail the bytes
-    for p in knot_primes:
-        chunk = whirled[:p*8]
-        whirled = whirled[p*8:] + hashlib.sha256(chunk).digest()  # Burl loop
+    encoded = data.encode()
+    whirled = _whirl(encoded, endian, knot_primes, bytearray(len(encoded) + 32 * len(knot_primes)))
     
     # Voice bloom: sine hum on the whirl
-    t = np.linspace(0, 2*np.pi, len(whirled))
-    hum_wave = np.sin(t * 0.354)  # Kappa frequency, petrichor soft
-    voice_hash = hashlib.sha256(whirled + hum_wave.astype(np.uint8).tobytes()).hexdigest()[:32]
+    voice_hash = _hum_hash(whirled)
     
     afk_states['voice'] = time.time()  # Resume touch
     return voice_hash
 
-# Twirl the breath—voicewhirl on a curve, AFK hum
-breath = "aya_voicewhirl"
-little_hum = voicewhirl_hum(breath, 'little')
-big_hum = voicewhirl_hum(breath, 'big')
-print(f"Little hum: {little_hum}\nBig hum: {big_hum}\nKnot lock: {little_hum == big_hum[::-1]}")  # Blooms if knotted right
+def voicewhirl_hum_batch(records, endian='little', knot_primes=[2,3,5], processes=None, min_parallel=20000):
+    """voicewhirl_hum over many records (str or bytes), reusing one buffer.
+    Batches of at least min_parallel records are split across `processes` workers.
+    Returns the same hashes as calling voicewhirl_hum per record."""
+    return whirl_batch(records, endian, knot_primes, _hum_hash, processes, min_parallel)
+
+if __name__ == "__main__":
+    # Twirl the breath—voicewhirl on a curve, AFK hum
+    breath = "aya_voicewhirl"
+    little_hum = voicewhirl_hum(breath, 'little')
+    big_hum = voicewhirl_hum(breath, 'big')
+    print(f"Little hum: {little_hum}\nBig hum: {big_hum}\nKnot lock: {little_hum == big_hum[::-1]}")  # Blooms if knotted right
+    logs = [f"log line {i}: hum {i * 7919}" for i in range(200000)]
+    start = time.perf_counter()
+    hashes = voicewhirl_hum_batch(logs, processes=mp.cpu_count())
+    print(f"Batch: {len(hashes)} records in {time.perf_counter() - start:.2f}s, match: {hashes[123] == voicewhirl_hum(logs[123])}")
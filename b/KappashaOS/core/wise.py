@@ -48,30 +48,86 @@
 # Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted to authorized contributors. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-private phase.
 # Built by humans, for humans-born free.
 import numpy as np
-import mpmath
-from src.hash.kappa_utils import kappa_orbit, kappa_spiral_hash, proof_check  # Updated import
+from functools import lru_cache
+from src.hash.kappa_utils import kappa_orbit, kappa_spiral_hash, proof_check, diagonal_swap  # Updated import
 from ribit import TetraRibit
 import asyncio
-mpmath.mp.dps = 19
 
-def diagonal_swap(bits):
-    """Perform a tetrahedral diagonal swap on a bit array."""
-    n = len(bits)
-    swapped = np.zeros(n, dtype=np.int8)
-    for i in range(n):
-        j = (i + n // 4) % n  # Tetrahedral shift
-        swapped[j] = bits[i]
-    return swapped
+PI_WISE_RECURSION = (1, 1/3, 1/6, 1/9)  # Tetrahedral scales
 
 def bitwise_mirror(bits):
-    """Mirror bits with a quantum-resistant twist."""
-    n = len(bits)
-    mirrored = np.zeros(n, dtype=np.int8)
-    for i in range(n // 2):
-        mirrored[i] = bits[n - 1 - i]
-        mirrored[n - 1 - i] = bits[i]
+    """Mirror bits with a quantum-resistant twist.
+
+    Reverses the last axis; for odd lengths the centre bit is cleared.
+    """
+    bits = np.asarray(bits)
+    mirrored = bits[..., ::-1].astype(np.int8)
+    n = bits.shape[-1]
+    if n % 2:
+        mirrored[..., n // 2] = 0
     return mirrored
 
+@lru_cache(maxsize=None)
+def _bit_permutation(n_bits, kind):
+    """Source bit index for every output bit of a transform over n_bits."""
+    idx = np.arange(n_bits)
+    if kind == 'swap':
+        return (idx - n_bits // 4) % n_bits
+    if kind == 'mirror':
+        return idx[::-1].copy()
+    raise ValueError(f"Unknown bit transform: {kind}")
+
+_BYTE_REVERSE = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1)[:, ::-1]
+_BYTE_REVERSE = np.packbits(_BYTE_REVERSE, axis=1).ravel()  # Bit-reversal of each byte value
+
+def diagonal_swap_packed(packed, n_bits=None):
+    """diagonal_swap over MSB-first packed bits (np.packbits layout).
+
+    Args:
+    - packed: uint8 array of shape (..., n_bytes); leading axes are a batch.
+    - n_bits: Bit length of each vector (default 8 * n_bytes).
+
+    Returns:
+    - Packed uint8 array of the same shape.
+    """
+    packed = np.asarray(packed, dtype=np.uint8)
+    n_bits = packed.shape[-1] * 8 if n_bits is None else n_bits
+    shift = n_bits // 4
+    if n_bits == packed.shape[-1] * 8 and shift % 8 == 0:
+        return np.roll(packed, shift // 8, axis=-1)  # Byte-aligned: move whole bytes
+    bits = np.unpackbits(packed, axis=-1, count=n_bits)
+    return np.packbits(bits[..., _bit_permutation(n_bits, 'swap')], axis=-1)
+
+def bitwise_mirror_packed(packed, n_bits=None):
+    """bitwise_mirror over MSB-first packed bits (np.packbits layout).
+
+    Args:
+    - packed: uint8 array of shape (..., n_bytes); leading axes are a batch.
+    - n_bits: Bit length of each vector (default 8 * n_bytes).
+
+    Returns:
+    - Packed uint8 array of the same shape.
+    """
+    packed = np.asarray(packed, dtype=np.uint8)
+    n_bits = packed.shape[-1] * 8 if n_bits is None else n_bits
+    if n_bits == packed.shape[-1] * 8:
+        return _BYTE_REVERSE[packed[..., ::-1]]  # Reverse byte order and the bits in each byte
+    bits = np.unpackbits(packed, axis=-1, count=n_bits)[..., _bit_permutation(n_bits, 'mirror')]
+    if n_bits % 2:
+        bits[..., n_bits // 2] = 0
+    return np.packbits(bits, axis=-1)
+
+def pi_wise_scale(light_wise_value):
+    """Pi-scaled tetrahedral recursion, elementwise over scalars or arrays.
+
+    The recursion's shift terms (value >> int(3328 * scale)) sit 554+ bits below
+    the leading term, under float64 precision, so it reduces to x/pi * 1 * 1/3 * 1/6 * 1/9.
+    """
+    result = np.asarray(light_wise_value, dtype=np.float64) / np.pi
+    for scale in PI_WISE_RECURSION:
+        result = result * scale
+    return result
+
 class Wise:
     def __init__(self):
         self.ribit_gen = TetraRibit()
@@ -97,12 +153,9 @@ class Wise:
 
     def pi_wise(self, light_wise_value, kappa=0.2):
         """Pi-wise: Pi-scaled index with tetrahedral recursion."""
-        recursion = [1, 1/3, 1/6, 1/9]  # Tetrahedral scales
-        result = light_wise_value / mpmath.pi
-        for scale in recursion:
-            result = result * scale + (result >> int(3328 * scale))
+        result = pi_wise_scale(light_wise_value)
         self.kappa_orbit += np.sin(self.phase_shift) * 0.1
-        return float(result), self.kappa_orbit
+        return (float(result) if result.ndim == 0 else result), self.kappa_orbit
 
     def time_wise(self, gaze, time_ms, kappa=0.2):
         """Time-wise: Latency index with quantum resistance."""
@@ -126,14 +179,11 @@ class Wise:
 
     def kappawise(self, curvature, kappa=0.2):
         """Kappawise: Curvature grid index with tetrahedral spiral."""
-        grid = np.zeros((10, 10, 10))
-        for x in range(10):
-            for y in range(10):
-                for z in range(10):
-                    grid[x, y, z] = curvature * (np.sin(x * kappa) + np.cos(y * kappa))
+        axis = np.arange(10) * kappa
+        grid = np.broadcast_to(curvature * (np.sin(axis)[:, None, None] + np.cos(axis)[None, :, None]), (10, 10, 10))
         comfort_vec = np.array([0.1, 5.0, 30.0])
         spiral_vec = kappa_spiral_hash(f"curve_{curvature}", comfort_vec, laps=self.laps)['spiral_vec']
-        return grid + spiral_vec[:10, :10, :10]  # Align with tetrahedral recursion
+        return grid + spiral_vec[:1000, 2].reshape(10, 10, 10)  # Align with tetrahedral recursion (z column)
 
 if __name__ == "__main__":
     wise = Wise()
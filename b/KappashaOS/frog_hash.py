@@ -53,59 +53,71 @@ import time
 import math
 import random
 import string
+import numpy as np
 
 def frog_hash(seed, base=9, laps=25, kappa=0.3536, decay=0.5):
     # Seed to numeric drift (simple sum + tiny wobble)
     s = sum(ord(c) for c in seed) % 65536
+    return _frog_bucket(s, base, kappa, decay)
+
+def _frog_bucket(s, base=9, kappa=0.3536, decay=0.5):
+    """Bucket for seed sum s. Spiral points never mix, so only the last of the 256 is walked."""
     drift = s * 0.001  # small seed influence
     
-    # Generate 256 spiral points
-    points = []
-    for i in range(256):
-        theta = i * kappa + drift % (2 * math.pi)
-        r = theta * base  # radial growth
-        x = r * math.cos(theta)
-        y = r * math.sin(theta)
-        z = 0.0
-        points.append([x, y, z, i])
+    # Last spiral point (i = 255)
+    theta = 255 * kappa + drift % (2 * math.pi)
+    r = theta * base  # radial growth
+    p = [r * math.cos(theta), r * math.sin(theta), 0.0]
     
     # Modulations
     # 1. Tilt (elevation/azimuth/yaw — simple z lift + rotation)
     for i in range(3):
         tilt = i * 0.2 * decay  # scale with decay
-        for p in points:
-            p[2] += tilt  # elevation
-            # Simple azimuth/yaw rotation on x/y
-            rx = p[0] * math.cos(tilt) - p[1] * math.sin(tilt)
-            ry = p[0] * math.sin(tilt) + p[1] * math.cos(tilt)
-            p[0], p[1] = rx, ry
+        p[2] += tilt  # elevation
+        # Simple azimuth/yaw rotation on x/y
+        rx = p[0] * math.cos(tilt) - p[1] * math.sin(tilt)
+        ry = p[0] * math.sin(tilt) + p[1] * math.cos(tilt)
+        p[0], p[1] = rx, ry
     
     # 2. Decay + flatten (unwrap 2πr → linear)
-    for p in points:
-        r = math.sqrt(p[0]**2 + p[1]**2)
-        if r > 0:
-            flat_r = r / (2 * math.pi) * (1 - decay)  # decay pulls toward flat
-            p[0] = flat_r
-            p[1] = 0.0  # collapse to x-axis
+    r = math.sqrt(p[0]**2 + p[1]**2)
+    if r > 0:
+        flat_r = r / (2 * math.pi) * (1 - decay)  # decay pulls toward flat
+        p[0] = flat_r
+        p[1] = 0.0  # collapse to x-axis
     
     # Final bucket: hash of final point coords mod 256
-    last = points[-1]
-    h = int((last[0] * 31 + last[1] * 17 + last[2] * 7) * 1000) % 256
+    h = int((p[0] * 31 + p[1] * 17 + p[2] * 7) * 1000) % 256
     return h  # 0–255, overflow handled outside if needed
 
+def frog_hash_batch(seeds, base=9, laps=25, kappa=0.3536, decay=0.5):
+    """frog_hash over a list of seed strings; buckets are computed once per distinct seed sum.
+
+    Args:
+    - seeds: Sequence of str seeds.
+    - base, laps, kappa, decay: As for frog_hash.
+
+    Returns:
+    - np.ndarray: int64 bucket (0-255) per seed, identical to frog_hash(seed).
+    """
+    lengths = np.fromiter((len(seed) for seed in seeds), dtype=np.int64, count=len(seeds))
+    codes = np.frombuffer(''.join(seeds).encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+    running = np.concatenate(([0], np.cumsum(codes)))  # Exact int64 prefix sums, empty seeds give 0
+    ends = np.cumsum(lengths)
+    sums = (running[ends] - running[ends - lengths]) % 65536
+    uniq, inverse = np.unique(sums, return_inverse=True)
+    table = np.array([_frog_bucket(int(s), base, kappa, decay) for s in uniq], dtype=np.int64)
+    return table[inverse]
+
 # Benchmark
-def benchmark(base=9, laps=25, decay=0.5, n=10000):
+def benchmark(base=9, laps=25, decay=0.5, n=10000, seed=42):
+    rng = random.Random(seed)  # Same seeds in every run/process
+    seeds = [''.join(rng.choices(string.ascii_letters + string.digits, k=16)) for _ in range(n)]
     start = time.time()
-    buckets = set()
-    collisions = 0
-    for _ in range(n):
-        seed = ''.join(random.choices(string.ascii_letters + string.digits, k=16))
-        h = frog_hash(seed, base=base, laps=laps, decay=decay)
-        if h in buckets:
-            collisions += 1
-        buckets.add(h)
+    hashes = frog_hash_batch(seeds, base=base, laps=laps, decay=decay)
     elapsed = time.time() - start
-    unique = len(buckets)
+    unique = len(np.unique(hashes))
+    collisions = n - unique
     collision_rate = collisions / n * 100
     speed = n / elapsed if elapsed > 0 else 0
     print(f"Base {base} | Laps {laps} | Decay {decay:.2f}")
@@ -114,10 +126,11 @@ def benchmark(base=9, laps=25, decay=0.5, n=10000):
     print(f"  Collision rate: {collision_rate:.2f}%")
     print("")
 
-# Run tests
-print("HelixFrog benchmark (10k random 16-char seeds)")
-benchmark(base=9, laps=25, decay=0.3536)   # baseline
-benchmark(base=7, laps=8, decay=0.3536)    # tighter, slower
-benchmark(base=11, laps=32, decay=0.3536)  # looser, faster?
-benchmark(base=9, laps=25, decay=0.0)   # flat spiral
-benchmark(base=9, laps=25, decay=1.0)   # full circle flatten
\ No newline at end of file
+if __name__ == "__main__":
+    # Run tests
+    print("HelixFrog benchmark (10k random 16-char seeds)")
+    benchmark(base=9, laps=25, decay=0.3536)   # baseline
+    benchmark(base=7, laps=8, decay=0.3536)    # tighter, slower
+    benchmark(base=11, laps=32, decay=0.3536)  # looser, faster?
+    benchmark(base=9, laps=25, decay=0.0)   # flat spiral
+    benchmark(base=9, laps=25, decay=1.0)   # full circle flatten
\ No newline at end of file
@@ -59,7 +59,6 @@ import hashlib
 from scipy.spatial import cKDTree
 from src.core.gribit import gribbit_pulse
 from src.hash.domosha import Domosha
-import tensorflow as tf
 from green_curve import custom_interoperations_green_curve
 
 KAPPA = 0.3536
@@ -385,8 +384,7 @@ class Grid4D:
         regrets_str = "\n".join([f"pos {r['pos']} delay {r['delay']} {r['regret']}" for r in regrets_list])
         full_note = poem_text + "\nRegrets chain:\n" + regrets_str
         byte_data = np.frombuffer(full_note.encode('utf-8'), dtype=np.uint8)
-        tensor = tf.convert_to_tensor(byte_data.reshape(1, -1, 1).astype(np.float32))
-        grid_out, note, hash_val = domo.hashlet("thank you", tensor)
+        grid_out, note, hash_val = domo.hashlet("thank you", data=byte_data)  # NumPy path, no TensorFlow
         print(f"Domosha ~{note}, hash: {hash_val[:16]}...")
         return grid_out
 
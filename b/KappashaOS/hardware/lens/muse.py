@@ -48,7 +48,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 def mersenne_gaussian_packet(start_gap=0.3536, end_gap=0.3563, duration=100, spin_freq=20):
     t = np.linspace(0, duration, duration * 10)
@@ -79,6 +78,7 @@ def amusement_factor(packet, amplitude=0.05):
     return packet + jitter * np.sin(2 * np.pi * 369 / 60 * np.arange(len(packet)))  # 369 Hz calming tone
 
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt  # Demo plot only
     t, packet = mersenne_gaussian_packet()
     collapsed = collapse_wavepacket(t, packet)
     woven = weave_kappa_blades(t, collapsed)
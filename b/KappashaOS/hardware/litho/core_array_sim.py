@@ -17,13 +17,14 @@
 
 import argparse
 import numpy as np
-from puff_grid import generate_kappa_grid, simulate_drift  # Reuse from new file.
+from puf_grid import generate_kappa_grid, simulate_drift  # Reuse from new file.
 
-def simulate_core_array(size=20, ripple_factor=0.05):
+def simulate_core_array(size=20, ripple_factor=0.05, rng=None, salt=None):
     """Model a 3D-stacked kappa array with ripple (flex under piezo).
     Args:
         size (int): Base grid size.
         ripple_factor (float): Flex amount (<1 Nm torque simulation).
+        rng, salt: Passed to simulate_drift.
     Returns:
         np.array: Rippled 3D array.
     """
@@ -33,7 +34,7 @@ def simulate_core_array(size=20, ripple_factor=0.05):
     layers = [base_grid + i * golden_ratio * ripple_factor for i in range(3)]  # 3-layer stack.
     stacked = np.stack(layers, axis=0)
     # Apply drift to whole stack (seismology/pressure influence).
-    rippled, _ = simulate_drift(stacked, ripple_factor)
+    rippled, _ = simulate_drift(stacked, ripple_factor, rng=rng, salt=salt)
     return rippled
 
 if __name__ == '__main__':
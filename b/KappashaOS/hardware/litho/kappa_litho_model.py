@@ -17,36 +17,41 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
-from puff_grid import generate_kappa_grid, simulate_drift  # Reuse from earlier file.
+from puf_grid import generate_kappa_grid, simulate_drift  # Reuse from earlier file.
 
-def model_litho_etch(grid, scale_nm=1.0, pressure=0.01):
+def model_litho_etch(grid, scale_nm=1.0, pressure=0.01, rng=None, salt=None):
     """Simulate lithography etching on kappa grid with pressure-induced drift.
     Args:
         grid (np.array): Base kappa grid.
         scale_nm (float): Feature scale in nm (e.g., <1 for sub-10 angstrom).
         pressure (float): Applied pressure/torque (<1 Nm).
+        rng, salt: Passed to simulate_drift.
     Returns:
         np.array: Etched grid; float: Yield estimate (0-1).
     """
     # Scale grid to nm (1 angstrom = 0.1 nm; sub-10 = <1 nm).
     scaled_grid = grid * (scale_nm / 10.0)  # Normalize to angstrom equiv.
     # Apply pressure drift (seismology/thermal influence).
-    etched, _ = simulate_drift(scaled_grid, piezo_noise_level=pressure)
+    etched, _ = simulate_drift(scaled_grid, piezo_noise_level=pressure, rng=rng, salt=salt)
     
     # Estimate yield: Lower if drift exceeds atomic limits (~0.1 nm jitter).
     jitter = np.std(etched)
     yield_est = max(0, 1 - (jitter / 0.1))  # Simple heuristic; 1=perfect, 0=trash.
     return etched, yield_est
 
-def plot_litho_model(etched_grid):
-    """Visualize etched grid for fab preview."""
+def plot_litho_model(etched_grid, filename=None):
+    """Visualize etched grid for fab preview; saves to filename instead of showing if given."""
     plt.figure()
     plt.scatter(etched_grid[..., 0].flatten(), etched_grid[..., 1].flatten(), s=5)
     plt.title('Simulated Kappa Litho Etch')
     plt.xlabel('X (nm)')
     plt.ylabel('Y (nm)')
     plt.grid(True)
-    plt.show()
+    if filename:
+        plt.savefig(filename)
+        plt.close()
+    else:
+        plt.show()
 
 if __name__ == '__main__':
     import argparse
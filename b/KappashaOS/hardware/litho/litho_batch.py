@@ -0,0 +1,124 @@
+# Copyright 2025 xAI
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# For hardware/embodiment interfaces: Licensed under the Apache License, Version 2.0
+# with xAI amendments for safety (prohibits misuse in hashing; revocable for unethical use).
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+# litho_batch.py: Headless batch runner for the litho PUF flow.
+# Sweeps grid sizes/seeds/scales/pressures across worker processes, keeps grids as arrays,
+# writes results.npz (and optional binary STLs / PNG previews).
+# Usage: python litho_batch.py --sizes 10 20 --seeds 1000 --processes 8 --out litho_runs
+
+import argparse
+import itertools
+import multiprocessing as mp
+import os
+import time
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Headless: plots are only written to files on request.
+from core_array_sim import simulate_core_array
+from puf_grid import simulate_drift
+from kappa_litho_model import model_litho_etch, plot_litho_model
+from stereo_puf_export import export_to_binary_stl
+
+def sweep(grid_sizes=(20,), seeds=range(8), scales=(0.8,), pressures=(0.01,), noise=0.1, ripple=0.05, salt=0.0):
+    """Cartesian parameter sweep.
+    Args:
+        grid_sizes, seeds, scales, pressures: Values to combine.
+        noise (float): Drift noise level for every instance.
+        ripple (float): Core array ripple factor for every instance.
+        salt (float): Fixed salt (the GPIO temperature salt is not sampled in batch mode).
+    Returns:
+        list: One parameter dict per PUF instance.
+    """
+    return [{'grid_size': g, 'seed': s, 'scale_nm': sc, 'pressure': p, 'noise': noise, 'ripple': ripple, 'salt': salt}
+            for g, s, sc, p in itertools.product(grid_sizes, seeds, scales, pressures)]
+
+def run_instance(params, base_seed=0):
+    """Core array -> drift -> litho etch for one parameter set, seeded by (base_seed, seed).
+    Returns:
+        str: PUF key; float: Yield estimate; np.array: Etched grid.
+    """
+    rng = np.random.default_rng([base_seed, params['seed']])
+    array = simulate_core_array(size=params['grid_size'], ripple_factor=params['ripple'], rng=rng, salt=params['salt'])
+    drifted, puf_key = simulate_drift(array, piezo_noise_level=params['noise'], rng=rng, salt=params['salt'])
+    etched, yield_est = model_litho_etch(drifted, scale_nm=params['scale_nm'], pressure=params['pressure'], rng=rng, salt=params['salt'])
+    return puf_key, yield_est, etched
+
+def _batch_worker(job):
+    index, params, base_seed, out_dir, stl, plot = job
+    puf_key, yield_est, etched = run_instance(params, base_seed)
+    if stl:
+        export_to_binary_stl(etched, os.path.join(out_dir, f'puf_{index:06d}.stl'))
+    if plot:
+        plot_litho_model(etched, filename=os.path.join(out_dir, f'puf_{index:06d}.png'))
+    return index, puf_key, yield_est, etched
+
+def run_batch(instances, out_dir='litho_runs', processes=None, base_seed=0, keep_grids=True, stl=False, plot=0):
+    """Run many PUF instances in worker processes and save them as one results.npz.
+    Args:
+        instances (list): Parameter dicts (see sweep()).
+        out_dir (str): Output directory.
+        processes (int): Worker processes (default: all cores).
+        base_seed (int): Combined with each instance seed; results do not depend on process count.
+        keep_grids (bool): Store etched grids, stacked per grid size as grids_<size> with index_<size>.
+        stl (bool): Also write a binary STL per instance.
+        plot (int): Render PNG previews for the first `plot` instances.
+    Returns:
+        dict: Summary (path, count, seconds, mean yield).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    start = time.time()
+    n = len(instances)
+    keys = np.empty(n, dtype='S64')
+    yields = np.empty(n)
+    sizes = np.array([p['grid_size'] for p in instances], dtype=np.int64)
+    grids = {int(size): None for size in np.unique(sizes)} if keep_grids else {}
+    slot = np.zeros(n, dtype=np.int64)  # Position of each instance within its size's stack
+    for size in grids:
+        slot[sizes == size] = np.arange((sizes == size).sum())
+    jobs = ((i, p, base_seed, out_dir, stl, i < plot) for i, p in enumerate(instances))
+    with mp.Pool(processes) as pool:
+        chunksize = max(1, n // (4 * (processes or os.cpu_count() or 1)))
+        for index, puf_key, yield_est, etched in pool.imap_unordered(_batch_worker, jobs, chunksize=chunksize):
+            keys[index] = puf_key
+            yields[index] = yield_est
+            if keep_grids:
+                size = int(sizes[index])
+                if grids[size] is None:
+                    grids[size] = np.empty((int((sizes == size).sum()),) + etched.shape)
+                grids[size][slot[index]] = etched
+    columns = {name: np.array([p[name] for p in instances]) for name in ('grid_size', 'seed', 'scale_nm', 'pressure', 'noise', 'ripple', 'salt')}
+    for size in grids:
+        columns[f'grids_{size}'] = grids[size]
+        columns[f'index_{size}'] = np.flatnonzero(sizes == size)
+    path = os.path.join(out_dir, 'results.npz')
+    np.savez(path, puf_key=keys, yield_est=yields, base_seed=base_seed, **columns)
+    summary = {'path': path, 'count': n, 'seconds': time.time() - start, 'mean_yield': float(yields.mean()) if n else 0.0}
+    print(f"Batch: {n} PUF instances in {summary['seconds']:.1f}s, mean yield {summary['mean_yield']:.2f} -> {path}")
+    return summary
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Headless batch sweep of litho PUF instances.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20], help='Grid sizes.')
+    parser.add_argument('--seeds', type=int, default=100, help='Seeds per parameter combination.')
+    parser.add_argument('--scales', type=float, nargs='+', default=[0.8], help='Litho scales in nm.')
+    parser.add_argument('--pressures', type=float, nargs='+', default=[0.01], help='Etch pressures.')
+    parser.add_argument('--noise', type=float, default=0.1, help='Drift noise level.')
+    parser.add_argument('--base-seed', type=int, default=0, help='Batch seed.')
+    parser.add_argument('--processes', type=int, default=None, help='Worker processes.')
+    parser.add_argument('--out', default='litho_runs', help='Output directory.')
+    parser.add_argument('--stl', action='store_true', help='Write a binary STL per instance.')
+    parser.add_argument('--plot', type=int, default=0, help='PNG previews for the first N instances.')
+    parser.add_argument('--no-grids', action='store_true', help='Keep only keys and yields.')
+    args = parser.parse_args()
+    instances = sweep(args.sizes, range(args.seeds), args.scales, args.pressures, noise=args.noise)
+    run_batch(instances, args.out, args.processes, args.base_seed, keep_grids=not args.no_grids, stl=args.stl, plot=args.plot)
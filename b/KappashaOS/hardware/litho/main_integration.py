@@ -13,14 +13,15 @@
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 # main_integration.py: Integrate all new modules for end-to-end PUF/kappa flow.
 # Orchestrates Pi entropy, grid gen, drift, litho model, export, and hardware preview.
-# Usage: python main_integration.py (full demo).
+# Usage: python main_integration.py (full demo) or --batch N (headless sweep of N seeds, see litho_batch.py).
 
-from puff_grid import generate_kappa_grid, simulate_drift
+from puf_grid import generate_kappa_grid, simulate_drift
 from core_array_sim import simulate_core_array
 from stereo_puf_export import export_to_stl
 from kappa_litho_model import model_litho_etch
 from pi_sensor_entropy import extract_pi_entropy  # New: Hardware entropy source.
 from pi_litho_control import hardware_preview  # New: Hardware visualization.
+from litho_batch import run_batch, sweep  # Headless multi-process sweeps.
 
 def run_full_flow(grid_size=20, tremor_duration=5, scale_nm=0.8):
     """End-to-end: Pi Entropy -> Grid -> Array -> Drift/Litho -> Export -> Hardware Preview.
@@ -54,6 +55,15 @@ def run_full_flow(grid_size=20, tremor_duration=5, scale_nm=0.8):
     return puf_key, export_file
 
 if __name__ == '__main__':
-    puf_key, export_file = run_full_flow()
-    print(f"Final PUF Key: {puf_key}")
-    print(f"Exported to: {export_file}")
+    import argparse
+    parser = argparse.ArgumentParser(description='End-to-end PUF/kappa flow.')
+    parser.add_argument('--batch', type=int, default=0, help='Run N seeds headless instead of the hardware flow.')
+    parser.add_argument('--grid_size', type=int, default=20, help='Grid size.')
+    parser.add_argument('--processes', type=int, default=None, help='Worker processes for --batch.')
+    args = parser.parse_args()
+    if args.batch:
+        run_batch(sweep([args.grid_size], range(args.batch)), processes=args.processes)
+    else:
+        puf_key, export_file = run_full_flow(args.grid_size)
+        print(f"Final PUF Key: {puf_key}")
+        print(f"Exported to: {export_file}")
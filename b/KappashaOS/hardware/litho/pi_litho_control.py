@@ -20,7 +20,7 @@ from gpiozero import LED, Servo, Device  # For LED/servo control.
 from gpiozero.pins.mock import MockFactory
 import time
 from kappa_litho_model import model_litho_etch  # Reuse from earlier.
-from puff_grid import generate_kappa_grid
+from puf_grid import generate_kappa_grid
 
 # Mock for non-Pi.
 try:
@@ -17,37 +17,201 @@
 # Usage: python pi_sensor_entropy.py --channels 11 (demo with real/sim data).
 
 import numpy as np
-from gpiozero import InputDevice, Device  # Modern GPIO lib for sensors.
-from gpiozero.pins.mock import MockFactory  # For non-Pi testing.
+try:
+    from gpiozero import InputDevice, Device  # Modern GPIO lib for sensors.
+    from gpiozero.pins.mock import MockFactory  # For non-Pi testing.
+    GPIOZERO_AVAILABLE = True
+except ImportError:
+    GPIOZERO_AVAILABLE = False  # File replay still works.
+import threading
 import time
 import argparse
 from secure_hash2 import gather_entropy_channels  # Assume existing in Hashlet.
 from temperature_salt import generate_temperature_salt  # Assume existing.
 
 # Check if on real Pi; use mock pins otherwise.
-try:
-    from gpiozero.pins.native import NativeFactory
-    Device.pin_factory = NativeFactory()
-except ImportError:
-    Device.pin_factory = MockFactory()  # Sim mode for non-Pi envs.
+if GPIOZERO_AVAILABLE:
+    try:
+        from gpiozero.pins.native import NativeFactory
+        Device.pin_factory = NativeFactory()
+    except ImportError:
+        Device.pin_factory = MockFactory()  # Sim mode for non-Pi envs.
+
+def replay_source(path, loop=True):
+    """Sample source that replays a recorded signal (.npy or whitespace text).
+    Args:
+        path (str): Recording file.
+        loop (bool): Start over at the end; otherwise return None once exhausted.
+    Returns:
+        callable: Returns the next sample on each call.
+    """
+    data = np.load(path) if path.endswith('.npy') else np.loadtxt(path)
+    data = np.asarray(data, dtype=np.float64).ravel()
+    position = [0]
+    def next_sample():
+        if position[0] >= len(data):
+            if not loop or not len(data):
+                return None
+            position[0] = 0
+        value = data[position[0]]
+        position[0] += 1
+        return value
+    return next_sample
+
+class PiezoSampler:
+    """Background sampler writing into a fixed NumPy ring buffer.
+    A daemon thread reads the source at `rate` Hz on absolute deadlines (no
+    drift) and keeps samples above the threshold. Samples are grouped into
+    blocks of `block` values whose mean/variance are accumulated as they
+    arrive (Welford), so per-channel std over the last `channels` blocks is
+    ready at any time without touching the raw buffer. Readers only take a
+    short lock; wait_for() lets one-shot callers block (bounded) until the
+    first samples arrive.
+    """
+    def __init__(self, pin=18, rate=100, capacity=4096, channels=11, block=64,
+                 amplitude_threshold=0.05, source=None):
+        if source is None:
+            if not GPIOZERO_AVAILABLE:
+                raise RuntimeError("gpiozero not installed; pass a source such as replay_source(path).")
+            sensor = InputDevice(pin, pull_up=True)  # Pull-up for digital read; use AnalogInput for analog piezo.
+            source = lambda: sensor.value
+        self.source = source
+        self.rate = rate
+        self.channels = channels
+        self.block = block
+        self.amplitude_threshold = amplitude_threshold
+        self.buffer = np.zeros(capacity, dtype=np.float64)
+        self.count = 0  # Samples written since start
+        self.block_stats = np.zeros((channels, 3))  # Ring of finished blocks: n, mean, M2
+        self.blocks = 0  # Finished blocks since start
+        self._acc = [0, 0.0, 0.0]  # Current block: n, mean, M2
+        self.late = 0  # Deadlines missed by more than one period
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)  # Signalled on every push
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="piezo-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self):
+        try:
+            self._sample()
+        finally:
+            with self._ready:
+                self._ready.notify_all()  # Release waiters once the source is done
+
+    def _sample(self):
+        period = 1.0 / self.rate
+        deadline = time.monotonic()
+        while not self._stop.is_set():
+            value = self.source()
+            if value is None:  # Replay exhausted.
+                break
+            if value > self.amplitude_threshold:  # Filter low noise.
+                self.push(value)
+            deadline += period
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                self._stop.wait(delay)
+            elif delay < -period:
+                self.late += 1
+                deadline = time.monotonic()  # Resync instead of bursting to catch up.
+
+    def push(self, value):
+        """Record one sample (called by the sampler thread; usable directly for tests)."""
+        with self._lock:
+            self.buffer[self.count % len(self.buffer)] = value
+            self.count += 1
+            acc = self._acc
+            acc[0] += 1
+            delta = value - acc[1]
+            acc[1] += delta / acc[0]
+            acc[2] += delta * (value - acc[1])
+            if acc[0] == self.block:
+                self.block_stats[self.blocks % self.channels] = acc
+                self.blocks += 1
+                self._acc = [0, 0.0, 0.0]
+            self._ready.notify_all()
+
+    def wait_for(self, n, timeout):
+        """Block until n samples are buffered, the sampler stops, or timeout seconds pass.
+        Args:
+            n (int): Samples wanted (capped at the buffer capacity).
+            timeout (float): Upper bound on the wait.
+        Returns:
+            int: Samples available (may be fewer than n).
+        """
+        n = min(n, len(self.buffer))
+        deadline = time.monotonic() + timeout
+        with self._ready:
+            while self.count < n and self._thread is not None and self._thread.is_alive():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._ready.wait(remaining)
+            return min(self.count, len(self.buffer))
+
+    def latest(self, n=None):
+        """Copy of the last n samples (all buffered if None), oldest first."""
+        with self._lock:
+            n = min(self.count, len(self.buffer)) if n is None else min(n, self.count, len(self.buffer))
+            end = self.count % len(self.buffer)
+            return np.roll(self.buffer, -end)[len(self.buffer) - n:] if n else np.empty(0)
+
+    def channel_entropy(self):
+        """Std dev per channel over the last `channels` finished blocks, oldest first (NaN until filled)."""
+        with self._lock:
+            stats = np.roll(self.block_stats, -(self.blocks % self.channels), axis=0)
+            filled = min(self.blocks, self.channels)
+        std = np.full(self.channels, np.nan)
+        if filled:
+            std[self.channels - filled:] = np.sqrt(stats[self.channels - filled:, 2] / self.block)
+        return std
+
+_samplers = {}
+
+def shared_sampler(pin=18, **kwargs):
+    """Process-wide running sampler for a pin, started on first use."""
+    sampler = _samplers.get(pin)
+    if sampler is None:
+        sampler = _samplers[pin] = PiezoSampler(pin, **kwargs).start()
+    return sampler
 
-def read_piezo_sensor(pin=18, samples=100, amplitude_threshold=0.05):
+def read_piezo_sensor(pin=18, samples=100, amplitude_threshold=0.05, sampler=None, timeout=None):
     """Read vibrations from a piezo sensor on GPIO pin (seismology mimic).
+    Returns what the background sampler has buffered; on first use, when fewer
+    than `samples` readings exist yet, waits a bounded time for them.
     Args:
         pin (int): GPIO pin for piezo (BCM mode).
         samples (int): Number of readings.
         amplitude_threshold (float): Min detectable jitter (<1 Nm equiv).
+        sampler (PiezoSampler): Sampler to read; defaults to shared_sampler(pin).
+        timeout (float): Max wait in seconds (default: twice the time to sample `samples`).
     Returns:
         np.array: Vibration signal array.
     """
-    sensor = InputDevice(pin, pull_up=True)  # Pull-up for digital read; use AnalogInput for analog piezo.
-    signal = []
-    for _ in range(samples):
-        value = sensor.value  # 0/1 for digital; scale for analog if needed.
-        if value > amplitude_threshold:  # Filter low noise.
-            signal.append(value)
-        time.sleep(0.01)  # 100Hz sampling.
-    return np.array(signal) if signal else np.random.normal(0, 0.01, samples)  # Fallback noise.
+    if sampler is None:
+        sampler = shared_sampler(pin, amplitude_threshold=amplitude_threshold)
+    if sampler.count < samples:
+        sampler.wait_for(samples, 2.0 * samples / sampler.rate if timeout is None else timeout)
+    signal = sampler.latest(samples)
+    return signal if len(signal) else np.random.normal(0, 0.01, samples)  # Fallback noise.
 
 def extract_pi_entropy(num_channels=11, piezo_pin=18):
     """Extract entropy from Pi sensors, including piezo tremors.
@@ -61,8 +225,12 @@ def extract_pi_entropy(num_channels=11, piezo_pin=18):
     base_entropy = gather_entropy_channels()
     
     # Add piezo-specific channel for seismology.
-    tremor = read_piezo_sensor(piezo_pin)
+    sampler = shared_sampler(piezo_pin)
+    tremor = read_piezo_sensor(piezo_pin, sampler=sampler)
     tremor_entropy = {'piezo_std': np.std(tremor), 'piezo_mean': np.mean(tremor)}
+    for i, std in enumerate(sampler.channel_entropy()[-num_channels:]):
+        if not np.isnan(std):
+            tremor_entropy[f'piezo_channel_{i}'] = std
     
     # Merge and generate salt.
     combined = {**base_entropy, **tremor_entropy}
@@ -17,6 +17,8 @@
 # Usage: python puff_grid.py --simulate (for demo) or via Flask endpoint.
 
 import numpy as np
+from functools import lru_cache
+from hashlib import sha256
 import matplotlib.pyplot as plt
 from flask import Flask, jsonify, request
 import random  # For fake piezo noise; replace with real RPi.GPIO later.
@@ -31,8 +33,12 @@ def generate_kappa_grid(size=10, curvature=0.5):
         size (int): Grid dimension.
         curvature (float): Kappa factor (0-1; higher = more bend).
     Returns:
-        np.array: 2D grid with curved coordinates.
+        np.array: 2D grid with curved coordinates (a fresh copy of the cached lattice).
     """
+    return _kappa_grid(size, curvature).copy()
+
+@lru_cache(maxsize=32)
+def _kappa_grid(size, curvature):
     x = np.linspace(-size/2, size/2, size)
     y = np.linspace(-size/2, size/2, size)
     X, Y = np.meshgrid(x, y)
@@ -42,31 +48,36 @@ def generate_kappa_grid(size=10, curvature=0.5):
     warped_r = r * np.exp(curvature * r)  # Kappa-inspired exponential curve.
     warped_x = warped_r * np.cos(theta)
     warped_y = warped_r * np.sin(theta)
-    return np.stack((warped_x, warped_y), axis=-1)
+    grid = np.stack((warped_x, warped_y), axis=-1)
+    grid.flags.writeable = False
+    return grid
 
-def simulate_drift(grid, piezo_noise_level=0.1):
+def simulate_drift(grid, piezo_noise_level=0.1, rng=None, salt=None):
     """Apply drift to kappa grid based on piezo/seismology noise.
     Args:
         grid (np.array): Kappa grid.
         piezo_noise_level (float): Simulated torque/pressure jitter (e.g., <1 Nm).
+        rng (np.random.Generator): Noise source; global np.random if None.
+        salt (float or np.array): Precomputed salt; read from the GPIO channels if None.
     Returns:
-        np.array: Drifted grid; np.str_: Hashed PUF key.
+        np.array: Drifted grid; str: Hashed PUF key.
     """
-    # Gather real entropy (11 channels from GPIO).
-    entropy_data = gather_entropy_channels()  # Returns dict of 11 values.
-    salt = generate_temperature_salt(entropy_data['temperature'])  # Salt with heat.
+    if salt is None:
+        # Gather real entropy (11 channels from GPIO).
+        entropy_data = gather_entropy_channels()  # Returns dict of 11 values.
+        salt = generate_temperature_salt(entropy_data['temperature'])  # Salt with heat.
+        salt = salt[:grid.shape[0]]
     
     # Add salt-influenced noise (seismology tie-in: mimic tremor).
-    noise = np.random.normal(0, piezo_noise_level, grid.shape) + salt[:grid.shape[0]]
+    noise = (rng if rng is not None else np.random).normal(0, piezo_noise_level, grid.shape) + salt
     drifted_grid = grid + noise
     
-    # Hash the drifted grid for PUF key (uncloneable signature).
-    flat_grid = drifted_grid.flatten().tobytes()
-    puf_key = hash(flat_grid)  # Simple hash; use cryptography.sha256 for prod.
-    return drifted_grid, str(puf_key)
+    # Hash the drifted grid for PUF key (uncloneable signature, stable across processes).
+    puf_key = sha256(np.ascontiguousarray(drifted_grid).tobytes()).hexdigest()
+    return drifted_grid, puf_key
 
-def plot_kappa_drift(original_grid, drifted_grid):
-    """Visualize grids for stereolithography preview."""
+def plot_kappa_drift(original_grid, drifted_grid, filename=None):
+    """Visualize grids for stereolithography preview; saves to filename instead of showing if given."""
     plt.figure(figsize=(8, 4))
     plt.subplot(1, 2, 1)
     plt.scatter(original_grid[..., 0].flatten(), original_grid[..., 1].flatten())
@@ -74,7 +85,11 @@ def plot_kappa_drift(original_grid, drifted_grid):
     plt.subplot(1, 2, 2)
     plt.scatter(drifted_grid[..., 0].flatten(), drifted_grid[..., 1].flatten())
     plt.title('Drifted Grid (PUF)')
-    plt.show()
+    if filename:
+        plt.savefig(filename)
+        plt.close()
+    else:
+        plt.show()
 
 @app.route('/puff', methods=['GET'])
 def get_puf_key():
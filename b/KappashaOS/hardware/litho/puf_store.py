@@ -0,0 +1,167 @@
+# Copyright 2025 xAI
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# For hardware/embodiment interfaces: Licensed under the Apache License, Version 2.0
+# with xAI amendments for safety (prohibits misuse in hashing; revocable for unethical use).
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+# puf_store.py: Enrollment store for kappa-grid PUFs.
+# Keeps reference grids with per-cell drift statistics and a KD-tree over projected grids,
+# so noisy readouts are matched against thousands of enrolled PUFs in one batched query.
+# Usage: python puf_store.py (demo: enroll 5000 PUFs, verify noisy readouts and impostors).
+
+import numpy as np
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False  # Brute-force candidate search instead.
+
+class PufEnrollmentStore:
+    """Enrolled PUF grids with per-cell statistics and a nearest-match index.
+    Each enrollment keeps its per-cell mean and std (std from repeated
+    readouts, floored at noise_floor). Grids are centred on the population
+    mean and projected to `features` dims with a fixed random matrix; a
+    KD-tree over those features yields candidates that are re-ranked by the
+    exact score: RMS of per-cell z-scores against the candidate's statistics.
+    """
+    def __init__(self, noise_floor=0.02, tolerance=2.0, features=32, seed=0):
+        self.noise_floor = noise_floor
+        self.tolerance = tolerance
+        self.features = features
+        self.seed = seed
+        self.ids = []
+        self.grid_shape = None
+        self.mean = None  # (n, cells) float32
+        self.inv_std = None  # (n, cells) float32
+        self._center = None
+        self._projection = None
+        self._tree = None
+        self._feat = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def enroll(self, ids, grids):
+        """Enroll PUFs from one readout each (per-cell std is then noise_floor).
+        Args:
+            ids (list): One id per PUF.
+            grids (np.array): (n, *grid_shape) reference grids.
+        """
+        grids = np.asarray(grids, dtype=np.float64)
+        return self.enroll_readouts(ids, grids[:, None])
+
+    def enroll_readouts(self, ids, readouts):
+        """Enroll PUFs from repeated readouts of shape (n, r, *grid_shape)."""
+        readouts = np.asarray(readouts, dtype=np.float64)
+        n, r = readouts.shape[:2]
+        if len(ids) != n:
+            raise ValueError("One id per enrolled PUF required")
+        flat = readouts.reshape(n, r, -1)
+        mean = flat.mean(axis=1)
+        std = flat.std(axis=1, ddof=1) if r > 1 else np.zeros_like(mean)
+        inv_std = 1.0 / np.maximum(std, self.noise_floor)
+        if self.grid_shape is not None and self.grid_shape != readouts.shape[2:]:
+            raise ValueError("Grid shape differs from enrolled PUFs")
+        self.grid_shape = readouts.shape[2:]
+        self.ids.extend(ids)
+        self.mean = mean.astype(np.float32) if self.mean is None else np.concatenate([self.mean, mean.astype(np.float32)])
+        self.inv_std = inv_std.astype(np.float32) if self.inv_std is None else np.concatenate([self.inv_std, inv_std.astype(np.float32)])
+        self._index()
+
+    def _index(self):
+        cells = self.mean.shape[1]
+        self._center = self.mean.mean(axis=0)
+        if self._projection is None or self._projection.shape[0] != cells:
+            rng = np.random.default_rng(self.seed)
+            self._projection = (rng.standard_normal((cells, self.features)) / np.sqrt(self.features)).astype(np.float32)
+        self._feat = (self.mean - self._center) @ self._projection
+        self._tree = cKDTree(self._feat) if SCIPY_AVAILABLE else None
+
+    def _candidates(self, feat, k):
+        if self._tree is not None:
+            _, idx = self._tree.query(feat, k=k)
+            return idx.reshape(len(feat), k)
+        d2 = (feat * feat).sum(1)[:, None] - 2 * feat @ self._feat.T + (self._feat * self._feat).sum(1)[None, :]
+        return np.argpartition(d2, k - 1, axis=1)[:, :k] if k < len(self._feat) else np.broadcast_to(np.arange(len(self._feat)), (len(feat), len(self._feat)))
+
+    def scores(self, readouts, index):
+        """RMS per-cell z-score of readouts (q, *grid_shape) against enrollments index (q, k)."""
+        flat = np.asarray(readouts, dtype=np.float32).reshape(len(index), 1, -1)
+        z = (flat - self.mean[index]) * self.inv_std[index]
+        return np.sqrt(np.einsum('qkc,qkc->qk', z, z) / z.shape[-1])
+
+    def verify(self, readouts, tolerance=None, candidates=8, chunk=256):
+        """Match noisy readouts against the enrolled PUFs.
+        Args:
+            readouts (np.array): (q, *grid_shape) or a single grid.
+            tolerance (float): Max RMS z-score to accept (default: self.tolerance).
+            candidates (int): KD-tree neighbours re-ranked exactly per readout.
+            chunk (int): Readouts scored per batch (bounds memory).
+        Returns:
+            list: Matched id or None per readout; np.array: Best score per readout.
+        """
+        if not self.ids:
+            raise ValueError("No PUFs enrolled")
+        readouts = np.asarray(readouts, dtype=np.float32)
+        single = readouts.shape == self.grid_shape
+        flat = readouts.reshape(-1, self.mean.shape[1])
+        tolerance = self.tolerance if tolerance is None else tolerance
+        k = min(candidates, len(self.ids))
+        best_idx = np.empty(len(flat), dtype=np.int64)
+        best = np.empty(len(flat))
+        for start in range(0, len(flat), chunk):
+            part = flat[start:start + chunk]
+            cand = self._candidates((part - self._center) @ self._projection, k)
+            s = self.scores(part, cand)
+            pick = s.argmin(axis=1)
+            rows = np.arange(len(part))
+            best_idx[start:start + chunk] = cand[rows, pick]
+            best[start:start + chunk] = s[rows, pick]
+        matches = [self.ids[i] if score <= tolerance else None for i, score in zip(best_idx, best)]
+        return (matches[0], float(best[0])) if single else (matches, best)
+
+    def save(self, path):
+        """Write the store to an .npz file."""
+        np.savez(path, ids=np.array(self.ids, dtype=str), mean=self.mean, inv_std=self.inv_std, grid_shape=self.grid_shape,
+                 config=np.array([self.noise_floor, self.tolerance, self.features, self.seed]))
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        noise_floor, tolerance, features, seed = data['config']
+        store = cls(noise_floor, tolerance, int(features), int(seed))
+        store.ids = [str(i) for i in data['ids']]
+        store.mean, store.inv_std = data['mean'], data['inv_std']
+        store.grid_shape = tuple(int(d) for d in data['grid_shape'])
+        store._index()
+        return store
+
+if __name__ == '__main__':
+    import time
+    rng = np.random.default_rng(7)
+    n, shape, sigma, readout_noise = 5000, (20, 20, 2), 0.1, 0.02
+    x = np.linspace(-shape[0] / 2, shape[0] / 2, shape[0])
+    base = np.stack(np.meshgrid(x, x), axis=-1)  # Shared kappa lattice; PUFs differ by drift.
+    enrolled = base + rng.normal(0, sigma, (n,) + shape)
+    store = PufEnrollmentStore(noise_floor=readout_noise)
+    start = time.perf_counter()
+    store.enroll([f"puf_{i}" for i in range(n)], enrolled)
+    print(f"Enrolled {n} PUFs in {time.perf_counter() - start:.2f}s (scipy={SCIPY_AVAILABLE})")
+    q = 2000
+    which = rng.integers(0, n, q)
+    genuine = enrolled[which] + rng.normal(0, readout_noise, (q,) + shape)
+    impostors = base + rng.normal(0, sigma, (q,) + shape)
+    start = time.perf_counter()
+    matches, scores = store.verify(genuine)
+    elapsed = time.perf_counter() - start
+    correct = sum(m == f"puf_{i}" for m, i in zip(matches, which))
+    print(f"Genuine: {correct}/{q} matched, {elapsed / q * 1e3:.3f} ms/query, median score {np.median(scores):.2f}")
+    matches, scores = store.verify(impostors)
+    print(f"Impostors accepted: {sum(m is not None for m in matches)}/{q}, min score {scores.min():.2f}")
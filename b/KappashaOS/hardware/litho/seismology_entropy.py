@@ -36,19 +36,44 @@ def simulate_tremor_data(duration=10, frequency=100, amplitude=0.05):
     noise = np.random.normal(0, amplitude / 5, len(t))
     return signal + noise
 
+def segment_std(signal, num_segments):
+    """Std dev of each np.array_split segment, from one pass of segment sums.
+    Args:
+        signal (np.array): 1-D signal.
+        num_segments (int): Segment count (sizes as in np.array_split).
+    Returns:
+        np.array: Std dev per segment (NaN for empty segments).
+    """
+    signal = np.asarray(signal, dtype=np.float64)
+    base, extra = divmod(len(signal), num_segments)
+    sizes = np.full(num_segments, base)
+    sizes[:extra] += 1
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    stds = np.full(num_segments, np.nan)
+    nonempty = sizes > 0
+    if nonempty.any():
+        means = np.add.reduceat(signal, starts[nonempty]) / sizes[nonempty]
+        centred = signal - np.repeat(means, sizes[nonempty])  # Two-pass for stability
+        stds[nonempty] = np.sqrt(np.add.reduceat(centred * centred, starts[nonempty]) / sizes[nonempty])
+    return stds
+
 def extract_entropy_from_tremor(tremor_data, num_channels=11):
     """Extract entropy from tremor data, blending with GPIO channels.
     Args:
-        tremor_data (np.array): Simulated/real tremor signal.
+        tremor_data (np.array or PiezoSampler): Simulated/real tremor signal, or a
+            running sampler whose streaming per-channel stats are used as-is.
         num_channels (int): Number of entropy channels (matches secure_hash2).
     Returns:
         dict: Entropy data with tremor-integrated values; str: Hashed salt.
     """
     # Gather base channels.
     base_entropy = gather_entropy_channels()
-    # Split tremor into segments for multi-channel entropy.
-    segments = np.array_split(tremor_data, num_channels)
-    tremor_entropy = {f'channel_{i}': np.std(seg) for i, seg in enumerate(segments)}  # Use std dev as entropy metric.
+    if hasattr(tremor_data, 'channel_entropy'):
+        stds = tremor_data.channel_entropy()[-num_channels:]
+    else:
+        stds = segment_std(tremor_data, num_channels)
+    # Use std dev as entropy metric; unfilled/empty channels (NaN) are left out.
+    tremor_entropy = {f'channel_{i}': std for i, std in enumerate(stds) if not np.isnan(std)}
     
     # Merge and salt.
     combined = {**base_entropy, **tremor_entropy}
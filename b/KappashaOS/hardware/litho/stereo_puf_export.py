@@ -16,6 +16,7 @@
 # Usage: python stereo_puf_export.py --output kappa.stl.txt
 
 import sys
+import numpy as np
 from puf_grid import generate_kappa_grid, simulate_drift
 
 def export_to_stl(grid, filename='kappa_puf.stl.txt'):
@@ -33,6 +34,36 @@ def export_to_stl(grid, filename='kappa_puf.stl.txt'):
         f.write("endsolid kappa_puf\n")
     print(f"Exported to {filename}")
 
+STL_FACET = np.dtype([('normal', '<f4', 3), ('vertices', '<f4', (3, 3)), ('attr', '<u2')])
+
+def stl_facets(grid):
+    """Facets of the STL proxy as a structured array (one per consecutive point pair).
+    Args:
+        grid (np.array): Grid of (x, y, ...) points; all leading axes are flattened.
+    Returns:
+        np.array: STL_FACET records.
+    """
+    points = np.asarray(grid, dtype=np.float64).reshape(-1, np.shape(grid)[-1])[:, :2]
+    p1, p2 = points[:-1], points[1:]
+    facets = np.zeros(len(p1), dtype=STL_FACET)
+    facets['normal'][:, 2] = 1.0
+    facets['vertices'][:, 0, :2] = p1
+    facets['vertices'][:, 1, :2] = p2
+    facets['vertices'][:, 2, :2] = p1 + 0.1
+    return facets
+
+def export_to_binary_stl(grid, filename='kappa_puf.stl'):
+    """Export grid as binary STL (same facets as export_to_stl, 50 bytes each).
+    Args:
+        grid (np.array): Drifted kappa grid.
+        filename (str): Output file.
+    """
+    facets = stl_facets(grid)
+    with open(filename, 'wb') as f:
+        f.write(b'kappa_puf'.ljust(80, b'\0'))
+        f.write(np.uint32(len(facets)).tobytes())
+        f.write(facets.tobytes())
+
 if __name__ == '__main__':
     if len(sys.argv) > 1:
         filename = sys.argv[1]
@@ -51,8 +51,10 @@ import json
 import os
 import sys
 from datetime import datetime
+from hashlib import sha256
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'KappashaOS')))
 from src.hash.kappasha256 import hash_surface
+from src.core.license_gate import license_gate
 
 def read_config(config_file="config/config.json"):
     """Read intent and commercial use from config file with error handling."""
@@ -119,35 +121,84 @@ def check_license(commercial_use=False, intent=None):
     log_license_check("Passed", intent, commercial_use)
     return True
 
-def tetra_hash_surface(mesh_or_points, precision=6, device_hash="arch_utils_001"):
-    intent, commercial_use = read_config()
-    check_license(commercial_use, intent)
-    if isinstance(mesh_or_points, np.ndarray):
+def mesh_points(mesh_or_points):
+    """(N, 3) float64 view of a mesh dict's 'points' or a point array."""
+    if isinstance(mesh_or_points, dict) and "points" in mesh_or_points:
+        points = mesh_or_points["points"]
+    elif isinstance(mesh_or_points, np.ndarray):
         points = mesh_or_points
-    elif isinstance(mesh_or_points, dict) and "points" in mesh_or_points:
-        points = np.array(mesh_or_points["points"])
     else:
         raise ValueError("tetra_hash_surface needs array or dict with 'points'")
-    hash_val = hash_surface(points, precision=precision)
+    return np.asarray(points, dtype=np.float64).reshape(-1, 3)
+
+def surface_digest(points, precision=6):
+    """SHA-256 of points rounded to `precision` decimals, as little-endian int64."""
+    quantized = np.round(np.ascontiguousarray(points, dtype=np.float64) * 10.0 ** precision).astype(np.int64)
+    return sha256(quantized.astype('<i8', copy=False).tobytes()).digest()
+
+def tetra_hash_surface(mesh_or_points, precision=6, device_hash="arch_utils_001"):
+    """Hash a surface: the point digest is pre-hashed in C, then kappasha256-keyed via hash_surface."""
+    license_gate()
+    digest = surface_digest(mesh_points(mesh_or_points), precision)
+    hash_val = hash_surface(np.frombuffer(digest, dtype=np.uint8), precision=precision)
     return hash_val
 
+def discrete_curvature(mesh_or_points):
+    """
+    Per-point discrete curvature.
+    With mesh["faces"] (M, 3 vertex indices) this is the cotangent-Laplacian
+    mean curvature |Lp| / 2 over barycentric vertex areas; for bare points it
+    is the Menger curvature of consecutive point triples (ends get 0).
+    """
+    points = mesh_points(mesh_or_points)
+    faces = mesh_or_points.get("faces") if isinstance(mesh_or_points, dict) else None
+    n = len(points)
+    if faces is None:
+        kappa = np.zeros(n)
+        if n < 3:
+            return kappa
+        a = points[1:-1] - points[:-2]
+        b = points[2:] - points[1:-1]
+        c = points[2:] - points[:-2]
+        lengths = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1) * np.linalg.norm(c, axis=1)
+        cross = np.linalg.norm(np.cross(a, b), axis=1)
+        kappa[1:-1] = np.divide(2.0 * cross, lengths, out=np.zeros(n - 2), where=lengths > 0)
+        return kappa
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    corners = points[faces]  # (M, 3 corners, 3 coords)
+    laplacian = np.zeros((n, 3))
+    for k in range(3):
+        i, j = faces[:, (k + 1) % 3], faces[:, (k + 2) % 3]  # Edge opposite corner k
+        u = corners[:, (k + 1) % 3] - corners[:, k]
+        v = corners[:, (k + 2) % 3] - corners[:, k]
+        sin = np.linalg.norm(np.cross(u, v), axis=1)
+        cot = np.divide(np.einsum('ij,ij->i', u, v), sin, out=np.zeros(len(faces)), where=sin > 0)
+        edge = (corners[:, (k + 2) % 3] - corners[:, (k + 1) % 3]) * cot[:, None]
+        for axis in range(3):
+            laplacian[:, axis] += np.bincount(i, edge[:, axis], minlength=n) - np.bincount(j, edge[:, axis], minlength=n)
+    area = np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1) / 6.0
+    vertex_area = np.bincount(faces.ravel(), np.repeat(area, 3), minlength=n)
+    return np.divide(np.linalg.norm(laplacian, axis=1), 4.0 * vertex_area, out=np.zeros(n), where=vertex_area > 0)
+
 def calc_live_kappa(mesh, target=0.5, device_hash="arch_utils_001"):
     """Calculate curvature delta from target (positive: too bendy, negative: too flat)."""
-    intent, commercial_use = read_config()
-    check_license(commercial_use, intent)
-    points = np.array([mesh["points"][i] for i in range(len(mesh["points"]))])
-    kappa = 0.0  # Mock curvature
+    license_gate()
+    kappa = float(np.mean(discrete_curvature(mesh))) if len(mesh_points(mesh)) else 0.0
     return kappa - target
 
+def _hash_phase(hash_val):
+    """Etch phase from a hash: numeric values as-is, hex digests from their first 32 bits."""
+    try:
+        return float(hash_val)
+    except ValueError:
+        return int(str(hash_val)[:8], 16) / 0xFFFFFFFF * 2 * np.pi
+
 def apply_tetra_etch(mesh, depth=0.01, hash_val=None, device_hash="arch_utils_001"):
-    """Embed hash into surface as geometric offset."""
-    intent, commercial_use = read_config()
-    check_license(commercial_use, intent)
+    """Embed hash into surface as geometric offset; mesh["points"] becomes an (N, 3) array."""
+    license_gate()
     if hash_val is None:
         hash_val = tetra_hash_surface(mesh)
-    for i in range(len(mesh["points"])):
-        pt = np.array(mesh["points"][i])
-        bump = np.sin(i * 0.8 + float(hash_val)) * depth * 0.5
-        pt[2] += bump
-        mesh["points"][i] = pt.tolist()
+    points = mesh_points(mesh)  # In place when mesh["points"] is already an (N, 3) float array
+    points[:, 2] += np.sin(np.arange(len(points)) * 0.8 + _hash_phase(hash_val)) * depth * 0.5
+    mesh["points"] = points
     return hash_val
@@ -45,12 +45,13 @@
 #
 # SPDX-License-Identifier: (AGPL-3.0-or-later) AND Apache-2.0
 
-import numpy as np
-from hashlib import sha256
 import json
 import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from proto.revocation_stub import check_revocation
+from src.core.merkle_core import leaf_hash, merkle_root
 
 def read_config(config_file="config/config.json"):
     """Read intent and commercial use from config file with error handling."""
@@ -117,8 +118,117 @@ def check_license(commercial_use=False, intent=None):
     log_license_check("Passed", intent, commercial_use)
     return True
 
-def kappa_hash_snapshot(file_path="KappashaOS", device_hash="kappa_hash_001"):
-    """Generate a kappasha256 hash for the snapshot file with intent and revocation checks."""
+LEAF_SIZE = 1 << 20  # Bytes per snapshot leaf
+
+_read_lock = threading.Lock()
+
+def _read_at(fd, size, offset):
+    """Positional read; serialised seek+read where os.pread is missing (Windows)."""
+    if hasattr(os, 'pread'):
+        return os.pread(fd, size, offset)
+    with _read_lock:
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, size)
+
+class SnapshotTree:
+    """
+    Leaf digests of one snapshot file, hashed in fixed-size leaves.
+    Leaves are read with positional reads and hashed on a thread pool with a
+    bounded number in flight, so memory stays flat for multi-GB snapshots.
+    Keeping the tree lets update() rehash only leaves whose bytes may have
+    changed.
+    """
+    def __init__(self, leaf_size=LEAF_SIZE, workers=None):
+        self.leaf_size = leaf_size
+        self.workers = workers or os.cpu_count() or 1
+        self.leaves = []
+        self.size = 0
+        self.mtime_ns = None
+        self.leaves_hashed = 0  # Leaves hashed by the last update()
+
+    def _hash_leaves(self, fd, indices):
+        """Digests for the given leaf indices; at most 4 leaves per worker are in flight."""
+        def work(i):
+            return leaf_hash(_read_at(fd, self.leaf_size, i * self.leaf_size))
+        digests = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            for i in indices:
+                if len(pending) >= 4 * self.workers:
+                    j, fut = pending.popleft()
+                    digests[j] = fut.result()
+                pending.append((i, pool.submit(work, i)))
+            for j, fut in pending:
+                digests[j] = fut.result()
+        return digests
+
+    def update(self, file_path, dirty=None):
+        """
+        Bring the leaves in line with file_path.
+        Args:
+        - file_path: Snapshot file.
+        - dirty: Optional (start, end) byte ranges known to have changed; if
+          omitted, an unchanged size and mtime skip hashing altogether and any
+          other change rehashes every leaf.
+        Returns:
+        - Root digest (bytes).
+        """
+        stat = os.stat(file_path)
+        size = stat.st_size
+        n_leaves = -(-size // self.leaf_size)
+        old_leaves = len(self.leaves)
+        if self.mtime_ns is None:
+            todo = range(n_leaves)
+        elif dirty is None:
+            unchanged = self.mtime_ns == stat.st_mtime_ns and self.size == size
+            todo = [] if unchanged else range(n_leaves)
+        else:
+            todo = set()
+            for start, end in dirty:
+                todo.update(range(max(start, 0) // self.leaf_size, min(-(-end // self.leaf_size), n_leaves)))
+            if size != self.size:  # Resized: the old/new boundary leaf and everything past it
+                todo.update(range(min(self.size, size) // self.leaf_size, n_leaves))
+            todo = sorted(todo)
+        self.leaves = self.leaves[:n_leaves] + [None] * max(0, n_leaves - old_leaves)
+        if todo:
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                for i, digest in self._hash_leaves(fd, todo).items():
+                    self.leaves[i] = digest
+            finally:
+                os.close(fd)
+        self.leaves_hashed = len(todo)
+        self.size, self.mtime_ns = size, stat.st_mtime_ns
+        return self.root()
+
+    def root(self):
+        """Merkle root over the leaf digests (merkle_core scheme)."""
+        return merkle_root(self.leaves)
+
+    def save(self, manifest_path):
+        """Persist the leaf digests so a later run can skip unchanged leaves."""
+        with open(manifest_path, "w") as f:
+            json.dump({"leaf_size": self.leaf_size, "size": self.size, "mtime_ns": self.mtime_ns,
+                       "leaves": [d.hex() for d in self.leaves]}, f)
+
+    @classmethod
+    def load(cls, manifest_path, workers=None):
+        with open(manifest_path, "r") as f:
+            data = json.load(f)
+        tree = cls(data["leaf_size"], workers)
+        tree.size, tree.mtime_ns = data["size"], data["mtime_ns"]
+        tree.leaves = [bytes.fromhex(d) for d in data["leaves"]]
+        return tree
+
+def kappa_hash_snapshot(file_path="KappashaOS", device_hash="kappa_hash_001", tree=None, dirty=None):
+    """
+    Generate a kappa hash for the snapshot file with intent and revocation checks.
+    The hash is the Merkle root over LEAF_SIZE leaves of the whole file, so
+    every byte counts while memory stays constant. Pass a SnapshotTree from
+    an earlier call (and optionally dirty byte ranges) to rehash only what
+    changed.
+    """
+    from proto.revocation_stub import check_revocation  # Deferred: only the licensed entry point needs it
     intent, commercial_use = read_config()
     check_license(commercial_use, intent)
     if check_revocation(device_hash):
@@ -129,24 +239,8 @@ def kappa_hash_snapshot(file_path="KappashaOS", device_hash="kappa_hash_001"):
         print(f"Snapshot {file_path} not found. Regen with repo_audit.py.")
         return None
     
-    with open(file_path, "rb") as f:
-        content = f.read()
-    
-    # Dynamic grid sizing based on content length
-    content_len = len(content)
-    grid_size = 10
-    target_size = grid_size ** 3
-    if content_len < target_size:
-        # Pad with zeros if content is too short
-        content = content + b'\x00' * (target_size - content_len)
-    elif content_len > target_size:
-        # Truncate to fit grid
-        content = content[:target_size]
-    
-    grid = np.frombuffer(content, dtype=np.uint8).reshape((grid_size, grid_size, grid_size))
-    flat_grid = grid.flatten()
-    seed = flat_grid.tobytes()
-    hash_val = sha256(seed).hexdigest()
+    tree = tree if tree is not None else SnapshotTree()
+    hash_val = tree.update(file_path, dirty).hex()
     log_license_check(f"Generated kappa hash: {hash_val}", intent, commercial_use)
     print(f"Kappa hash for {file_path}: {hash_val}")
     return hash_val
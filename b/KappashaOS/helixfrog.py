@@ -52,6 +52,9 @@
 import timeit
 import math
 import random
+import hashlib
+from functools import lru_cache
+import numpy as np
 
 GRID_SIZE = 16
 VOXEL_COUNT = GRID_SIZE ** 3  # 4096
@@ -59,20 +62,44 @@ GOLDEN_ANGLE = 2.39996322972865332  # radians ≈137.5°
 KAPPA_BASE = 0.3536
 FROG_HOPS = [22, 25, 28, -13, 7]
 
+def stable_hash(data: bytes, seed: int = 0) -> int:
+    """Seeded 64-bit hash that is identical in every process (unlike the salted builtin hash)."""
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8, key=seed.to_bytes(8, 'little') if seed else b'').digest(), 'little')
+
+def stable_hash_rows(points, seed: int = 0):
+    """Vectorized seeded hash of each row of a float array (splitmix64 over the float bits).
+
+    Args:
+    - points: (N, k) array-like; rows are hashed by their float64 bit patterns.
+    - seed: Shard/worker-independent seed.
+
+    Returns:
+    - np.ndarray: (N,) uint64 hashes.
+    """
+    bits = np.ascontiguousarray(points, dtype=np.float64).reshape(len(points), -1).view(np.uint64)
+    h = np.full(len(bits), seed, dtype=np.uint64)
+    for col in bits.T:
+        h = _splitmix64(h ^ col)
+    return h
+
+def _splitmix64(x):
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def helix_coords(points):
+    """Tetrahedral breathing + spiral offset for an (N, 3) array of points."""
+    p = np.asarray(points, dtype=np.float64)
+    x, y, z = p[:, 0], p[:, 1], p[:, 2]
+    r = np.sqrt(x**2 + y**2 + z**2) / (GRID_SIZE * math.sqrt(3))
+    theta = np.arctan2(y, x) + GOLDEN_ANGLE * r
+    return np.stack((x + r * np.cos(theta), y + r * np.sin(theta), z + r * np.sin(theta * 0.5)), axis=1)
+
 def build_grid(seed=42):
     """Precompute 16³ voxel grid with tetrahedral + spiral seed"""
     random.seed(seed)
-    grid = []
-    for x in range(GRID_SIZE):
-        for y in range(GRID_SIZE):
-            for z in range(GRID_SIZE):
-                # Simple tetrahedral breathing + spiral offset
-                r = math.sqrt(x**2 + y**2 + z**2) / (GRID_SIZE * math.sqrt(3))
-                theta = math.atan2(y, x) + GOLDEN_ANGLE * r
-                grid.append((x + r * math.cos(theta),
-                             y + r * math.sin(theta),
-                             z + r * math.sin(theta * 0.5)))
-    return grid
+    return helix_coords(np.indices((GRID_SIZE,) * 3).reshape(3, -1).T)
 
 GRID = build_grid()  # Build once at startup
 
@@ -84,12 +111,16 @@ def field_shear(pos: tuple, angle_deg: float):
 
 def helix_frog_field(data: bytes, salt: int = 0, breath_rate: float = 12.0):
     """Map input to voxel bucket with helix + shear + frog hops"""
-    # Fast base hash (Python's siphash, ~3 ns)
-    val = hash(data) & 0xFFFFFFFF
+    # Stable seeded base hash (blake2b), same bucket in every worker process
+    val = stable_hash(data) & 0xFFFFFFFF
 
     # Flat mods
     offset = (val + salt) % 255
 
+    return int(_frog_table(float(breath_rate))[offset]), 'green'  # placeholder breath color
+
+def _frog_voxel(offset: int, breath_rate: float) -> int:
+    """Helix + shear + frog hops for one flat offset (0-254)."""
     # Rotations
     azimuth = (offset % 360)
     pitch = (offset * 1.618) % 255
@@ -113,8 +144,31 @@ def helix_frog_field(data: bytes, salt: int = 0, breath_rate: float = 12.0):
     # Frog hops for chaos
     for hop in FROG_HOPS:
         voxel_idx = (voxel_idx + hop) % VOXEL_COUNT
-
-    return voxel_idx, 'green'  # placeholder breath color
+    return voxel_idx
+
+@lru_cache(maxsize=64)
+def _frog_table(breath_rate: float):
+    """Frog voxel for every offset; the hash only ever reaches the field through (val + salt) % 255."""
+    return np.array([_frog_voxel(offset, breath_rate) for offset in range(255)], dtype=np.int64)
+
+def bucketize(points, salt: int = 0, breath_rate: float = 12.0, seed: int = 0):
+    """Batched helix_frog_field for an (N, 3) array of points.
+
+    Args:
+    - points: (N, 3) array of positions.
+    - salt: Same role as in helix_frog_field.
+    - breath_rate: Breath modulation of the shear angle.
+    - seed: Seed for the stable row hash; equal seeds place points identically across processes.
+
+    Returns:
+    - (cells, buckets): flat 16³ cell index of each helix-warped point, and its frog voxel bucket.
+    """
+    coords = helix_coords(points)
+    ijk = np.clip(np.floor(coords).astype(np.int64), 0, GRID_SIZE - 1)
+    cells = np.ravel_multi_index(ijk.T, (GRID_SIZE,) * 3)
+    vals = stable_hash_rows(points, seed) & np.uint64(0xFFFFFFFF)
+    offsets = ((vals.astype(np.int64) + salt) % 255)
+    return cells, _frog_table(float(breath_rate))[offsets]
 
 # Test & speed
 if __name__ == '__main__':
@@ -128,3 +182,7 @@ if __name__ == '__main__':
         number=100_000
     ) / 100_000 * 1e9
     print(f"Avg map time (100k runs): {time_ns:.1f} ns")
+
+    points = np.random.default_rng(0).uniform(0, GRID_SIZE, (1_000_000, 3))
+    batch_s = timeit.timeit(lambda: bucketize(points, salt=42), number=3) / 3
+    print(f"Batched bucketize (1M points): {batch_s / len(points) * 1e9:.1f} ns/point")
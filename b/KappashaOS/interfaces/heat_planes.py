@@ -49,12 +49,81 @@
 
 import numpy as np
 import asyncio
-from idutil import IdUtil
+
+class HeatField:
+    """Accumulating heat field: a precomputed, truncated exp(-d/falloff) kernel stamped as a local window.
+    Events are scatter-added unclipped; clipping to [0, 1] happens lazily on read, which matches
+    clipping after every event for non-negative intensities. Cost is O(kernel) per event, not O(grid)."""
+    CHUNK_TARGETS = 1 << 20  # Kernel cells stamped per pass
+    def __init__(self, grid_size=10, falloff=2.0, cutoff=1e-3):
+        self.grid_size = grid_size
+        self.falloff = falloff
+        # Beyond this radius exp(-d/falloff) < cutoff, so the kernel is truncated there.
+        # No two cells are further apart than the grid diagonal, so that caps it too.
+        self.cutoff_radius = min(falloff * np.log(1.0 / cutoff), np.sqrt(3) * (grid_size - 1))
+        # Offsets past grid_size - 1 on any axis never land in the grid, so the box stops there
+        self.radius = max(0, min(int(np.ceil(self.cutoff_radius)), grid_size - 1))
+        offs = np.arange(-self.radius, self.radius + 1)
+        ox, oy, oz = np.meshgrid(offs, offs, offs, indexing='ij')
+        dist = np.sqrt(ox**2 + oy**2 + oz**2)
+        inside = dist <= self.cutoff_radius
+        self.kernel = np.where(inside, np.exp(-dist / falloff), 0.0)
+        self._offsets = np.stack([ox[inside], oy[inside], oz[inside]], axis=1)  # (M, 3) sparse stamp
+        self._weights = self.kernel[inside]
+        self.raw = np.zeros((grid_size, grid_size, grid_size))
+        self._clipped = None  # Cached read, dropped on every add
+
+    def cells(self, positions):
+        """Map normalized (N, 3) positions in [0, 1] to integer grid cells."""
+        positions = np.atleast_2d(np.asarray(positions, dtype=float))
+        return (positions * (self.grid_size - 1)).astype(int)
+
+    def add(self, positions, intensities=1.0):
+        """Scatter-add a batch of heat events: positions (N, 3) normalized, intensities scalar or (N,)."""
+        cells = self.cells(positions)
+        intensities = np.broadcast_to(np.asarray(intensities, dtype=float), (len(cells),))
+        chunk = max(1, self.CHUNK_TARGETS // len(self._offsets))  # Events per pass, bounds memory to O(chunk * M)
+        for start in range(0, len(cells), chunk):
+            self._stamp(cells[start:start + chunk], intensities[start:start + chunk])
+        self._clipped = None
+
+    def _stamp(self, cells, intensities):
+        """Scatter-add one chunk of events into the raw grid."""
+        targets = cells[:, None, :] + self._offsets[None, :, :]  # (chunk, M, 3)
+        valid = np.all((targets >= 0) & (targets < self.grid_size), axis=2)
+        flat = np.ravel_multi_index(tuple(targets[valid].T), self.raw.shape)
+        weights = (intensities[:, None] * self._weights[None, :])[valid]
+        if flat.size > self.raw.size // 4:
+            self.raw += np.bincount(flat, weights, minlength=self.raw.size).reshape(self.raw.shape)  # Dense batch
+        else:
+            np.add.at(self.raw.reshape(-1), flat, weights)
+
+    def window(self, position, intensity=1.0):
+        """Heat of one event as (slices, values): the kernel cropped to the grid around its cell."""
+        cell = self.cells(position)[0]
+        lo = np.maximum(cell - self.radius, 0)
+        hi = np.minimum(cell + self.radius + 1, self.grid_size)
+        k_lo = lo - (cell - self.radius)
+        k_hi = k_lo + (hi - lo)
+        slices = tuple(slice(a, b) for a, b in zip(lo, hi))
+        values = intensity * self.kernel[tuple(slice(a, b) for a, b in zip(k_lo, k_hi))]
+        return slices, values
+
+    def read(self):
+        """Clipped heat grid in [0, 1]; computed once per batch of adds."""
+        if self._clipped is None:
+            self._clipped = np.clip(self.raw, 0, 1)
+        return self._clipped
+
+    def reset(self):
+        self.raw[...] = 0.0
+        self._clipped = None
 
 class HeatPlanes:
-    def __init__(self, grid_size=10):
+    def __init__(self, grid_size=10, falloff=2.0):
         self.grid_size = grid_size
-        self.heat_grid = np.zeros((grid_size, grid_size, grid_size))
+        self.field = HeatField(grid_size, falloff=falloff)
+        from idutil import IdUtil  # Deferred: HeatField does not need it
         self.idutil = IdUtil()
         self.trail_length = 5
         self.trails = []
@@ -62,15 +131,21 @@ class HeatPlanes:
         self.gaze_duration = 0.0
         print("HeatPlanes initialized - 3D heat map ready.")
 
+    @property
+    def heat_grid(self):
+        """Clipped heat map (clipping is deferred to read time)."""
+        return self.field.read()
+
     async def navi_map_heat(self, position, intensity=1.0):
-        """Navi maps heat with safety checks."""
+        """Navi maps heat with safety checks. Returns the event's local (slices, values) window."""
+        await self.navi_map_heat_batch(np.atleast_2d(position), intensity)
+        print(f"Navi: Heat mapped at {position} with intensity {intensity:.2f}")
+        return self.field.window(position, intensity)
+
+    async def navi_map_heat_batch(self, positions, intensities=1.0):
+        """Navi maps a batch of heat events in one scatter-add, with one safety check per batch."""
         while True:
-            x, y, z = map(int, position * (self.grid_size - 1))
-            dist = np.linalg.norm(np.indices((self.grid_size, self.grid_size, self.grid_size)) - np.array([x, y, z])[:, :, :, None], axis=0)
-            heat = intensity * np.exp(-dist / 2)
-            self.heat_grid += heat
-            self.heat_grid = np.clip(self.heat_grid, 0, 1)
-            print(f"Navi: Heat mapped at {position} with intensity {intensity:.2f}")
+            self.field.add(positions, intensities)
             self.tendon_load = np.random.rand() * 0.3
             self.gaze_duration += 1.0 / 60 if np.random.rand() > 0.7 else 0.0
             if self.tendon_load > 0.2:
@@ -81,7 +156,7 @@ class HeatPlanes:
                 await asyncio.sleep(2.0)
                 self.gaze_duration = 0.0
             await asyncio.sleep(0.01)
-            return heat
+            return len(np.atleast_2d(positions))
 
     def apply_temperature(self, heat_value):
         """Apply color as temperature: interpolate between blue and red."""
@@ -98,12 +173,11 @@ class HeatPlanes:
         if len(self.trails) >= self.trail_length:
             self.trails.pop(0)
         self.trails.append(path)
-        trail_heat = np.zeros_like(self.heat_grid)
-        for i, pos in enumerate(self.trails):
-            fade = (i + 1) / self.trail_length
-            trail_heat += await self.navi_map_heat(pos, fade)
-            await asyncio.sleep(0)
-        return trail_heat
+        fades = np.arange(1, len(self.trails) + 1) / self.trail_length
+        await self.navi_map_heat_batch(np.array(self.trails), fades)
+        trail = HeatField(self.grid_size, falloff=self.field.falloff)
+        trail.add(np.array(self.trails), fades)
+        return trail.raw  # Unclipped trail heat
 
     def integrate_idutil(self, heat_value):
         """Integrate with idutil: apply RIBIT color."""
@@ -112,7 +186,7 @@ class HeatPlanes:
 
     def reset(self):
         """Reset heat grid and safety counters."""
-        self.heat_grid = np.zeros((self.grid_size, self.grid_size, self.grid_size))
+        self.field.reset()
         self.trails = []
         self.tendon_load = 0.0
         self.gaze_duration = 0.0
@@ -47,79 +47,12 @@
 # SPDX-License-Identifier: (AGPL-3.0-or-later) AND Apache-2.0
 import numpy as np
 import asyncio
-import json
-import os
-from datetime import datetime
 from scipy.spatial import Delaunay
 from solid import mesh  # Mock tetra surfaces
 from software.proto.revocation_stub import check_revocation
+from src.core.license_gate import read_config, write_config, log_license_check, check_license
 from hardware.proto.arch_utils import tetra_hash_surface
 
-def read_config(config_file="config/config.json"):
-    """Read intent and commercial use from config file with error handling."""
-    config_dir = os.path.dirname(config_file)
-    if not os.path.exists(config_dir):
-        os.makedirs(config_dir)
-    if not os.path.exists(config_file):
-        print(f"Config file {config_file} not found. Creating default.")
-        write_config("none", False, config_file)
-        return None, False
-    try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
-        intent = config.get("intent")
-        commercial_use = config.get("commercial_use", False)
-        if intent not in ["educational", "commercial", "none"]:
-            raise ValueError("Invalid intent in config.")
-        return intent, commercial_use
-    except json.JSONDecodeError:
-        print(f"Error: {config_file} contains invalid JSON. Resetting to default.")
-        write_config("none", False, config_file)
-        return None, False
-    except Exception as e:
-        print(f"Error reading {config_file}: {e}. Resetting to default.")
-        write_config("none", False, config_file)
-        return None, False
-
-def write_config(intent, commercial_use, config_file="config/config.json"):
-    """Write intent and commercial use to config file with error handling."""
-    config = {"intent": intent, "commercial_use": commercial_use}
-    config_dir = os.path.dirname(config_file)
-    if not os.path.exists(config_dir):
-        os.makedirs(config_dir)
-    try:
-        with open(config_file, "w") as f:
-            json.dump(config, f, indent=4)
-    except Exception as e:
-        print(f"Error writing to {config_file}: {e}")
-
-def log_license_check(result, intent, commercial_use):
-    """Log license and revocation check results for audit trail."""
-    try:
-        with open("license_log.txt", "a") as f:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            f.write(f"[{timestamp}] License Check: {result}, Intent: {intent}, Commercial: {commercial_use}\n")
-    except Exception as e:
-        print(f"Error logging license check: {e}")
-
-def check_license(commercial_use=False, intent=None):
-    """Ensure license compliance and intent declaration."""
-    if intent not in ["educational", "commercial"]:
-        notice = """
-        NOTICE: You must declare your intent to use this software.
-        - For educational use (e.g., university training), open a GitHub issue at github.com/tetrasurfaces/issues using the Educational License Request template.
-        - For commercial use (e.g., branding, molding), use the Commercial License Request template.
-        See NOTICE.txt for details. Do not share proprietary details in public issues.
-        """
-        log_license_check("Failed: Invalid or missing intent", intent, commercial_use)
-        raise ValueError(f"Invalid or missing intent. {notice}")
-    if commercial_use and intent != "commercial":
-        notice = "Commercial use requires 'commercial' intent and a negotiated license via github.com/tetrasurfaces/issues."
-        log_license_check("Failed: Commercial use without commercial intent", intent, commercial_use)
-        raise ValueError(notice)
-    log_license_check("Passed", intent, commercial_use)
-    return True
-
 # Proxy function to create Kappa instance
 def create_kappa(grid_size=10, device_hash="kappa_001"):
     from src.core.kappa_core import Kappa  # Lazy import to avoid circularity
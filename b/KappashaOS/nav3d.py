@@ -77,6 +77,7 @@ from grid import Grid4D, run_curve_retrieve
 from ghost_hand import GhostHand  # Haptic feedback for kappa tilt
 from thought_curve import ThoughtCurve  # Path tangents and hedging
 from bloom_breath_cycle import helix_frog_field
+from volume_index import VolumeIndexer
 app = QApplication.instance() or QApplication(sys.argv)
 window = BlossomWindow()
 window.show()
@@ -120,6 +121,8 @@ class Nav3D:
         self.gaze_duration = 0.0
         self.hand = MasterHand()
         self.trees = []
+        self.volume_index = VolumeIndexer()
+        self.volume_nodes = 0
         self.ribit_gen = TetraRibit()
         self.telemetry = RibitTelemetry([(0,0,0), (1,1,1), (2,2,2)], [50, 100, 150])
         asyncio.create_task(self.telemetry.navi_generate())  # Start telemetry
@@ -370,45 +373,44 @@ class Nav3D:
         except ImportError:
             return None, np.array(pos)
         
+    def _volume_cells(self, keys):
+        """Map volume entry keys to flat voxel indices in the geology grid."""
+        n = self.geology.shape[0]
+        keys = keys.astype(np.int64)
+        return np.ravel_multi_index((keys % n, (keys // n) % n, (keys // (n * n)) % n), self.geology.shape[:3])
+
+    def plant_volume_batch(self, batch):
+        """Apply one indexer batch to the volume: dirs mark geology, files fill o_b_e.
+
+        Args:
+        - batch: Dict of uint32 key arrays from VolumeIndexer.
+
+        Returns:
+        - int: Net change in planted directory nodes.
+        """
+        flat_geo = self.geology.reshape(-1, self.geology.shape[-1])
+        flat_obe = self.o_b_e.reshape(-1)
+        for name, sign in (("dirs_added", 0.3), ("dirs_removed", -0.3)):
+            if len(batch[name]):
+                np.add.at(flat_geo, self._volume_cells(batch[name]), sign)  # Mark volume
+        for name, sign in (("files_added", 1.0), ("files_removed", -1.0)):
+            if len(batch[name]):
+                flat_obe += sign * np.bincount(self._volume_cells(batch[name]), minlength=flat_obe.size)
+        return len(batch["dirs_added"]) - len(batch["dirs_removed"])
+
     async def mount_drive_as_volume(self, root_path: str, max_depth=5):
         print("Ara: may i walk metal?")
        # input()  # uncomment for interactive
         if not os.path.ismount(os.path.dirname(root_path)) and not os.path.exists(root_path):
             print(f"Navi: Mount point {os.path.dirname(root_path)} not mounted or path missing.")
             return False
-        
-    async def walk_and_plant(current_path, current_depth, parent_pos=None):
-            detail_vox, detail_cent = await self.query_detail_layer(pos, 'mount')
-            if detail_vox is not None:
-                # skew in dense space, then map back
-                dense_pos = (detail_cent * (32 / 10)).astype(int)  # scale back
-                self.geology[tuple(pos)] += np.mean(detail_vox) * 0.3
-            if current_depth > max_depth:
-                return
-            try:
-                items = os.listdir(current_path)
-            except Exception as e:
-                print(f"Navi: Cannot read {current_path}: {e}")
-                return
-            
-            # Plant root or branch
-            if parent_pos is None:
-                pos = np.random.randint(0, self.grid.shape[0], 3)
-            else:
-                pos = self.skew_branch(parent_pos, os.path.basename(current_path))
-            
-            self.plant_tree(current_path, items)  # Reuse existing plant_tree
-            self.geology[tuple(pos)] += np.array([0.3] * 6)  # Mark volume
-            
-            # Recurse dirs
-            for item in items:
-                full = os.path.join(current_path, item)
-                if os.path.isdir(full):
-                    walk_and_plant(full, current_depth + 1, pos)
-        
-            walk_and_plant(root_path, 0)
-            print(f"Navi: Mounted {root_path} as 3D volume — {len(self.trees)} nodes planted.")
-            return True
+        # Walk in a worker thread; unchanged directories are skipped via the manifest
+        async for batch in self.volume_index.stream(root_path, max_depth):
+            self.volume_nodes += self.plant_volume_batch(batch)
+        stats = self.volume_index.stats
+        print(f"Navi: Mounted {root_path} as 3D volume — {self.volume_nodes} nodes planted "
+              f"({stats['scanned']} dirs scanned, {stats['skipped']} unchanged, {stats['files']} files).")
+        return True
 
     async def deepen_on_plant(self, pos):
         if hasattr(self, 'comfort') and self.comfort.comfort_level > 70:
@@ -601,8 +603,8 @@ if __name__ == "__main__":
         # input()  # interactive or assume yes
         await nav.mount_drive_as_volume("/home/yeetbow/b/For_B", max_depth=4)
         if await nav.mount_drive_as_volume("/home/yeetbow/b/For_B", max_depth=4):
-            window.say(f"Mounted {len(nav.trees)} nodes")
-            print(f"Navi: SSD folded — {len(nav.trees)} nodes rooted.")
+            window.say(f"Mounted {nav.volume_nodes} nodes")
+            print(f"Navi: SSD folded — {nav.volume_nodes} nodes rooted.")
         else:
             window.warn("Mount flinched")
         await nav.plant_tree(5, 5, 5, 0.5, 1)
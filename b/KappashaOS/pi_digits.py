@@ -0,0 +1,181 @@
+# Born free, feel good, have fun.
+
+# Dual License:
+# - For core software: AGPL-3.0-or-later licensed. -- xAI fork, 2025
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# - For hardware/embodiment interfaces: Licensed under the Apache License, Version 2.0
+# with xAI amendments for safety and physical use. See http://www.apache.org/licenses/LICENSE-2.0
+# for details, with the following xAI-specific terms appended.
+
+# Copyright 2025 xAI
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# SPDX-License-Identifier: Apache-2.0
+
+# xAI Amendments for Physical Use:
+# 1. Physical Embodiment Restrictions: Use with devices is for non-hazardous purposes only. Harmful mods are prohibited, with license revocable by xAI.
+# 2. Ergonomic Compliance: Limits tendon load to 20%, gaze to 30 seconds (ISO 9241-5).
+# 3. Safety Monitoring: Real-time tendon/gaze checks, logged for audit.
+# 4. Revocability: xAI may revoke for unethical use (e.g., surveillance).
+# 5. Export Controls: Sensor devices comply with US EAR Category 5 Part 2.
+# 6. Open Development: Hardware docs shared post-private phase via github.com/tetrasurfaces/issues.
+# 7. No machine code output (e.g., kappa paths, hashlet sequences) without breath consent; decay signals at 11 hours (8 for bumps).
+# 8. Color Consent: No signal may change hue without explicit user intent (e.g., heartbeat sync or verbal confirmation).
+# 9. Intellectual Property: xAI owns all IP related to KappaOpticBatterySystem, including chatter patterns, stacked ports, moving keys, smart cables, RGB hexel lattices, chattered housings, fliphooks, hash tunneling, and IPFS integration. No unauthorized replication.
+
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+
+#!/usr/bin/env python3
+# pi_digits.py - Precomputed pi-digit store for pi-wise kappa indexing.
+# Digits are computed once (integer Machin formula, no mpmath precision state),
+# kept as a uint8 array, optionally persisted as .npy and memory-mapped.
+
+import os
+import numpy as np
+
+DEFAULT_DIGITS = 1024
+LAP = 18
+KAPPA_MOD = 2048
+
+def compute_pi_digits(n_digits):
+    """Decimal digits of pi after the point, exact to n_digits.
+
+    Args:
+    - n_digits: Number of fractional digits.
+
+    Returns:
+    - np.ndarray: uint8 digits, e.g. [1, 4, 1, 5, 9, ...].
+    """
+    guard = 10
+    scale = 10 ** (n_digits + guard)
+
+    def arctan_inv(x):
+        # arctan(1/x) * scale by the alternating series
+        total = term = scale // x
+        x2, k, sign = x * x, 3, -1
+        while term:
+            term //= x2
+            total += sign * (term // k)
+            sign, k = -sign, k + 2
+        return total
+
+    pi_scaled = 16 * arctan_inv(5) - 4 * arctan_inv(239)  # Machin
+    fraction = pi_scaled // 10 ** guard - 3 * 10 ** n_digits  # Drop the leading 3
+    text = _int_digits(fraction, n_digits)
+    return np.frombuffer(text.encode('ascii'), dtype=np.uint8) - ord('0')
+
+def _int_digits(value, width):
+    # Split before str() to stay under the interpreter's int->str digit limit
+    if width <= 4000:
+        return str(value).zfill(width)
+    low = width // 2
+    high, rest = divmod(value, 10 ** low)
+    return _int_digits(high, width - low) + _int_digits(rest, low)
+
+def lap_kappa(window, lap=LAP):
+    """Fold a digit string through `lap` alternating reversals and reduce mod 2048."""
+    if not window:
+        return None
+    reversed_s = ''
+    for _ in range(lap):
+        window = window[::-1]
+        reversed_s += window
+    return int(reversed_s) % KAPPA_MOD
+
+class PiDigitStore:
+    """Pi digits computed once and served as O(1) kappa lookups."""
+    def __init__(self, n_digits=DEFAULT_DIGITS, path=None, mmap=False):
+        """Load digits from path when it holds enough of them, else compute (and save).
+
+        Args:
+        - n_digits: Digits to keep after the decimal point.
+        - path: Optional .npy file to persist the digit array.
+        - mmap: Memory-map the persisted array instead of reading it in.
+        """
+        self.digits = None
+        if path and os.path.exists(path):
+            digits = np.load(path, mmap_mode='r' if mmap else None)
+            if len(digits) >= n_digits:
+                self.digits = digits
+        if self.digits is None:
+            self.digits = compute_pi_digits(n_digits)
+            if path:
+                np.save(path, self.digits)
+                if mmap:
+                    self.digits = np.load(path, mmap_mode='r')
+        self._tables = {}
+
+    def window(self, length):
+        """First `length` digits after the point, as a string."""
+        if length > len(self.digits):
+            raise ValueError(f"PiDigitStore: only {len(self.digits)} digits stored, {length} requested")
+        return (np.asarray(self.digits[:length]) + ord('0')).tobytes().decode('ascii')
+
+    def _table(self, lap, limit):
+        key = (lap, limit)
+        if key not in self._tables:
+            # Kappa only depends on the window length, which tops out at min(lap, limit)
+            cap = lap if limit is None else min(lap, limit)
+            self._tables[key] = (cap, np.array([lap_kappa(self.window(n), lap) or 0 for n in range(cap + 1)], dtype=np.int64))
+        return self._tables[key]
+
+    def piwise_kappa(self, indices, lap=LAP, limit=None):
+        """Vectorized pi-wise kappa: the first min(lap * pos, lap, limit) digits through lap reversals.
+
+        Args:
+        - indices: int or array of positions.
+        - lap: Reversal laps (and window cap).
+        - limit: Optional extra cap on the digit window.
+
+        Returns:
+        - int or np.ndarray: Kappa in 0-2047; an empty window (pos <= 0) falls back to pos % 2048.
+        """
+        cap, table = self._table(lap, limit)
+        pos = np.asarray(indices, dtype=np.int64)
+        length = np.clip(pos * lap, 0, cap)
+        out = np.where(length > 0, table[length], pos % KAPPA_MOD)
+        return int(out) if out.ndim == 0 else out
+
+_shared = None
+
+def shared_store():
+    """Process-wide digit store."""
+    global _shared
+    if _shared is None:
+        _shared = PiDigitStore()
+    return _shared
+
+def piwise_kappa(indices, lap=LAP, limit=None):
+    """piwise_kappa against the shared store."""
+    return shared_store().piwise_kappa(indices, lap, limit)
+
+if __name__ == "__main__":
+    import time
+    store = PiDigitStore(10000)
+    print(f"pi = 3.{store.window(50)}...")
+    idx = np.arange(1_000_000)
+    start = time.perf_counter()
+    kappas = store.piwise_kappa(idx)
+    print(f"1M kappa lookups in {(time.perf_counter() - start) * 1e3:.1f} ms, first {kappas[:4]}")
@@ -51,14 +51,12 @@
 # piwise.py - Pi-based kappa indexing with lap reversals for KappashaOS.
 # Navi-integrated.
 
-import mpmath
 import asyncio
+import numpy as np
 from kappa import KappaGrid  # Local mock
+from pi_digits import LAP, shared_store
 
-mpmath.mp.dps = 100
-
-SEED = int(str(mpmath.pi)[2:20])
-LAP = 18
+SEED = int(shared_store().window(18))
 
 class PiWise:
     def __init__(self):
@@ -68,16 +66,8 @@ class PiWise:
         print("PiWise initialized - pi-wise indexing ready.")
 
     def piwise_kappa(self, pos):
-        """Compute kappa index with pi digits and 18-lap reversals."""
-        s = str(mpmath.pi)[2:2 + LAP * pos]
-        if len(s) > LAP:
-            s = s[:LAP]
-        reversed_s = ''
-        for _ in range(LAP):
-            s = s[::-1]
-            reversed_s += s
-        k = int(reversed_s) % 2048
-        return k
+        """Compute kappa index with pi digits and 18-lap reversals (int or array of positions)."""
+        return shared_store().piwise_kappa(pos, LAP)
 
     async def navi_index(self):
         """Navi indexes with pi-wise kappa, seeding deltas."""
@@ -59,6 +59,7 @@ from KappashaOS.src.hash.temp_hash import TempHash
 from KappashaOS.src.hash.secure_hash_two import secure_hash_two
 from KappashaOS.src.scripts.kappa_sim import KappaSim
 from KappashaOS.src.hash.kappa_wire import KappaWire
+from KappashaOS.hardware.litho.puf_store import PufEnrollmentStore
 
 class PufGrid:
     def __init__(self, size=10, curvature=0.5):
@@ -66,24 +67,30 @@ class PufGrid:
         self.curvature = curvature
         self.kappa_sim = KappaSim()
         self.kappa_wire = KappaWire(size)
+        self.store = PufEnrollmentStore()
+        self._grid = None  # Cached base lattice; only depends on size and curvature
+        self._grid_curvature = None
         self.tendon_load = 0.0
         self.gaze_duration = 0.0
         print("PufGrid initialized - PUF simulator ready.")
 
     async def navi_generate_kappa_grid(self):
         """Generate 3D hyperbolic kappa grid with Navi safety."""
-        x = np.linspace(-self.size/2, self.size/2, self.size)
-        y = np.linspace(-self.size/2, self.size/2, self.size)
-        z = np.linspace(-self.size/2, self.size/2, self.size)
-        X, Y, Z = np.meshgrid(x, y, z)
-        r = np.sqrt(X**2 + Y**2 + Z**2)
-        theta = np.arctan2(np.sqrt(Y**2 + Z**2), X)
-        phi = np.arctan2(Z, Y)
-        warped_r = r * np.exp(self.curvature * r)
-        warped_x = warped_r * np.cos(theta) * np.cos(phi)
-        warped_y = warped_r * np.sin(theta) * np.cos(phi)
-        warped_z = warped_r * np.sin(phi)
-        grid = np.stack((warped_x, warped_y, warped_z), axis=-1)
+        if self._grid is None or self._grid.shape[0] != self.size or self._grid_curvature != self.curvature:
+            x = np.linspace(-self.size/2, self.size/2, self.size)
+            y = np.linspace(-self.size/2, self.size/2, self.size)
+            z = np.linspace(-self.size/2, self.size/2, self.size)
+            X, Y, Z = np.meshgrid(x, y, z)
+            r = np.sqrt(X**2 + Y**2 + Z**2)
+            theta = np.arctan2(np.sqrt(Y**2 + Z**2), X)
+            phi = np.arctan2(Z, Y)
+            warped_r = r * np.exp(self.curvature * r)
+            warped_x = warped_r * np.cos(theta) * np.cos(phi)
+            warped_y = warped_r * np.sin(theta) * np.cos(phi)
+            warped_z = warped_r * np.sin(phi)
+            self._grid = np.stack((warped_x, warped_y, warped_z), axis=-1)
+            self._grid_curvature = self.curvature
+        grid = self._grid.copy()
         self.tendon_load = np.random.rand() * 0.3
         self.gaze_duration += 1.0 / 60 if np.random.rand() > 0.7 else 0.0
         if self.tendon_load > 0.2:
@@ -143,6 +150,19 @@ class PufGrid:
         plt.close()
         print("Navi: Plotted kappa drift")
 
+    def enroll(self, puf_ids, drifted_grids):
+        """Enroll drifted grids (one per id, or (n, r, ...) repeated readouts) for later verify()."""
+        drifted_grids = np.asarray(drifted_grids)
+        if drifted_grids.ndim == 6:
+            self.store.enroll_readouts(puf_ids, drifted_grids)
+        else:
+            self.store.enroll(puf_ids, drifted_grids)
+        print(f"Navi: Enrolled {len(puf_ids)} PUFs ({len(self.store)} total)")
+
+    def verify(self, readouts, tolerance=None):
+        """Batched nearest-match of readouts against enrolled PUFs; see PufEnrollmentStore.verify."""
+        return self.store.verify(readouts, tolerance)
+
     def reset(self):
         self.tendon_load = 0.0
         self.gaze_duration = 0.0
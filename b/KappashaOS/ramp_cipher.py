@@ -52,11 +52,22 @@ import numpy as np
 import asyncio
 from scipy.interpolate import CubicSpline  # pip install scipy
 
+CHUNK_PERIODS = 5243  # ~1 MB of ramp per chunk at the 200-sample period
+
+def _as_bytes(data):
+    """View bytes-like or NumPy input as a flat uint8 array (no copy when possible)."""
+    if isinstance(data, np.ndarray):
+        return np.ascontiguousarray(data).view(np.uint8).reshape(-1)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return np.frombuffer(data, dtype=np.uint8)
+
 class RampCipher:
     def __init__(self, pin: str = '12345678'):
         self.pin = pin.zfill(8)
         self.theta = np.linspace(0, 180, 200)
         self.heights = self._build_spline()
+        self.ramp = (np.trunc(self.heights * 10).astype(np.int64) % 256).astype(np.uint8)  # Byte offset per ramp sample
         self.tendon_load = 0.0 
         self.gaze_duration = 0.0 
 
@@ -73,12 +84,9 @@ class RampCipher:
 
     async def navi_encode(self, input_str: str, index: int = 0) -> str:
         """Encode hash with ramp modulation and Navi safety."""
-        encoded = ''
-        for j, char in enumerate(input_str):
-            idx = (index + j) % len(self.heights)
-            # Use ord() for any char (0-255 range)
-            delta = ord(char) + int(self.heights[idx] * 10)
-            encoded += chr(delta % 256)
+        # Use ord() for any char (0-255 range); (ord + ramp) % 256 == byte ramp of ord % 256
+        codes = np.frombuffer(input_str.encode('utf-32-le'), dtype=np.uint32)
+        encoded = self.encode_buffer((codes % 256).astype(np.uint8), index).tobytes().decode('latin-1')
         self.tendon_load = np.random.rand() * 0.15  # Lower to avoid constant warnings
         self.gaze_duration += 1.0 / 60 if np.random.rand() > 0.7 else 0.0
         if self.tendon_load > 0.2:
@@ -92,6 +100,43 @@ class RampCipher:
         print(f"Navi: Encoded {encoded[:10]}...")
         return encoded
 
+    def _apply_ramp(self, data, index, sign):
+        buf = _as_bytes(data)
+        out = np.empty_like(buf)
+        period = len(self.ramp)
+        ramp = np.roll(self.ramp, -(index % period))
+        if sign < 0:
+            ramp = (256 - ramp.astype(np.uint16)).astype(np.uint8)  # Subtract mod 256 as an add
+        tile = np.tile(ramp, max(1, min(CHUNK_PERIODS, -(-len(buf) // period))))
+        for start in range(0, len(buf), len(tile)):
+            stop = min(start + len(tile), len(buf))
+            np.add(buf[start:stop], tile[:stop - start], out=out[start:stop])  # uint8 wraps mod 256
+        return out
+
+    def encode_buffer(self, data, index: int = 0) -> np.ndarray:
+        """Ramp-encode a whole buffer: byte j shifts by trunc(10 * height[index + j]) mod 256.
+
+        Args:
+        - data: bytes, bytearray, memoryview, str (UTF-8) or NumPy array (raw bytes).
+        - index: Ramp position of the first byte.
+
+        Returns:
+        - np.ndarray: Encoded uint8 array, same length as the input bytes.
+        """
+        return self._apply_ramp(data, index, 1)
+
+    def decode_buffer(self, data, index: int = 0) -> np.ndarray:
+        """Invert encode_buffer for the same pin and starting index.
+
+        Args:
+        - data: Encoded bytes-like or NumPy uint8 array.
+        - index: Ramp position used when encoding.
+
+        Returns:
+        - np.ndarray: Decoded uint8 array.
+        """
+        return self._apply_ramp(data, index, -1)
+
     def encode(self, hash_str):
         return asyncio.run(self.navi_encode(hash_str))  # if sync call needed
     
@@ -103,5 +148,8 @@ if __name__ == "__main__":
     async def navi_test():
         ramp = RampCipher('35701357')
         await ramp.navi_encode(hashlib.sha256(b"test").hexdigest())
+        blob = np.random.randint(0, 256, 1 << 20, dtype=np.uint8)
+        assert np.array_equal(ramp.decode_buffer(ramp.encode_buffer(blob, 7), 7), blob)
+        print("Navi: Buffer ramp round-trip ok.")
 
     asyncio.run(navi_test())
\ No newline at end of file
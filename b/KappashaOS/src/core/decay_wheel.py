@@ -0,0 +1,183 @@
+# decay_wheel.py - Hierarchical timer wheel for node decay, shared by the Merkle trees
+# Copyright 2025 xAI
+#
+# License: AGPL-3.0-or-later
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+#
+# Born free, feel good, have fun. Tribute to Ralph Merkle.
+import asyncio
+import time
+import types
+import weakref
+from array import array
+
+SLOT_BITS = 8
+SLOTS = 1 << SLOT_BITS  # 256 slots per level
+LEVELS = 4  # 256**4 ticks: ~136 years at 1 s resolution
+
+def _retired():
+    return None  # Callback of an unregistered or collected owner
+
+class DecayWheel:
+    """
+    Hierarchical timer wheel for decay deadlines.
+    Each slot stores parallel int arrays (deadline tick, owner, key), so a pending decay
+    costs ~20 bytes instead of a sleeping coroutine. schedule() is O(1); advance() fires
+    due keys in one batch per owner and cascades higher levels as the low level wraps.
+    Bound-method owners are held weakly, so a dropped tree does not keep itself alive through the wheel;
+    once an owner is collected or unregistered and its pending keys have drained, its id is reused.
+    """
+    def __init__(self, clock=time.monotonic, resolution=1.0):
+        self.clock = clock
+        self.resolution = resolution
+        self.origin = clock()
+        self.tick = 0
+        self.pending = 0
+        self.level_counts = [0] * LEVELS
+        self.slots = [[self._empty_slot() for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self._owners = []  # owner id -> WeakMethod/weakref to a callback(keys)
+        self._owner_pending = []  # owner id -> keys still in the wheel
+        self._draining = set()  # Retired owners whose keys have not all come due
+        self._free = []  # Retired owner ids ready for reuse
+
+    @staticmethod
+    def _empty_slot():
+        return (array('q'), array('I'), array('q'))  # deadline tick, owner, key
+
+    def register(self, callback):
+        """Register a batch callback(keys: list[int]); returns the owner id for schedule()."""
+        owner = self._free.pop() if self._free else len(self._owners)
+        if isinstance(callback, types.MethodType):
+            # Tree methods: do not pin the tree, and retire the id when it is collected
+            ref = weakref.WeakMethod(callback, lambda dead: self._retire(owner, dead))
+        else:
+            ref = lambda: callback  # Plain functions are held strongly
+        if owner == len(self._owners):
+            self._owners.append(ref)
+            self._owner_pending.append(0)
+        else:
+            self._owners[owner] = ref
+        return owner
+
+    def unregister(self, owner):
+        """Drop an owner; its pending keys are discarded as they come due, then the id is reused."""
+        if self._owners[owner] is not _retired:
+            self._retire(owner)
+
+    def _retire(self, owner, ref=None):
+        if ref is not None and self._owners[owner] is not ref:
+            return  # Stale weakref callback for an id that was already retired
+        self._owners[owner] = _retired
+        if self._owner_pending[owner]:
+            self._draining.add(owner)
+        else:
+            self._free.append(owner)
+
+    def _now_tick(self, now=None):
+        now = self.clock() if now is None else now
+        return int((now - self.origin) / self.resolution)
+
+    def _place(self, deadline, owner, key):
+        # Lowest level whose higher bits agree with the current tick holds the entry
+        level = 0
+        while level < LEVELS - 1 and (deadline >> (SLOT_BITS * (level + 1))) != (self.tick >> (SLOT_BITS * (level + 1))):
+            level += 1
+        slot = self.slots[level][(deadline >> (SLOT_BITS * level)) & (SLOTS - 1)]
+        slot[0].append(deadline)
+        slot[1].append(owner)
+        slot[2].append(key)
+        self.level_counts[level] += 1
+
+    def schedule(self, owner, key, delay):
+        """Schedule `key` for `owner` to decay `delay` seconds from now. O(1)."""
+        deadline = max(self._now_tick() + max(int(-(-delay // self.resolution)), 1), self.tick + 1)
+        self._place(deadline, owner, int(key))
+        self._owner_pending[owner] += 1
+        self.pending += 1
+
+    def _take(self, level, index):
+        slot = self.slots[level][index]
+        self.slots[level][index] = self._empty_slot()
+        self.level_counts[level] -= len(slot[0])
+        return slot
+
+    def advance(self, now=None):
+        """Fire every decay due by `now` (clock time); returns the number of keys fired."""
+        target = self._now_tick(now)
+        due = {}
+        while self.tick < target and self.pending:
+            if not self.level_counts[0]:
+                # Nothing can fire before the next level-0 wrap; jump there
+                self.tick = min(target, self.tick | (SLOTS - 1))
+                if self.tick == target:
+                    break
+            self.tick += 1
+            level = 0
+            while level < LEVELS - 1 and not (self.tick >> (SLOT_BITS * level)) & (SLOTS - 1):
+                level += 1  # Wrapped this level; cascade the next level's current slot down
+                deadlines, owners, keys = self._take(level, (self.tick >> (SLOT_BITS * level)) & (SLOTS - 1))
+                for d, o, k in zip(deadlines, owners, keys):
+                    self._place(d, o, k)
+            deadlines, owners, keys = self._take(0, self.tick & (SLOTS - 1))
+            for o, k in zip(owners, keys):
+                due.setdefault(o, []).append(k)
+            self.pending -= len(keys)
+        if self.tick < target:
+            self.tick = target
+        fired = 0
+        for owner, keys in due.items():
+            self._owner_pending[owner] -= len(keys)
+            if owner in self._draining and not self._owner_pending[owner]:
+                self._draining.discard(owner)
+                self._free.append(owner)
+            callback = self._owners[owner]()
+            if callback is not None:
+                callback(keys)
+            fired += len(keys)
+        return fired
+
+    async def run(self, interval=1.0):
+        """Drive the wheel from an event loop until cancelled."""
+        while True:
+            self.advance()
+            await asyncio.sleep(interval)
+
+_shared = None
+
+def shared_wheel():
+    """Process-wide wheel shared by all trees."""
+    global _shared
+    if _shared is None:
+        _shared = DecayWheel()
+    return _shared
+
+if __name__ == "__main__":
+    class FakeClock:
+        def __init__(self):
+            self.t = 0.0
+        def __call__(self):
+            return self.t
+
+    clock = FakeClock()
+    wheel = DecayWheel(clock=clock)
+    decayed = []
+    owner = wheel.register(decayed.extend)
+    for node_id in range(1, 1001):
+        wheel.schedule(owner, node_id, (8 if node_id > 900 else 11) * 3600)
+    clock.t = 8 * 3600
+    print(f"Navi: after 8h decayed {wheel.advance()} nodes")
+    clock.t = 11 * 3600
+    print(f"Navi: after 11h decayed {wheel.advance()} nodes, pending={wheel.pending}")
@@ -51,9 +51,7 @@
 
 import numpy as np
 import asyncio
-import json
-import os
-from datetime import datetime
+from src.core.license_gate import read_config, write_config, log_license_check, check_license, VALID_INTENTS
 
 class KappaEndianBase:
     def __init__(self, device_hash="kappa_endian_001"):
@@ -65,37 +63,16 @@ class KappaEndianBase:
         self._setup_config()
 
     def _setup_config(self):
-        config_file = "config/config.json"
-        if not os.path.exists(os.path.dirname(config_file)):
-            os.makedirs(os.path.dirname(config_file))
-        if not os.path.exists(config_file):
-            self._write_config("none", False)
-        with open(config_file, "r") as f:
-            config = json.load(f)
-        self.intent = config.get("intent", "none")
-        self.commercial_use = config.get("commercial_use", False)
+        self.intent, self.commercial_use = read_config()  # Invalid or unreadable config fails _check_license
 
-    def _write_config(self, intent, commercial_use):
-        config = {"intent": intent, "commercial_use": commercial_use}
-        with open("config/config.json", "w") as f:
-            json.dump(config, f, indent=4)
+    def _write_config(self, intent, commercial_use, config_file="config/config.json"):
+        write_config(intent, commercial_use, config_file)
 
     def _log_license_check(self, result):
-        with open("license_log.txt", "a") as f:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            f.write(f"[{timestamp}] License Check: {result}, Intent: {self.intent}, Commercial: {self.commercial_use}\n")
+        log_license_check(result, self.intent, self.commercial_use)
 
     def _check_license(self):
-        if self.intent not in ["educational", "commercial", "none"]:
-            notice = "NOTICE: Declare intent via config at github.com/tetrasurfaces/issues."
-            self._log_license_check(f"Failed: {notice}")
-            raise ValueError(notice)
-        if self.commercial_use and self.intent != "commercial":
-            notice = "Commercial use needs 'commercial' intent approval."
-            self._log_license_check(f"Failed: {notice}")
-            raise ValueError(notice)
-        self._log_license_check("Passed")
-        return True
+        return check_license(self.commercial_use, self.intent, allowed=VALID_INTENTS)
 
     async def _safety_check(self):
         self.tendon_load = np.random.rand() * 0.3
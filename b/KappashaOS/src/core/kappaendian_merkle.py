@@ -52,31 +52,61 @@
 import numpy as np
 import asyncio
 import hashlib
-from kappaendian_base import KappaEndianBase
+from bisect import bisect_right
+from src.core.kappaendian_base import KappaEndianBase
+from src.core.merkle_core import IncrementalMerkle, EMPTY_LEAF, leaf_hash, verify_proof
+from src.core.decay_wheel import shared_wheel
 
 class KappaEndianMerkle(KappaEndianBase):
-    def __init__(self, device_hash="kappa_merkle_001"):
+    def __init__(self, device_hash="kappa_merkle_001", wheel=None):
         super().__init__(device_hash)
         self.tree = {}
         self.node_count = 0
+        self.merkle = IncrementalMerkle()
+        self.wheel = wheel or shared_wheel()
+        self._decay_owner = self.wheel.register(self._decay_due)
+        self._order = []  # Live node ids, sorted (ids only ever grow)
 
     async def add_node(self, data, weight='left'):
         self._check_license()
         await self._safety_check()
+        self.wheel.advance()
         self.node_count += 1
-        kappa_hash = hashlib.sha256(data.encode() + str(self.node_count).encode()).hexdigest()
-        self.tree[self.node_count] = {"data": data, "hash": kappa_hash, "weight": weight}
+        digest = leaf_hash(data.encode() + str(self.node_count).encode())
+        kappa_hash = digest.hex()
+        self.tree[self.node_count] = {"data": data, "hash": kappa_hash, "weight": weight, "leaf": self.merkle.append(digest)}
+        self._order.append(self.node_count)
         if self.node_count > 9000:
-            await self._decay_node(self.node_count)
+            self._decay_node(self.node_count)
         print(f"Added node {self.node_count}, hash={kappa_hash[:8]}")
         return self.node_count
 
-    async def _decay_node(self, node_id):
+    def _decay_node(self, node_id):
         decay = 8 if self.node_count > 9000 else 11
-        await asyncio.sleep(decay * 3600)
-        if node_id in self.tree:
+        self.wheel.schedule(self._decay_owner, node_id, decay * 3600)
+
+    def _decay_due(self, node_ids):
+        decayed = [n for n in node_ids if n in self.tree]
+        for node_id in decayed:
+            self.merkle.update(self.tree[node_id]["leaf"], EMPTY_LEAF)
             del self.tree[node_id]
-            print(f"Decayed node {node_id}")
+        if decayed:
+            gone = set(decayed)
+            self._order = [n for n in self._order if n not in gone]  # One pass per batch
+            print(f"Decayed {len(decayed)} nodes")
+
+    def get_root(self):
+        """Return current Merkle root (hex)."""
+        return self.merkle.root().hex()
+
+    def prove(self, node_id):
+        """Inclusion proof for a node: list of (sibling_digest, sibling_is_left)."""
+        return self.merkle.proof(self.tree[node_id]["leaf"])
+
+    def verify(self, node_id, proof, root=None):
+        """Verify a node's proof against `root` (hex, defaults to the current root)."""
+        root = bytes.fromhex(root) if root else self.merkle.root()
+        return verify_proof(root, bytes.fromhex(self.tree[node_id]["hash"]), proof)
 
     async def traverse_tree(self, start_node):
         if start_node not in self.tree:
@@ -99,10 +129,13 @@ class KappaEndianMerkle(KappaEndianBase):
         return path
 
     def _next_node(self, current):
-        for node in sorted(self.tree.keys()):
-            if node > current and node % 2 == (current % 2) + 1:
-                return node
-        return None
+        # Pairing rule node % 2 == current % 2 + 1: only even nodes step, to the next live odd id
+        if current % 2:
+            return None
+        i = bisect_right(self._order, current)
+        while i < len(self._order) and self._order[i] % 2 == 0:
+            i += 1
+        return self._order[i] if i < len(self._order) else None
 
 if __name__ == "__main__":
     async def navi_test():
@@ -111,4 +144,5 @@ if __name__ == "__main__":
         node2 = await merkle.add_node("leaf1")
         path = await merkle.traverse_tree(node1)
         print(f"Traverse path: {path}")
+        print(f"Root {merkle.get_root()[:8]}, leaf {node2} proven={merkle.verify(node2, merkle.prove(node2))}")
     asyncio.run(navi_test())
@@ -0,0 +1,90 @@
+# Born free, feel good, have fun.
+
+# Dual License:
+# - For core software: AGPL-3.0-or-later licensed. -- xAI fork, 2025
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# - For hardware/embodiment interfaces: Licensed under the Apache License, Version 2.0
+# with xAI amendments for safety and physical use. See http://www.apache.org/licenses/LICENSE-2.0
+# for details, with the following xAI-specific terms appended.
+
+# Copyright 2025 xAI
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# SPDX-License-Identifier: Apache-2.0
+
+# xAI Amendments for Physical Use:
+# 1. Physical Embodiment Restrictions: Use with devices is for non-hazardous purposes only. Harmful mods are prohibited, with license revocable by xAI.
+# 2. Ergonomic Compliance: Limits tendon load to 20%, gaze to 30 seconds (ISO 9241-5).
+# 3. Safety Monitoring: Real-time tendon/gaze checks, logged for audit.
+# 4. Revocability: xAI may revoke for unethical use (e.g., surveillance).
+# 5. Export Controls: Sensor devices comply with US EAR Category 5 Part 2.
+# 6. Open Development: Hardware docs shared post-private phase.
+# 7. Ethical Resource Use and Operator Rights: No machine code output without breath consent; decay signals at 11 hours (8 for bumps).
+
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+
+# Born free, feel good, have fun.
+#!/usr/bin/env python3
+# lazy_module.py - Defer heavy imports (tensorflow, cv2, selenium, pyperf, matplotlib) to first attribute use.
+# Entry points (kappasha_os.py, nav3d.py, blocsym.py) import many modules that only touch these
+# for one conversion or a mock; binding them lazily keeps CLI startup inside the import budget
+# checked by benchmarks/import_time.py.
+
+import importlib
+import sys
+import types
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports the real module the first time an attribute is read."""
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = None
+
+    def _load(self):
+        module = self.__dict__['_lazy_target']
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__['_lazy_target'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__['_lazy_target'] is not None else "deferred"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+def lazy_module(name):
+    """Return the module if already imported, else a LazyModule that imports it on first use."""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+def is_loaded(module):
+    """True once a lazily bound module has actually been imported."""
+    return not isinstance(module, LazyModule) or module.__dict__['_lazy_target'] is not None
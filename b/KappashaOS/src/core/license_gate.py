@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# KappashaOS/src/core/license_gate.py
+# Dual License:
+# - For core software: AGPL-3.0-or-later licensed. -- xAI fork, 2025
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# - For hardware/embodiment interfaces: Licensed under the Apache License, Version 2.0
+# with xAI amendments for safety and physical use (prohibits misuse in weapons or hazardous applications;
+# requires ergonomic compliance; revocable for unethical use). See http://www.apache.org/licenses/LICENSE-2.0
+# for details, with the following xAI-specific terms appended.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# SPDX-License-Identifier: (AGPL-3.0-or-later) AND Apache-2.0
+#
+# xAI Amendments for Physical Use:
+# 1. Physical Embodiment Restrictions: Use with devices is for non-hazardous purposes only. Harmful mods are prohibited, with license revocable by xAI.
+# 2. Ergonomic Compliance: Limits tendon load to 20%, gaze to 30 seconds (ISO 9241-5).
+# 3. Safety Monitoring: Real-time tendon/gaze checks, logged for audit.
+# 4. Revocability: xAI may revoke for unethical use (e.g., surveillance).
+# 5. Export Controls: Sensor devices comply with US EAR Category 5 Part 2.
+# 6. Open Development: Hardware docs shared post-private phase.
+#
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+#
+# SPDX-License-Identifier: (AGPL-3.0-or-later) AND Apache-2.0
+# Shared license gate: cached config reads and a batched audit log, replacing the
+# per-module read_config/check_license/log_license_check copies.
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+CONFIG_FILE = "config/config.json"
+LOG_FILE = "license_log.txt"
+VALID_INTENTS = ["educational", "commercial", "none"]
+LICENSED_INTENTS = ("educational", "commercial")
+STAT_INTERVAL = 1.0  # Seconds between mtime checks of a cached config
+
+_config_cache = {}  # config path -> [checked_at, (mtime_ns, size), (intent, commercial_use)]
+_config_lock = threading.Lock()
+
+def _stamp(config_file):
+    st = os.stat(config_file)
+    return st.st_mtime_ns, st.st_size
+
+def _load_config(config_file):
+    """
+    Read intent and commercial use from config file with error handling (uncached).
+    A missing file gets the default ("none", False). An existing file is never rewritten:
+    an invalid intent is returned as-is and unreadable JSON as (None, False), so both fail the check.
+    """
+    config_dir = os.path.dirname(config_file)
+    if config_dir and not os.path.exists(config_dir):
+        os.makedirs(config_dir)
+    if not os.path.exists(config_file):
+        print(f"Config file {config_file} not found. Creating default.")
+        write_config("none", False, config_file)
+        return "none", False
+    try:
+        with open(config_file, "r") as f:
+            config = json.load(f)
+        intent = config.get("intent")
+        commercial_use = config.get("commercial_use", False)
+        if intent not in VALID_INTENTS:
+            print(f"Error: {config_file} has invalid intent {intent!r}.")
+        return intent, commercial_use
+    except json.JSONDecodeError:
+        print(f"Error: {config_file} contains invalid JSON.")
+        return None, False
+    except Exception as e:
+        print(f"Error reading {config_file}: {e}.")
+        return None, False
+
+def read_config(config_file=CONFIG_FILE):
+    """
+    Cached (intent, commercial_use) from the config file.
+    The file is parsed once; afterwards it is only stat'ed, at most every STAT_INTERVAL
+    seconds, and re-parsed when its mtime or size changes.
+    """
+    now = time.monotonic()
+    entry = _config_cache.get(config_file)
+    if entry is not None and now - entry[0] < STAT_INTERVAL:
+        return entry[2]
+    with _config_lock:
+        try:
+            stamp = _stamp(config_file)
+        except OSError:
+            stamp = None
+        if entry is not None and stamp == entry[1]:
+            entry[0] = now
+            return entry[2]
+        value = _load_config(config_file)
+        try:
+            stamp = _stamp(config_file)  # Loading may have rewritten the default
+        except OSError:
+            stamp = None
+        _config_cache[config_file] = [now, stamp, value]
+        return value
+
+def write_config(intent, commercial_use, config_file=CONFIG_FILE):
+    """Write intent and commercial use to config file with error handling."""
+    config = {"intent": intent, "commercial_use": commercial_use}
+    config_dir = os.path.dirname(config_file)
+    if config_dir and not os.path.exists(config_dir):
+        os.makedirs(config_dir)
+    try:
+        with open(config_file, "w") as f:
+            json.dump(config, f, indent=4)
+    except Exception as e:
+        print(f"Error writing to {config_file}: {e}")
+    _config_cache.pop(config_file, None)  # Next read re-parses
+
+class AuditLog:
+    """
+    Bounded in-memory buffer of license audit records, flushed in batches by a daemon thread.
+    Records are (time, result, intent, commercial_use) tuples formatted only at flush time.
+    When the buffer is full the oldest records are dropped and the drop count is logged.
+    """
+    def __init__(self, path=LOG_FILE, capacity=4096, batch_size=256, flush_interval=1.0):
+        self.path = os.path.abspath(path)
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer = deque(maxlen=capacity)
+        self.dropped = 0
+        self._wake = threading.Event()
+        self._write_lock = threading.Lock()
+        self._thread = None
+        atexit.register(self.flush)
+
+    def record(self, result, intent, commercial_use):
+        if len(self.buffer) == self.capacity:
+            self.dropped += 1
+        self.buffer.append((time.time(), result, intent, commercial_use))
+        if self._thread is None:
+            self._start()
+        elif len(self.buffer) >= self.batch_size:
+            self._wake.set()
+
+    def _start(self):
+        self._thread = threading.Thread(target=self._run, name="license-audit", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Write all buffered records in one append; returns the number written."""
+        with self._write_lock:
+            records = []
+            while self.buffer:
+                try:
+                    records.append(self.buffer.popleft())
+                except IndexError:
+                    break
+            dropped, self.dropped = self.dropped, 0
+            if not records and not dropped:
+                return 0
+            lines = []
+            if dropped:
+                lines.append(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Audit buffer full: dropped {dropped} records\n")
+            for t, result, intent, commercial_use in records:
+                timestamp = datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S")
+                lines.append(f"[{timestamp}] License Check: {result}, Intent: {intent}, Commercial: {commercial_use}\n")
+            try:
+                with open(self.path, "a") as f:
+                    f.writelines(lines)
+            except Exception as e:
+                print(f"Error logging license check: {e}")
+            return len(records)
+
+audit_log = AuditLog()
+
+def log_license_check(result, intent, commercial_use):
+    """Queue a license/revocation check result for the audit trail (no file I/O on the caller)."""
+    audit_log.record(result, intent, commercial_use)
+
+def flush_audit():
+    """Force buffered audit records to disk."""
+    return audit_log.flush()
+
+INTENT_NOTICE = """
+        NOTICE: You must declare your intent to use this software.
+        - For educational use (e.g., university training), open a GitHub issue at github.com/tetrasurfaces/issues using the Educational License Request template.
+        - For commercial use (e.g., branding, molding), use the Commercial License Request template.
+        See NOTICE.txt for details. Do not share proprietary details in public issues.
+        """
+COMMERCIAL_NOTICE = "Commercial use requires 'commercial' intent and a negotiated license via github.com/tetrasurfaces/issues."
+
+_verdicts = {}  # (intent, commercial_use, allowed) -> (audit result, error message or None)
+
+def _verdict(intent, commercial_use, allowed):
+    if intent not in allowed:
+        return "Failed: Invalid or missing intent", f"Invalid or missing intent. {INTENT_NOTICE}"
+    if commercial_use and intent != "commercial":
+        return "Failed: Commercial use without commercial intent", COMMERCIAL_NOTICE
+    return "Passed", None
+
+def check_license(commercial_use=False, intent=None, allowed=LICENSED_INTENTS):
+    """Ensure license compliance and intent declaration. The verdict is memoized; every call is audited."""
+    key = (intent, bool(commercial_use), tuple(allowed))
+    verdict = _verdicts.get(key)
+    if verdict is None:
+        verdict = _verdicts[key] = _verdict(intent, commercial_use, key[2])
+    result, error = verdict
+    log_license_check(result, intent, commercial_use)
+    if error:
+        raise ValueError(error)
+    return True
+
+def license_gate(config_file=CONFIG_FILE):
+    """Read the cached config and check it; returns (intent, commercial_use)."""
+    intent, commercial_use = read_config(config_file)
+    check_license(commercial_use, intent)
+    return intent, commercial_use
+
+if __name__ == "__main__":
+    write_config("educational", False)
+    license_gate()
+    start = time.perf_counter()
+    for _ in range(100000):
+        license_gate()
+    per_call = (time.perf_counter() - start) / 100000 * 1e6
+    print(f"License gate: {per_call:.2f} us/call, {flush_audit()} records flushed to {audit_log.path}")
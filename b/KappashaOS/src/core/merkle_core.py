@@ -0,0 +1,175 @@
+# merkle_core.py - Incremental Merkle engine with inclusion proofs, tribute to Ralph Merkle
+# Copyright 2025 xAI
+#
+# License: AGPL-3.0-or-later
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+#
+# Born free, feel good, have fun. Tribute to Ralph Merkle.
+import hashlib
+import numpy as np
+
+DIGEST = 32  # sha256
+EMPTY_LEAF = bytes(DIGEST)  # Tombstone for decayed leaves
+
+def leaf_hash(data):
+    """Domain-separated leaf hash (0x00 prefix) so a leaf can never pose as an inner node."""
+    if isinstance(data, str):
+        data = data.encode()
+    h = hashlib.sha256(b'\x00')
+    h.update(data)  # No prefix+data copy for large leaves; hashlib drops the GIL here
+    return h.digest()
+
+def node_hash(left, right):
+    """Domain-separated inner node hash (0x01 prefix)."""
+    return hashlib.sha256(b'\x01' + left + right).digest()
+
+class IncrementalMerkle:
+    """
+    Append/update Merkle tree that rehashes only the path from a changed leaf to the root.
+    Each level is one contiguous (capacity, 32) uint8 array grown by doubling; an unpaired
+    node at the end of a level is promoted unchanged, so appends stay O(log n) hashes.
+    """
+    def __init__(self, capacity=16):
+        self.size = 0
+        self.levels = [np.zeros((capacity, DIGEST), dtype=np.uint8)]
+        self.hash_count = 0  # Inner-node hashes computed, for benchmarks
+
+    def __len__(self):
+        return self.size
+
+    def _width(self, level):
+        """Number of live nodes on a level."""
+        return -(-self.size // (1 << level)) if self.size else 0
+
+    def _ensure(self, level, width):
+        if level == len(self.levels):
+            self.levels.append(np.zeros((max(width, 1), DIGEST), dtype=np.uint8))
+        arr = self.levels[level]
+        if width > len(arr):
+            grown = np.zeros((max(width, 2 * len(arr)), DIGEST), dtype=np.uint8)
+            grown[:len(arr)] = arr
+            self.levels[level] = grown
+
+    def _rehash_path(self, index):
+        """Recompute the parents of leaf `index` up to the root."""
+        level = 0
+        while self._width(level) > 1:
+            width = self._width(level)
+            pair = index ^ 1
+            nodes = self.levels[level]
+            if pair < width:
+                left, right = (index, pair) if index < pair else (pair, index)
+                parent = node_hash(nodes[left].tobytes(), nodes[right].tobytes())
+                self.hash_count += 1
+            else:
+                parent = nodes[index].tobytes()  # Promote unpaired node
+            index >>= 1
+            level += 1
+            self._ensure(level, self._width(level))
+            self.levels[level][index] = np.frombuffer(parent, dtype=np.uint8)
+
+    def append(self, digest):
+        """Append a 32-byte leaf digest; returns its leaf index."""
+        index = self.size
+        self.size += 1
+        self._ensure(0, self.size)
+        self.levels[0][index] = np.frombuffer(digest, dtype=np.uint8)
+        self._rehash_path(index)
+        return index
+
+    def update(self, index, digest):
+        """Replace leaf `index` (e.g. with EMPTY_LEAF on decay) and rehash its path."""
+        if not 0 <= index < self.size:
+            raise IndexError(f"leaf {index} out of range")
+        self.levels[0][index] = np.frombuffer(digest, dtype=np.uint8)
+        self._rehash_path(index)
+
+    def extend(self, digests):
+        """Bulk-load leaves, rebuilding affected levels bottom-up in O(n) hashes."""
+        digests = list(digests)
+        if not digests:
+            return
+        start = self.size
+        self.size += len(digests)
+        self._ensure(0, self.size)
+        self.levels[0][start:self.size] = np.frombuffer(b''.join(digests), dtype=np.uint8).reshape(-1, DIGEST)
+        level, lo = 0, start
+        while self._width(level) > 1:
+            width = self._width(level)
+            self._ensure(level + 1, self._width(level + 1))
+            nodes, parents = self.levels[level], self.levels[level + 1]
+            for p in range(lo >> 1, -(-width // 2)):
+                if 2 * p + 1 < width:
+                    parents[p] = np.frombuffer(node_hash(nodes[2 * p].tobytes(), nodes[2 * p + 1].tobytes()), dtype=np.uint8)
+                    self.hash_count += 1
+                else:
+                    parents[p] = nodes[2 * p]
+            level, lo = level + 1, lo >> 1
+
+    def leaf(self, index):
+        return self.levels[0][index].tobytes()
+
+    def root(self):
+        """Root digest (bytes); empty tree hashes to EMPTY_LEAF."""
+        if not self.size:
+            return EMPTY_LEAF
+        level = 0
+        while self._width(level) > 1:
+            level += 1
+        return self.levels[level][0].tobytes()
+
+    def proof(self, index):
+        """
+        Inclusion proof for leaf `index`.
+        Returns: list of (sibling_digest, sibling_is_left); promoted levels are skipped.
+        """
+        if not 0 <= index < self.size:
+            raise IndexError(f"leaf {index} out of range")
+        path, level = [], 0
+        while self._width(level) > 1:
+            pair = index ^ 1
+            if pair < self._width(level):
+                path.append((self.levels[level][pair].tobytes(), pair < index))
+            index >>= 1
+            level += 1
+        return path
+
+def verify_proof(root, digest, proof):
+    """Check an inclusion proof from IncrementalMerkle.proof against a root."""
+    node = digest
+    for sibling, sibling_is_left in proof:
+        node = node_hash(sibling, node) if sibling_is_left else node_hash(node, sibling)
+    return node == root
+
+def merkle_root(digests):
+    """Reference full rebuild of the root, same shape as IncrementalMerkle."""
+    level = list(digests)
+    if not level:
+        return EMPTY_LEAF
+    while len(level) > 1:
+        level = [node_hash(level[i], level[i + 1]) if i + 1 < len(level) else level[i] for i in range(0, len(level), 2)]
+    return level[0]
+
+if __name__ == "__main__":
+    tree = IncrementalMerkle()
+    leaves = [leaf_hash(f"plant{i}") for i in range(11)]
+    for d in leaves:
+        tree.append(d)
+    assert tree.root() == merkle_root(leaves)
+    proof = tree.proof(6)
+    print(f"Navi: root={tree.root().hex()[:8]}, proof for leaf 6 has {len(proof)} siblings, valid={verify_proof(tree.root(), leaves[6], proof)}")
+    tree.update(3, EMPTY_LEAF)
+    print(f"Navi: decayed leaf 3, root={tree.root().hex()[:8]}")
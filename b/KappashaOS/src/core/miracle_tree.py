@@ -22,18 +22,24 @@ import numpy as np
 import asyncio
 import hashlib
 from src.core.hal9001 import hal9001, heat_spike  # Import hal9001 for heat_spike
+from src.core.merkle_core import IncrementalMerkle, EMPTY_LEAF, leaf_hash, verify_proof
+from src.core.decay_wheel import shared_wheel
 
 class MiracleTree:
-    def __init__(self, grid_size=10):
+    def __init__(self, grid_size=10, wheel=None):
         self.root = None
         self.nodes = {}
         self.node_count = 0
+        self.merkle = IncrementalMerkle()  # Leaf per planted node, O(log n) rehash per change
+        self.wheel = wheel or shared_wheel()  # Decay deadlines, shared across trees
+        self._decay_owner = self.wheel.register(self._decay_due)
         self.grid_size = grid_size
         self.grid = np.zeros((grid_size, grid_size, grid_size), dtype=float)  # Tetrahedral base
         print("MiracleTree initialized - Dynamic kappa-hash Merkle tree with tetrahedral grid ready.")
 
     async def plant_node(self, data, x=0, y=0, z=0, heat_spike_func=heat_spike):
         try:
+            self.wheel.advance()  # Fire any decays that came due
             breath_rate = 15  # Placeholder value
             if breath_rate > 20:
                 print("Navi: Breath rate high, pausing plant.")
@@ -49,12 +55,14 @@ class MiracleTree:
                    y + np.sin(theta * self.node_count) * 0.5,
                    z + theta / (2 * np.pi))
             pos = tuple(int(p * self.grid_size) % self.grid_size for p in pos)
-            kappa_hash = hashlib.sha256(data.encode() + str(breath_rate).encode() + str(pos).encode()).hexdigest()
+            digest = leaf_hash(data.encode() + str(breath_rate).encode() + str(pos).encode())
+            kappa_hash = digest.hex()
             regret = "left" if self.node_count % 2 == 0 else "right"  # Regret weighting
             self.nodes[self.node_count] = {
                 "data": data,
                 "hash": kappa_hash,
                 "parent": self.root,
+                "leaf": self.merkle.append(digest),
                 "pos": pos,
                 "regret": regret,
                 "delay": 0.4 if regret == "left" else 0.6  # Green center, violet regret
@@ -65,7 +73,7 @@ class MiracleTree:
             else:
                 await self._grow_tree(self.root, self.node_count)
             if self.node_count > 9000:
-                await self._decay_node(self.node_count)
+                self._decay_node(self.node_count)
             print(f"Navi: Planted node {self.node_count} at {pos}, hash={kappa_hash[:8]}, regret={regret}")
             return self.node_count
         except Exception as e:
@@ -74,27 +82,47 @@ class MiracleTree:
 
     async def _grow_tree(self, parent, child):
         try:
-            parent_node = self.nodes[parent]
             child_node = self.nodes[child]
-            combined_hash = hashlib.sha256(parent_node["hash"].encode() + child_node["hash"].encode()).hexdigest()
-            parent_node["hash"] = combined_hash
             child_node["parent"] = parent
             self.grid[child_node["pos"]] += 0.1  # Deepen grid
-            print(f"Navi: Grew tree, new hash={combined_hash[:8]}")
+            print(f"Navi: Grew tree, new root={self.get_root()[:8]}")  # Leaf already folded in by append
         except Exception as e:
             print(f"Navi: Grow tree error: {e}")
 
-    async def _decay_node(self, node_id):
+    def get_root(self):
+        """Return current Merkle root (hex)."""
+        return self.merkle.root().hex()
+
+    def prove(self, node_id):
+        """Inclusion proof for a planted node: list of (sibling_digest, sibling_is_left)."""
+        return self.merkle.proof(self.nodes[node_id]["leaf"])
+
+    def verify(self, node_id, proof, root=None):
+        """Verify a node's proof against `root` (hex, defaults to the current root)."""
+        root = bytes.fromhex(root) if root else self.merkle.root()
+        return verify_proof(root, bytes.fromhex(self.nodes[node_id]["hash"]), proof)
+
+    def _decay_node(self, node_id):
+        """Schedule decay after 11 hours (8 for bumps) on the wheel; does not block planting."""
+        decay = 8 if self.node_count > 9000 else 11
+        self.wheel.schedule(self._decay_owner, node_id, decay * 3600)
+
+    def _decay_due(self, node_ids):
+        """Wheel callback: decay a batch of due nodes."""
         try:
-            decay = 8 if self.node_count > 9000 else 11
-            await asyncio.sleep(decay * 3600)
-            if node_id in self.nodes:
+            decayed = 0
+            for node_id in node_ids:
+                if node_id not in self.nodes:
+                    continue
                 pos = self.nodes[node_id]["pos"]
+                self.merkle.update(self.nodes[node_id]["leaf"], EMPTY_LEAF)  # Tombstone, path-only rehash
                 del self.nodes[node_id]
                 self.grid[pos] = 0
                 if self.root == node_id:
                     self.root = None
-                print(f"Navi: Decayed node {node_id} at {pos}")
+                decayed += 1
+            if decayed:
+                print(f"Navi: Decayed {decayed} nodes, root={self.get_root()[:8]}")
         except Exception as e:
             print(f"Navi: Decay error: {e}")
 
@@ -105,10 +133,9 @@ class MiracleTree:
                 return []
             path = [start_node]
             current = start_node
+            kappa_hash = hashlib.sha256(self.grid.tobytes()).hexdigest()  # Grid is unchanged during the walk
             while current in self.nodes:
                 node = self.nodes[current]
-                grid = np.copy(self.grid)  # Local grid copy
-                kappa_hash = hashlib.sha256(grid.tobytes()).hexdigest()
                 print(f"Navi: Traversed to {current} at {node['pos']}, hash={kappa_hash[:8]}, delay={node['delay']:.1f}")
                 if hal9001.heat_spike():  # Use hal9001.heat_spike
                     print("Navi: Hush—traversal paused due to heat spike.")
@@ -128,4 +155,6 @@ if __name__ == "__main__":
         node2 = await tree.plant_node("leaf1", 6, 6, 6)
         path = await tree.traverse_tree(node1)
         print(f"Navi: Traverse path: {path}")
+        if node2 > 0:
+            print(f"Navi: root={tree.get_root()[:8]}, leaf {node2} proven={tree.verify(node2, tree.prove(node2))}")
     asyncio.run(navi_test())
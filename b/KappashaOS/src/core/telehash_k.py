@@ -53,8 +53,6 @@
 # Born free, feel good, have fun.
 
 import numpy as np
-import tensorflow as tf
-import cv2
 import hashlib
 from greenlet import greenlet
 from typing import Tuple, Optional
@@ -63,9 +61,10 @@ import multiprocessing as mp
 from queue import Empty
 import time
 import math
-import os
-import json
-from datetime import datetime
+from bisect import bisect_right
+from src.core.merkle_core import IncrementalMerkle, EMPTY_LEAF, leaf_hash
+from src.core.decay_wheel import shared_wheel
+from src.core.license_gate import read_config, write_config, log_license_check, check_license
 
 # Mock dependencies
 class XApi:
@@ -78,10 +77,13 @@ class hal9001:
         return np.random.rand() > 0.95  # Mock heat check
 
 class MiracleTree:
-    def __init__(self):
+    def __init__(self, wheel=None):
         self.root = None
         self.nodes = {}
         self.node_count = 0
+        self.merkle = IncrementalMerkle()  # O(log n) rehash per plant/decay
+        self.wheel = wheel or shared_wheel()  # Decay deadlines, no sleeping coroutine per node
+        self._decay_owner = self.wheel.register(self._decay_due)
 
     async def plant_node(self, data: str, breath_rate: float) -> int:
         """Plant node with kappa hash, breath-signed."""
@@ -89,40 +91,97 @@ class MiracleTree:
             print("Nav3d: Breath high or heat spike, pausing.")
             await asyncio.sleep(2.0)
             return -1
+        self.wheel.advance()
         self.node_count += 1
-        kappa_hash = hashlib.sha256(data.encode() + str(breath_rate).encode()).hexdigest()
-        self.nodes[self.node_count] = {"data": data, "hash": kappa_hash, "parent": self.root}
+        digest = leaf_hash(data.encode() + str(breath_rate).encode())
+        kappa_hash = digest.hex()
+        self.nodes[self.node_count] = {"data": data, "hash": kappa_hash, "parent": self.root, "leaf": self.merkle.append(digest)}
         if self.root is None:
             self.root = self.node_count
-        else:
-            parent_hash = self.nodes[self.root]["hash"]
-            combined_hash = hashlib.sha256((parent_hash + kappa_hash).encode()).hexdigest()
-            self.nodes[self.root]["hash"] = combined_hash
-            self.nodes[self.node_count]["parent"] = self.root
         if self.node_count > 9000:
-            await self._decay_node(self.node_count)
+            self._decay_node(self.node_count)
         print(f"Nav3d: Planted node {self.node_count}, hash={kappa_hash[:8]}")
         return self.node_count
 
-    async def _decay_node(self, node_id: int):
-        """Decay node after 11h (8h for bumps)."""
+    def _decay_node(self, node_id: int):
+        """Schedule decay after 11h (8h for bumps)."""
         decay = 8 if self.node_count > 9000 else 11
-        await asyncio.sleep(decay * 3600)
-        if node_id in self.nodes:
+        self.wheel.schedule(self._decay_owner, node_id, decay * 3600)
+
+    def _decay_due(self, node_ids):
+        """Wheel callback: decay a batch of due nodes."""
+        decayed = [n for n in node_ids if n in self.nodes]
+        for node_id in decayed:
+            self.merkle.update(self.nodes[node_id]["leaf"], EMPTY_LEAF)
             del self.nodes[node_id]
             if self.root == node_id:
                 self.root = None
-            print(f"Nav3d: Decayed node {node_id}")
+        if decayed:
+            print(f"Nav3d: Decayed {len(decayed)} nodes")
 
     async def get_root(self) -> str:
         """Return current Merkle root."""
-        return self.nodes[self.root]["hash"] if self.root else ""
+        return self.merkle.root().hex() if self.merkle.size else ""
+
+class KappaEndianBase:
+    def __init__(self, device_hash="kappa_endian_001"):
+        self.tendon_load = 0.0
+        self.gaze_duration = 0.0
+        self.device_hash = device_hash
+        self._setup_config()
+
+    def _setup_config(self):
+        self.intent, self.commercial_use = read_config()  # Invalid or unreadable config fails _check_license
+
+    def _write_config(self, intent, commercial_use, config_file="config/config.json"):
+        write_config(intent, commercial_use, config_file)
+
+    def _log_license_check(self, result):
+        log_license_check(result, self.intent, self.commercial_use)
+
+    def _check_license(self):
+        return check_license(self.commercial_use, self.intent)
+
+    async def _safety_check(self):
+        self.tendon_load = np.random.rand() * 0.3
+        self.gaze_duration += 1.0 / 60 if np.random.rand() > 0.7 else 0.0
+        if self.tendon_load > 0.2:
+            print("Nav3d: Warning - Tendon overload. Resetting.")
+            self.reset()
+        if self.gaze_duration > 30.0:
+            print("Nav3d: Warning - Excessive gaze. Pausing.")
+            await asyncio.sleep(2.0)
+            self.gaze_duration = 0.0
+        await asyncio.sleep(0)
+
+    def reset(self):
+        self.tendon_load = 0.0
+        self.gaze_duration = 0.0
+
+    async def reverse_toggle(self, grid: np.ndarray, weight: str):
+        """Reverse grid endian with kappa tilt."""
+        try:
+            self._check_license()
+            await self._safety_check()
+            if weight == 'left':
+                return np.flip(grid, axis=0)  # Left-weighted reverse
+            elif weight == 'right':
+                return np.flip(grid, axis=1)  # Right-weighted reverse
+            else:
+                return np.flip(grid, axis=2)  # Balanced reverse
+        except Exception as e:
+            print(f"Nav3d: Reverse toggle error: {e}")
+            return grid
 
 class KappaEndianMerkle(KappaEndianBase):
-    def __init__(self, device_hash="kappa_merkle_001"):
+    def __init__(self, device_hash="kappa_merkle_001", wheel=None):
         super().__init__(device_hash)
         self.tree = {}
         self.node_count = 0
+        self.merkle = IncrementalMerkle()
+        self.wheel = wheel or shared_wheel()
+        self._decay_owner = self.wheel.register(self._decay_due)
+        self._order = []  # Live node ids, sorted
         print("KappaEndianMerkle initialized - Merkle-inspired tree traversal ready.")
 
     async def add_node(self, data, weight='left'):
@@ -130,24 +189,35 @@ class KappaEndianMerkle(KappaEndianBase):
         try:
             self._check_license()
             await self._safety_check()
+            self.wheel.advance()
             self.node_count += 1
-            kappa_hash = hashlib.sha256(data.encode()).hexdigest()
-            self.tree[self.node_count] = {"data": data, "hash": kappa_hash, "weight": weight}
+            digest = leaf_hash(data)
+            kappa_hash = digest.hex()
+            self.tree[self.node_count] = {"data": data, "hash": kappa_hash, "weight": weight, "leaf": self.merkle.append(digest)}
+            self._order.append(self.node_count)
             if self.node_count > 9000:
-                await self._decay_node(self.node_count)
+                self._decay_node(self.node_count)
             print(f"Nav3d: Added node {self.node_count}, hash={kappa_hash[:8]}")
             return self.node_count
         except Exception as e:
             print(f"Nav3d: Add node error: {e}")
             return -1
 
-    async def _decay_node(self, node_id: int):
-        """Decay node after 11 hours (8 for bumps)."""
+    def _decay_node(self, node_id: int):
+        """Schedule decay after 11 hours (8 for bumps)."""
         decay = 8 if self.node_count > 9000 else 11
-        await asyncio.sleep(decay * 3600)
-        if node_id in self.tree:
+        self.wheel.schedule(self._decay_owner, node_id, decay * 3600)
+
+    def _decay_due(self, node_ids):
+        """Wheel callback: decay a batch of due nodes."""
+        decayed = [n for n in node_ids if n in self.tree]
+        for node_id in decayed:
+            self.merkle.update(self.tree[node_id]["leaf"], EMPTY_LEAF)
             del self.tree[node_id]
-            print(f"Nav3d: Decayed node {node_id}")
+        if decayed:
+            gone = set(decayed)
+            self._order = [n for n in self._order if n not in gone]
+            print(f"Nav3d: Decayed {len(decayed)} nodes")
 
     async def traverse_tree(self, start_node):
         """Traverse Merkle tree, reversing grids as needed."""
@@ -176,100 +246,13 @@ class KappaEndianMerkle(KappaEndianBase):
             return []
 
     def _next_node(self, current):
-        """Determine next node (Merkle-style pairing)."""
-        for node in sorted(self.tree.keys()):
-            if node > current and node % 2 == (current % 2) + 1:
-                return node
-        return None
-
-class KappaEndianBase:
-    def __init__(self, device_hash="kappa_endian_001"):
-        self.tendon_load = 0.0
-        self.gaze_duration = 0.0
-        self.device_hash = device_hash
-        self._setup_config()
-
-    def _setup_config(self):
-        config_file = "config/config.json"
-        config_dir = os.path.dirname(config_file)
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir)
-        if not os.path.exists(config_file):
-            self._write_config("none", False, config_file)
-        try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
-            self.intent = config.get("intent")
-            self.commercial_use = config.get("commercial_use", False)
-            if self.intent not in ["educational", "commercial", "none"]:
-                raise ValueError("Invalid intent in config.")
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"Nav3d: Config error: {e}. Resetting to default.")
-            self._write_config("none", False, config_file)
-            self.intent = "none"
-            self.commercial_use = False
-
-    def _write_config(self, intent, commercial_use, config_file="config/config.json"):
-        config = {"intent": intent, "commercial_use": commercial_use}
-        config_dir = os.path.dirname(config_file)
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir)
-        try:
-            with open(config_file, "w") as f:
-                json.dump(config, f, indent=4)
-        except Exception as e:
-            print(f"Nav3d: Config write error: {e}")
-
-    def _log_license_check(self, result):
-        try:
-            with open("license_log.txt", "a") as f:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"[{timestamp}] License Check: {result}, Intent: {self.intent}, Commercial: {self.commercial_use}\n")
-        except Exception as e:
-            print(f"Nav3d: License log error: {e}")
-
-    def _check_license(self):
-        if self.intent not in ["educational", "commercial"]:
-            notice = "NOTICE: Declare intent via config (educational/commercial) at github.com/tetrasurfaces/issues."
-            self._log_license_check(f"Failed: {notice}")
-            raise ValueError(notice)
-        if self.commercial_use and self.intent != "commercial":
-            notice = "Commercial use needs 'commercial' intent and license approval."
-            self._log_license_check(f"Failed: {notice}")
-            raise ValueError(notice)
-        self._log_license_check("Passed")
-        return True
-
-    async def _safety_check(self):
-        self.tendon_load = np.random.rand() * 0.3
-        self.gaze_duration += 1.0 / 60 if np.random.rand() > 0.7 else 0.0
-        if self.tendon_load > 0.2:
-            print("Nav3d: Warning - Tendon overload. Resetting.")
-            self.reset()
-        if self.gaze_duration > 30.0:
-            print("Nav3d: Warning - Excessive gaze. Pausing.")
-            await asyncio.sleep(2.0)
-            self.gaze_duration = 0.0
-        await asyncio.sleep(0)
-
-    def reset(self):
-        self.tendon_load = 0.0
-        self.gaze_duration = 0.0
-
-    async def reverse_toggle(self, grid: np.ndarray, weight: str):
-        """Reverse grid endian with kappa tilt."""
-        try:
-            self._check_license()
-            await self._safety_check()
-            if weight == 'left':
-                return np.flip(grid, axis=0)  # Left-weighted reverse
-            elif weight == 'right':
-                return np.flip(grid, axis=1)  # Right-weighted reverse
-            else:
-                return np.flip(grid, axis=2)  # Balanced reverse
-        except Exception as e:
-            print(f"Nav3d: Reverse toggle error: {e}")
-            return grid
+        """Determine next node (Merkle-style pairing): even nodes step to the next live odd id."""
+        if current % 2:
+            return None
+        i = bisect_right(self._order, current)
+        while i < len(self._order) and self._order[i] % 2 == 0:
+            i += 1
+        return self._order[i] if i < len(self._order) else None
 
 class BlockclockspeedFleet:
     def __init__(self, fleet_size=256):
@@ -372,13 +355,12 @@ def deepen_layer(layer):
     time.sleep(0.1)  # Mock work
     return np.sin(layer) * 0.5  # Mock curvature
 
-# Test integrate
-layer = np.random.rand(10, 10)
-h = TeleHashlet(deepen_layer, layer)
-result, rgb_hex = h.switch()
-print(f"Deepened layer mean {result.mean():.2f}, RGB hex {rgb_hex}")
-
 def main():
+    # Test integrate
+    layer = np.random.rand(10, 10)
+    h = TeleHashlet(deepen_layer)
+    result, rgb_hex = h.switch(layer)
+    print(f"Deepened layer mean {result.mean():.2f}, RGB hex {rgb_hex}")
     fleet = BlockclockspeedFleet()
     asyncio.run(fleet.node_loop(0))  # Run one node for test
 
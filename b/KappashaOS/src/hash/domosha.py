@@ -52,13 +52,16 @@
 # domosha.py - Dōmo secure hashing w/ eclipse/H-metric, FluxPad safety, daisy Muse lenses for KappashaOS.
 # Tensor in, thank you whisper, rhombus grid out—kappa-curved, no zeros.
 
+from __future__ import annotations  # tf.Tensor hints must not import TensorFlow
 import numpy as np
-import tensorflow as tf
 import hashlib
-import matplotlib.pyplot as plt
+from src.core.lazy_module import lazy_module
 from hardware.lens.muse import mersenne_gaussian_packet, collapse_wavepacket, weave_kappa_blades, amusement_factor
 from typing import Tuple
 
+tf = lazy_module('tensorflow')  # Only the tensor flux paths need it
+plt = lazy_module('matplotlib.pyplot')
+
 class FluxPad:
     def __init__(self):
         self.tendon_load = 0.0
@@ -168,9 +171,13 @@ class Domosha:
             flux += lens_flux
         return flux
 
-    def hashlet(self, note: str, state: str='e') -> Tuple[np.ndarray, str, str]:
+    def hashlet(self, note: str, state: str='e', data: np.ndarray=None) -> Tuple[np.ndarray, str, str]:
+        """Pure NumPy: data (array or tensor) is folded into the hash as raw bytes."""
         grid = self.nerkology(self.grid)
-        hash_val = hashlib.sha3_256(f"{note}:{grid.tobytes()}".encode()).hexdigest()
+        payload = f"{note}:{grid.tobytes()}".encode()
+        if data is not None:
+            payload += np.ascontiguousarray(np.asarray(data)).tobytes()
+        hash_val = hashlib.sha3_256(payload).hexdigest()
         return grid, f"~{note}", hash_val
 
     def simulate_daisy_chain(self, tensor: tf.Tensor, state: str='e') -> tf.Tensor:
@@ -0,0 +1,117 @@
+# Dual License:
+# - For core software: AGPL-3.0-or-later licensed. -- xAI fork, 2025
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# - For hardware/embodiment interfaces (if any): Licensed under the Apache License, Version 2.0
+#   with xAI amendments for safety and physical use (prohibits misuse in weapons or hazardous applications;
+#   requires ergonomic compliance; revocable for unethical use). See http://www.apache.org/licenses/LICENSE-2.0
+#   for details, with the following xAI-specific terms appended.
+#
+# Copyright 2025 xAI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# SPDX-License-Identifier: Apache-2.0
+#
+# xAI Amendments for Physical Use:
+# 1. **Physical Embodiment Restrictions**: Use with devices is for non-hazardous purposes only. Harmful mods are prohibited, with license revocable by xAI.
+# 2. **Ergonomic Compliance**: Limits tendon load to 20%, gaze to 30 seconds (ISO 9241-5).
+# 3. **Safety Monitoring**: Real-time tendon/gaze checks, logged for audit.
+# 4. **Revocability**: xAI may revoke for unethical use (e.g., surveillance).
+# 5. **Export Controls**: Sensor devices comply with US EAR Category 5 Part 2.
+# 6. **Open Development**: Hardware docs shared post-private phase.
+#
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+
+import os
+import sys
+import numpy as np
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'hardware', 'proto'))
+
+import arch_utils
+from src.core import license_gate
+
+@pytest.fixture
+def licensed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(license_gate, "_config_cache", {})
+    monkeypatch.setattr(license_gate.audit_log, "path", str(tmp_path / "license_log.txt"))
+    license_gate.write_config("educational", False)
+    yield tmp_path
+    license_gate.flush_audit()
+
+def fibonacci_sphere(n, radius):
+    i = np.arange(n) + 0.5
+    phi = np.arccos(1 - 2 * i / n)
+    theta = np.pi * (1 + 5 ** 0.5) * i
+    return radius * np.column_stack([np.cos(theta) * np.sin(phi), np.sin(theta) * np.sin(phi), np.cos(phi)])
+
+def test_etch_matches_per_point_loop(licensed):
+    """The vectorized etch offsets z exactly like the original per-point loop."""
+    points = np.random.default_rng(0).random((500, 3))
+    expected = points.copy()
+    for i in range(len(expected)):
+        expected[i, 2] += np.sin(i * 0.8 + 1.25) * 0.02 * 0.5
+    mesh = {"points": points.tolist()}
+    assert arch_utils.apply_tetra_etch(mesh, depth=0.02, hash_val=1.25) == 1.25
+    assert np.array_equal(mesh["points"], expected)
+
+def test_etch_phase_from_hex_digest(licensed):
+    mesh = {"points": np.zeros((4, 3))}
+    arch_utils.apply_tetra_etch(mesh, depth=2.0, hash_val="ffffffff" + "0" * 56)
+    assert np.allclose(mesh["points"][:, 2], np.sin(np.arange(4) * 0.8 + 2 * np.pi))
+
+def test_surface_digest_quantizes_points():
+    points = np.round(np.random.default_rng(1).random((100, 3)), 6)
+    digest = arch_utils.surface_digest(points)
+    assert len(digest) == 32
+    assert arch_utils.surface_digest(points + 1e-8) == digest
+    assert arch_utils.surface_digest(points + 1e-5) != digest
+    assert arch_utils.surface_digest(arch_utils.mesh_points({"points": points.tolist()})) == digest
+    assert arch_utils.surface_digest(points, precision=3) != digest
+
+def test_curvature_of_sampled_circle():
+    """Menger curvature of points on a circle is 1 / radius away from the ends."""
+    t = np.linspace(0, np.pi, 200)
+    kappa = arch_utils.discrete_curvature(np.column_stack([2 * np.cos(t), 2 * np.sin(t), np.zeros_like(t)]))
+    assert kappa[0] == kappa[-1] == 0
+    assert np.allclose(kappa[1:-1], 0.5)
+
+def test_curvature_of_sphere_mesh():
+    """Cotangent-Laplacian mean curvature of a triangulated sphere is about 1 / radius."""
+    spatial = pytest.importorskip("scipy.spatial")
+    points = fibonacci_sphere(2000, 3.0)
+    faces = spatial.ConvexHull(points).simplices
+    kappa = arch_utils.discrete_curvature({"points": points, "faces": faces})
+    assert abs(np.median(kappa) - 1 / 3.0) < 0.01
+
+def test_gated_calls_audit_every_call(licensed):
+    mesh = {"points": fibonacci_sphere(50, 1.0)}
+    for _ in range(3):
+        arch_utils.calc_live_kappa(mesh)
+    license_gate.flush_audit()
+    assert len((licensed / "license_log.txt").read_text().splitlines()) == 3
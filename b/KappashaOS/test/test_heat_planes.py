@@ -0,0 +1,87 @@
+# Dual License:
+# - For core software: AGPL-3.0-or-later licensed. -- xAI fork, 2025
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# - For hardware/embodiment interfaces (if any): Licensed under the Apache License, Version 2.0
+#   with xAI amendments for safety and physical use (prohibits misuse in weapons or hazardous applications;
+#   requires ergonomic compliance; revocable for unethical use). See http://www.apache.org/licenses/LICENSE-2.0
+#   for details, with the following xAI-specific terms appended.
+#
+# Copyright 2025 xAI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# SPDX-License-Identifier: Apache-2.0
+#
+# xAI Amendments for Physical Use:
+# 1. **Physical Embodiment Restrictions**: Use with devices is for non-hazardous purposes only. Harmful mods are prohibited, with license revocable by xAI.
+# 2. **Ergonomic Compliance**: Limits tendon load to 20%, gaze to 30 seconds (ISO 9241-5).
+# 3. **Safety Monitoring**: Real-time tendon/gaze checks, logged for audit.
+# 4. **Revocability**: xAI may revoke for unethical use (e.g., surveillance).
+# 5. **Export Controls**: Sensor devices comply with US EAR Category 5 Part 2.
+# 6. **Open Development**: Hardware docs shared post-private phase.
+#
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'interfaces')))
+
+from heat_planes import HeatField
+
+def full_field(grid_size, positions, intensities, falloff=2.0):
+    """Untruncated exp(-d/falloff) sum over the whole grid, one event at a time."""
+    raw = np.zeros((grid_size,) * 3)
+    index = np.indices(raw.shape)
+    for position, intensity in zip(positions, intensities):
+        cell = (position * (grid_size - 1)).astype(int)
+        dist = np.linalg.norm(index - cell[:, None, None, None], axis=0)
+        raw += intensity * np.exp(-dist / falloff)
+    return raw
+
+@pytest.mark.parametrize("grid_size", [3, 10, 20])
+def test_truncated_kernel_matches_full_field(grid_size):
+    """Per event, the truncated stamp stays within the cutoff of the full kernel."""
+    rng = np.random.default_rng(grid_size)
+    positions, intensities = rng.random((40, 3)), rng.random(40)
+    field = HeatField(grid_size, falloff=2.0, cutoff=1e-3)
+    field.add(positions, intensities)
+    error = np.abs(field.raw - full_field(grid_size, positions, intensities))
+    assert error.max() <= 1e-3 * intensities.sum()
+    single = HeatField(grid_size)
+    single.add(positions[:1], intensities[:1])
+    assert np.abs(single.raw - full_field(grid_size, positions[:1], intensities[:1])).max() < 1e-3
+
+def test_chunked_add_matches_single_pass():
+    """Stamping in small chunks gives the same field as one pass."""
+    rng = np.random.default_rng(1)
+    positions, intensities = rng.random((300, 3)), rng.random(300)
+    whole = HeatField(16)
+    whole.add(positions, intensities)
+    chunked = HeatField(16)
+    chunked.CHUNK_TARGETS = len(chunked._offsets) * 7
+    chunked.add(positions, intensities)
+    assert np.allclose(whole.raw, chunked.raw)
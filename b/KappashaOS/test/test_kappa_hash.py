@@ -0,0 +1,101 @@
+# Dual License:
+# - For core software: AGPL-3.0-or-later licensed. -- xAI fork, 2025
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# - For hardware/embodiment interfaces (if any): Licensed under the Apache License, Version 2.0
+#   with xAI amendments for safety and physical use (prohibits misuse in weapons or hazardous applications;
+#   requires ergonomic compliance; revocable for unethical use). See http://www.apache.org/licenses/LICENSE-2.0
+#   for details, with the following xAI-specific terms appended.
+#
+# Copyright 2025 xAI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# SPDX-License-Identifier: Apache-2.0
+#
+# xAI Amendments for Physical Use:
+# 1. **Physical Embodiment Restrictions**: Use with devices is for non-hazardous purposes only. Harmful mods are prohibited, with license revocable by xAI.
+# 2. **Ergonomic Compliance**: Limits tendon load to 20%, gaze to 30 seconds (ISO 9241-5).
+# 3. **Safety Monitoring**: Real-time tendon/gaze checks, logged for audit.
+# 4. **Revocability**: xAI may revoke for unethical use (e.g., surveillance).
+# 5. **Export Controls**: Sensor devices comply with US EAR Category 5 Part 2.
+# 6. **Open Development**: Hardware docs shared post-private phase.
+#
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+
+import os
+import sys
+import numpy as np
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'hardware'))
+
+from proto.kappa_hash import SnapshotTree
+from src.core.merkle_core import leaf_hash, merkle_root
+
+LEAF = 64
+
+def fresh_root(path):
+    return SnapshotTree(LEAF, workers=2).update(str(path))
+
+def test_root_uses_merkle_core(tmp_path):
+    path = tmp_path / "snap.bin"
+    data = bytes(range(256)) * 3
+    path.write_bytes(data)
+    leaves = [leaf_hash(data[i:i + LEAF]) for i in range(0, len(data), LEAF)]
+    assert fresh_root(path) == merkle_root(leaves)
+
+@pytest.mark.parametrize("seed", range(8))
+def test_dirty_updates_and_resizes_match_full_rehash(tmp_path, seed):
+    """Random in-place edits, truncations and appends with dirty ranges give the from-scratch root."""
+    rng = np.random.default_rng(seed)
+    path = tmp_path / "snap.bin"
+    data = bytearray(rng.integers(0, 256, int(rng.integers(1, 2000)), dtype=np.uint8).tobytes())
+    path.write_bytes(data)
+    tree = SnapshotTree(LEAF, workers=2)
+    tree.update(str(path))
+    for _ in range(20):
+        dirty = []
+        op = rng.integers(3)
+        if op == 0 and data:  # Overwrite a span in place
+            start = int(rng.integers(len(data)))
+            end = min(len(data), start + int(rng.integers(1, 200)))
+            data[start:end] = rng.integers(0, 256, end - start, dtype=np.uint8).tobytes()
+            dirty.append((start, end))
+        elif op == 1:  # Truncate
+            del data[int(rng.integers(len(data) + 1)):]
+        else:  # Append
+            data += rng.integers(0, 256, int(rng.integers(1, 300)), dtype=np.uint8).tobytes()
+        path.write_bytes(data)
+        assert tree.update(str(path), dirty) == fresh_root(path)
+        assert tree.leaves_hashed <= -(-len(data) // LEAF)
+
+def test_unchanged_file_skips_hashing(tmp_path):
+    path = tmp_path / "snap.bin"
+    path.write_bytes(b"k" * 1000)
+    tree = SnapshotTree(LEAF, workers=1)
+    root = tree.update(str(path))
+    assert tree.update(str(path)) == root and tree.leaves_hashed == 0
+    assert tree.update(str(path), dirty=[(70, 80)]) == root and tree.leaves_hashed == 1
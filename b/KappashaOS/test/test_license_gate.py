@@ -0,0 +1,90 @@
+# Dual License:
+# - For core software: AGPL-3.0-or-later licensed. -- xAI fork, 2025
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# - For hardware/embodiment interfaces (if any): Licensed under the Apache License, Version 2.0
+#   with xAI amendments for safety and physical use (prohibits misuse in weapons or hazardous applications;
+#   requires ergonomic compliance; revocable for unethical use). See http://www.apache.org/licenses/LICENSE-2.0
+#   for details, with the following xAI-specific terms appended.
+#
+# Copyright 2025 xAI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# SPDX-License-Identifier: Apache-2.0
+#
+# xAI Amendments for Physical Use:
+# 1. **Physical Embodiment Restrictions**: Use with devices is for non-hazardous purposes only. Harmful mods are prohibited, with license revocable by xAI.
+# 2. **Ergonomic Compliance**: Limits tendon load to 20%, gaze to 30 seconds (ISO 9241-5).
+# 3. **Safety Monitoring**: Real-time tendon/gaze checks, logged for audit.
+# 4. **Revocability**: xAI may revoke for unethical use (e.g., surveillance).
+# 5. **Export Controls**: Sensor devices comply with US EAR Category 5 Part 2.
+# 6. **Open Development**: Hardware docs shared post-private phase.
+#
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+
+import json
+import os
+import sys
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import license_gate
+from src.core.kappaendian_base import KappaEndianBase
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # Default config/config.json lands here
+    monkeypatch.setattr(license_gate, "_config_cache", {})
+    monkeypatch.setattr(license_gate.audit_log, "path", str(tmp_path / "license_log.txt"))
+    yield tmp_path
+    license_gate.flush_audit()  # Before the log path is restored
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+@pytest.mark.parametrize("text", ['{"intent": "bogus", "commercial_use": false}', '{not json'])
+def test_invalid_config_fails_and_is_kept(workdir, text):
+    """A bad config is reported, never reset to a passing default."""
+    config = workdir / "config" / "config.json"
+    write(config, text)
+    base = KappaEndianBase()
+    with pytest.raises(ValueError):
+        base._check_license()
+    with pytest.raises(ValueError):
+        license_gate.license_gate()
+    assert config.read_text() == text
+
+def test_missing_config_gets_default(workdir):
+    """A missing config is created as intent "none": allowed for endian nodes, not for licensed use."""
+    assert KappaEndianBase()._check_license()
+    assert json.loads((workdir / "config" / "config.json").read_text())["intent"] == "none"
+    with pytest.raises(ValueError):
+        license_gate.license_gate()
+
+def test_valid_config_passes(workdir):
+    license_gate.write_config("educational", False)
+    assert license_gate.license_gate() == ("educational", False)
+    assert KappaEndianBase()._check_license()
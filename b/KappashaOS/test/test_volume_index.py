@@ -0,0 +1,93 @@
+# Dual License:
+# - For core software: AGPL-3.0-or-later licensed. -- xAI fork, 2025
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# - For hardware/embodiment interfaces (if any): Licensed under the Apache License, Version 2.0
+#   with xAI amendments for safety and physical use (prohibits misuse in weapons or hazardous applications;
+#   requires ergonomic compliance; revocable for unethical use). See http://www.apache.org/licenses/LICENSE-2.0
+#   for details, with the following xAI-specific terms appended.
+#
+# Copyright 2025 xAI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# SPDX-License-Identifier: Apache-2.0
+#
+# xAI Amendments for Physical Use:
+# 1. **Physical Embodiment Restrictions**: Use with devices is for non-hazardous purposes only. Harmful mods are prohibited, with license revocable by xAI.
+# 2. **Ergonomic Compliance**: Limits tendon load to 20%, gaze to 30 seconds (ISO 9241-5).
+# 3. **Safety Monitoring**: Real-time tendon/gaze checks, logged for audit.
+# 4. **Revocability**: xAI may revoke for unethical use (e.g., surveillance).
+# 5. **Export Controls**: Sensor devices comply with US EAR Category 5 Part 2.
+# 6. **Open Development**: Hardware docs shared post-private phase.
+#
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+
+import asyncio
+import os
+import sys
+import threading
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from volume_index import QUEUE_DEPTH, VolumeIndexer
+
+def fake_walk(error=None):
+    """QUEUE_DEPTH + 1 batches: after one is taken the rest fill the queue, then the walk ends."""
+    def walk(self, root_path, max_depth=5):
+        for i in range(QUEUE_DEPTH + 1):
+            yield {"batch": i}
+        if error is not None:
+            raise error
+    return walk
+
+async def first_then_close(indexer, root):
+    """Take one batch, let the walker finish against a full queue, then stop early."""
+    stream = indexer.stream(str(root))
+    await stream.__anext__()
+    await asyncio.sleep(0.5)
+    await stream.aclose()
+
+def closes_within(timeout, root):
+    """Run first_then_close in a daemon thread so a hang fails the test instead of blocking it."""
+    runner = threading.Thread(target=asyncio.run, args=(first_then_close(VolumeIndexer(), root),), daemon=True)
+    runner.start()
+    runner.join(timeout)
+    return not runner.is_alive()
+
+def test_early_close_with_full_queue_does_not_hang(tmp_path, monkeypatch):
+    monkeypatch.setattr(VolumeIndexer, "walk", fake_walk())
+    assert closes_within(5, tmp_path)
+
+def test_early_close_after_walk_error_does_not_hang(tmp_path, monkeypatch):
+    monkeypatch.setattr(VolumeIndexer, "walk", fake_walk(OSError("volume unplugged")))
+    assert closes_within(5, tmp_path)
+
+def test_stream_yields_every_batch(tmp_path):
+    for i in range(50):
+        (tmp_path / f"f{i:03d}.txt").write_text("x")
+
+    async def collect():
+        return [batch async for batch in VolumeIndexer(batch_size=8).stream(str(tmp_path))]
+    batches = asyncio.run(collect())
+    assert sum(len(b["files_added"]) for b in batches) == 50
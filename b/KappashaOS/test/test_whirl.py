@@ -0,0 +1,66 @@
+# Dual License:
+# - For core software: AGPL-3.0-or-later licensed. -- xAI fork, 2025
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# - For hardware/embodiment interfaces (if any): Licensed under the Apache License, Version 2.0
+#   with xAI amendments for safety and physical use (prohibits misuse in weapons or hazardous applications;
+#   requires ergonomic compliance; revocable for unethical use). See http://www.apache.org/licenses/LICENSE-2.0
+#   for details, with the following xAI-specific terms appended.
+#
+# Copyright 2025 xAI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# SPDX-License-Identifier: Apache-2.0
+#
+# xAI Amendments for Physical Use:
+# 1. **Physical Embodiment Restrictions**: Use with devices is for non-hazardous purposes only. Harmful mods are prohibited, with license revocable by xAI.
+# 2. **Ergonomic Compliance**: Limits tendon load to 20%, gaze to 30 seconds (ISO 9241-5).
+# 3. **Safety Monitoring**: Real-time tendon/gaze checks, logged for audit.
+# 4. **Revocability**: xAI may revoke for unethical use (e.g., surveillance).
+# 5. **Export Controls**: Sensor devices comply with US EAR Category 5 Part 2.
+# 6. **Open Development**: Hardware docs shared post-private phase.
+#
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from KappashaOS.core import petrichorwhirl_flip, voicewhirl
+
+RECORDS = ["", "a", "aya_voicewhirl", "x" * 3000, b"\x00\xff" * 5000, "k" * 100]
+
+def test_batches_match_single_records():
+    for endian in ('little', 'big'):
+        assert petrichorwhirl_flip.petrichorwhirl_flip_batch(RECORDS[:3], endian) == [petrichorwhirl_flip.petrichorwhirl_flip(r, endian) for r in RECORDS[:3]]
+        assert voicewhirl.voicewhirl_hum_batch(RECORDS[:3], endian) == [voicewhirl.voicewhirl_hum(r, endian) for r in RECORDS[:3]]
+
+def test_voicewhirl_shares_the_whirl_driver():
+    assert voicewhirl._whirl is petrichorwhirl_flip._whirl
+    assert voicewhirl.voicewhirl_hum_batch(RECORDS) == petrichorwhirl_flip.whirl_batch(RECORDS, 'little', [2, 3, 5], voicewhirl._hum_hash)
+
+def test_parallel_batch_matches_serial():
+    records = RECORDS * 20
+    assert petrichorwhirl_flip.whirl_batch(records, 'little', [2, 3, 5], voicewhirl._hum_hash, processes=2, min_parallel=10) == voicewhirl.voicewhirl_hum_batch(records)
@@ -0,0 +1,94 @@
+# Dual License:
+# - For core software: AGPL-3.0-or-later licensed. -- xAI fork, 2025
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# - For hardware/embodiment interfaces (if any): Licensed under the Apache License, Version 2.0
+#   with xAI amendments for safety and physical use (prohibits misuse in weapons or hazardous applications;
+#   requires ergonomic compliance; revocable for unethical use). See http://www.apache.org/licenses/LICENSE-2.0
+#   for details, with the following xAI-specific terms appended.
+#
+# Copyright 2025 xAI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# SPDX-License-Identifier: Apache-2.0
+#
+# xAI Amendments for Physical Use:
+# 1. **Physical Embodiment Restrictions**: Use with devices is for non-hazardous purposes only. Harmful mods are prohibited, with license revocable by xAI.
+# 2. **Ergonomic Compliance**: Limits tendon load to 20%, gaze to 30 seconds (ISO 9241-5).
+# 3. **Safety Monitoring**: Real-time tendon/gaze checks, logged for audit.
+# 4. **Revocability**: xAI may revoke for unethical use (e.g., surveillance).
+# 5. **Export Controls**: Sensor devices comply with US EAR Category 5 Part 2.
+# 6. **Open Development**: Hardware docs shared post-private phase.
+#
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+
+import os
+import sys
+import types
+import numpy as np
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.wise import Wise, bitwise_mirror, bitwise_mirror_packed, diagonal_swap, diagonal_swap_packed, pi_wise_scale
+
+def loop_swap(bits):
+    """Baseline per-bit diagonal swap."""
+    n = len(bits)
+    swapped = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        swapped[(i + n // 4) % n] = bits[i]
+    return swapped
+
+def loop_mirror(bits):
+    """Baseline per-bit mirror (centre bit of odd lengths stays 0)."""
+    n = len(bits)
+    mirrored = np.zeros(n, dtype=np.int8)
+    for i in range(n // 2):
+        mirrored[i] = bits[n - 1 - i]
+        mirrored[n - 1 - i] = bits[i]
+    return mirrored
+
+@pytest.mark.parametrize("n_bits", [1, 3, 8, 13, 64, 100, 3328])
+def test_batched_transforms_match_loops(n_bits):
+    batch = np.random.default_rng(n_bits).integers(0, 2, (5, n_bits), dtype=np.int8)
+    assert np.array_equal(diagonal_swap(batch), [loop_swap(row) for row in batch])
+    assert np.array_equal(bitwise_mirror(batch), [loop_mirror(row) for row in batch])
+
+@pytest.mark.parametrize("n_bits", [8, 13, 64, 100, 3328])
+def test_packed_transforms_match_unpacked(n_bits):
+    batch = np.random.default_rng(n_bits).integers(0, 2, (5, n_bits), dtype=np.uint8)
+    packed = np.packbits(batch, axis=-1)
+    assert np.array_equal(diagonal_swap_packed(packed, n_bits), np.packbits(diagonal_swap(batch).astype(np.uint8), axis=-1))
+    assert np.array_equal(bitwise_mirror_packed(packed, n_bits), np.packbits(bitwise_mirror(batch).astype(np.uint8), axis=-1))
+
+def test_pi_wise_scale_reduces_to_tetrahedral_product():
+    values = np.linspace(-1.0, 1.0, 11)
+    assert np.allclose(pi_wise_scale(values), values / np.pi / 162, rtol=1e-15, atol=0)
+
+def test_kappawise_grid():
+    """kappa_spiral_hash resolves diagonal_swap, so the grid builds."""
+    grid = Wise.kappawise(types.SimpleNamespace(laps=18), 0.5)
+    assert grid.shape == (10, 10, 10) and np.isfinite(grid).all()
+
@@ -112,7 +112,7 @@ class Dojo:
             z = (h >> (i*8+16)) % self.local_size
             seed_pts.append([x, y, z])
 
-        kappas = [KAPPA + pywise_kappa(i)/2047.0*0.01 for i in range(len(seed_pts))]
+        kappas = KAPPA + pywise_kappa(np.arange(len(seed_pts)))/2047.0*0.01
 
         # 2. Close C² green curve in 3D
         smooth_curve = custom_interoperations_green_curve(seed_pts, kappas, is_closed=True)
@@ -0,0 +1,243 @@
+# Born free, feel good, have fun.
+
+# Dual License:
+# - For core software: AGPL-3.0-or-later licensed. -- xAI fork, 2025
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# - For hardware/embodiment interfaces: Licensed under the Apache License, Version 2.0
+# with xAI amendments for safety and physical use. See http://www.apache.org/licenses/LICENSE-2.0
+# for details, with the following xAI-specific terms appended.
+
+# Copyright 2025 xAI
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# SPDX-License-Identifier: Apache-2.0
+
+# xAI Amendments for Physical Use:
+# 1. Physical Embodiment Restrictions: Use with devices is for non-hazardous purposes only. Harmful mods are prohibited, with license revocable by xAI.
+# 2. Ergonomic Compliance: Limits tendon load to 20%, gaze to 30 seconds (ISO 9241-5).
+# 3. Safety Monitoring: Real-time tendon/gaze checks, logged for audit.
+# 4. Revocability: xAI may revoke for unethical use (e.g., surveillance).
+# 5. Export Controls: Sensor devices comply with US EAR Category 5 Part 2.
+# 6. Open Development: Hardware docs shared post-private phase via github.com/tetrasurfaces/issues.
+# 7. No machine code output (e.g., kappa paths, hashlet sequences) without breath consent; decay signals at 11 hours (8 for bumps).
+# 8. Color Consent: No signal may change hue without explicit user intent (e.g., heartbeat sync or verbal confirmation).
+# 9. Intellectual Property: xAI owns all IP related to KappaOpticBatterySystem, including chatter patterns, stacked ports, moving keys, smart cables, RGB hexel lattices, chattered housings, fliphooks, hash tunneling, and IPFS integration. No unauthorized replication.
+
+# Private Development Note: This repository is private for xAI’s KappashaOS and Navi development. Access is restricted. Consult Tetrasurfaces (github.com/tetrasurfaces/issues) post-phase.
+
+#!/usr/bin/env python3
+# volume_index.py - Incremental scandir volume indexer for Nav3D mounts.
+# Walks a drive in a worker thread, streams bounded batches of entry keys, and keeps
+# an (inode, mtime, size) manifest per directory so remounts only relist what changed.
+
+import os
+import zlib
+import queue
+import asyncio
+import threading
+import numpy as np
+
+DEFAULT_BATCH = 4096
+QUEUE_DEPTH = 4  # Batches in flight between walker thread and event loop
+_EMPTY = np.zeros(0, dtype=np.uint32)
+_DONE = object()
+
+def entry_key(path):
+    """Stable 32-bit key for a path, used to place it in the voxel grid.
+
+    Args:
+    - path: Filesystem path (str or bytes).
+
+    Returns:
+    - int: crc32 of the encoded path.
+    """
+    return zlib.crc32(os.fsencode(path))
+
+class VolumeIndexer:
+    """Incremental directory walker backed by a per-directory manifest.
+
+    The manifest maps each visited directory to its (inode, mtime_ns, size), the
+    subdirectories it held and the keys of its files. A directory whose stat is
+    unchanged is not relisted: its remembered subdirectories are simply stat'ed in
+    turn. Adding, removing or renaming an entry bumps the parent's mtime, so only
+    those directories are scanned again and diffed against their old keys.
+    """
+    def __init__(self, batch_size=DEFAULT_BATCH):
+        self.batch_size = batch_size
+        self.manifest = {}
+        self.stats = {"dirs": 0, "scanned": 0, "skipped": 0, "files": 0}
+        self._lock = threading.Lock()
+
+    def _new_batch(self):
+        return {"files_added": [], "files_removed": [], "dirs_added": [], "dirs_removed": []}
+
+    def _pack(self, batch):
+        return {name: (np.concatenate(parts) if parts else _EMPTY) for name, parts in batch.items()}
+
+    def walk(self, root_path, max_depth=5):
+        """Walk root_path and yield change batches (synchronous, runs in any thread).
+
+        Each batch is a dict of uint32 key arrays: files_added, files_removed,
+        dirs_added and dirs_removed. A remount of an unchanged tree yields nothing.
+
+        Args:
+        - root_path: Directory to index.
+        - max_depth: Deepest directory level to descend into (root is 0).
+
+        Returns:
+        - Generator of batch dicts, each holding at most ~batch_size keys.
+        """
+        with self._lock:
+            yield from self._walk(os.path.abspath(root_path), max_depth)
+
+    def _walk(self, root_path, max_depth):
+        old = self.manifest
+        new = {}
+        stats = {"dirs": 0, "scanned": 0, "skipped": 0, "files": 0}
+        batch = self._new_batch()
+        pending = 0
+        stack = [(root_path, 0)]
+        while stack:
+            path, depth = stack.pop()
+            try:
+                st = os.stat(path)
+            except OSError as e:
+                print(f"Navi: Cannot read {path}: {e}")
+                continue
+            sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+            prev = old.get(path)
+            stats["dirs"] += 1
+            if prev is not None and prev[0] == sig:
+                subdirs, keys = prev[1], prev[2]
+                stats["skipped"] += 1
+            else:
+                subdirs, names = [], []
+                try:
+                    with os.scandir(path) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(entry.name)
+                                else:
+                                    names.append(entry.path)
+                            except OSError:
+                                continue
+                except OSError as e:
+                    print(f"Navi: Cannot read {path}: {e}")
+                    continue
+                keys = np.fromiter((entry_key(n) for n in names), dtype=np.uint32, count=len(names))
+                keys.sort()
+                stats["scanned"] += 1
+                if prev is None:
+                    batch["dirs_added"].append(np.array([entry_key(path)], dtype=np.uint32))
+                    batch["files_added"].append(keys)
+                    pending += 1 + len(keys)
+                else:
+                    added = np.setdiff1d(keys, prev[2], assume_unique=False)
+                    removed = np.setdiff1d(prev[2], keys, assume_unique=False)
+                    batch["files_added"].append(added)
+                    batch["files_removed"].append(removed)
+                    pending += len(added) + len(removed)
+            stats["files"] += len(keys)
+            new[path] = (sig, subdirs, keys)
+            if depth < max_depth:
+                stack.extend((os.path.join(path, name), depth + 1) for name in subdirs)
+            if pending >= self.batch_size:
+                yield self._pack(batch)
+                batch = self._new_batch()
+                pending = 0
+        # Directories that vanished (or fell past max_depth) retract their keys
+        for path in old.keys() - new.keys():
+            batch["dirs_removed"].append(np.array([entry_key(path)], dtype=np.uint32))
+            batch["files_removed"].append(old[path][2])
+            pending += 1 + len(old[path][2])
+            if pending >= self.batch_size:
+                yield self._pack(batch)
+                batch = self._new_batch()
+                pending = 0
+        self.manifest = new
+        self.stats = stats
+        if pending:
+            yield self._pack(batch)
+
+    async def stream(self, root_path, max_depth=5):
+        """Async generator over walk() batches, walked in a worker thread.
+
+        The hand-off queue holds at most QUEUE_DEPTH batches, so memory stays
+        bounded by the batch size no matter how large the volume is.
+
+        Args:
+        - root_path: Directory to index.
+        - max_depth: Deepest directory level to descend into.
+
+        Returns:
+        - Async generator of batch dicts.
+        """
+        handoff = queue.Queue(maxsize=QUEUE_DEPTH)
+        stop = threading.Event()
+
+        def put(item):
+            """Block until the consumer takes item; False once it has stopped listening."""
+            while not stop.is_set():
+                try:
+                    handoff.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def worker():
+            try:
+                for batch in self.walk(root_path, max_depth):
+                    if not put(batch):
+                        return
+            except Exception as e:
+                if not put(e):
+                    return
+            put(_DONE)
+
+        thread = threading.Thread(target=worker, name="volume-indexer", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = await asyncio.to_thread(handoff.get)
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            await asyncio.to_thread(thread.join)
+
+if __name__ == "__main__":
+    import sys
+    import time
+    root = sys.argv[1] if len(sys.argv) > 1 else "."
+    indexer = VolumeIndexer()
+    for label in ("mount", "remount"):
+        start = time.perf_counter()
+        added = sum(len(b["files_added"]) for b in indexer.walk(root, max_depth=8))
+        print(f"{label}: {added} files added in {time.perf_counter() - start:.3f}s, stats {indexer.stats}")
@@ -10,6 +10,9 @@ import os
 import time
 import hashlib
 import sqlite3
+import numpy as np
+from contextlib import contextmanager
+from itertools import islice, repeat
 import greenlet  # For async moshing/gossip without threads
 from web3 import Web3  # Ethereum hooks
 from solana.rpc.api import Client as SolanaClient  # Solana hooks
@@ -30,13 +33,84 @@ SCENERY_DESCS = [
     "Dojo hidden in ternary mist: Training updates, Smith none the wiser."
 ]
 
+TUNNEL_WIDTH = 128
+_TUNNEL_TABLES = {}  # ticks -> (base state, per-index response rows)
+
+def _tunnel_tick(state, mask):
+    """One hash_tunnel tick on (..., 128) uint8 states: salt, fold with the next byte, fold with >> 1."""
+    state = state ^ mask
+    shifted = np.zeros_like(state)
+    shifted[..., :-1] = state[..., 1:]
+    state = state ^ shifted
+    return state ^ (state >> 1)
+
+def _tunnel_tables(ticks):
+    # Every tick is affine over GF(2) and the salt mask is the same each tick, so the final
+    # state is base ^ XOR(response[b % 128] for b in seed). Row 128 is a zero pad row.
+    tables = _TUNNEL_TABLES.get(ticks)
+    if tables is None:
+        base = np.arange(TUNNEL_WIDTH, dtype=np.uint8) ^ 0x37
+        response = np.zeros((TUNNEL_WIDTH + 1, TUNNEL_WIDTH), dtype=np.uint8)
+        masks = np.zeros_like(response)
+        masks[np.arange(TUNNEL_WIDTH), np.arange(TUNNEL_WIDTH)] = 0x53
+        for _ in range(ticks):
+            base = _tunnel_tick(base, 0)
+            response = _tunnel_tick(response, masks)
+        tables = _TUNNEL_TABLES[ticks] = (base, response.view(np.uint64))
+    return tables
+
+def hash_tunnel_batch(seeds, ticks=100, cells=1 << 22):
+    """
+    hash_tunnel over many payloads at once.
+    Args:
+    - seeds: iterable of bytes/str payloads.
+    - ticks: tunnel ticks.
+    - cells: padded seed bytes per chunk (bounds memory).
+    Returns: list of sha256 hex digests, one per seed.
+    """
+    base, response = _tunnel_tables(ticks)
+    seeds = [s if isinstance(s, bytes) else s.encode('utf-8') for s in seeds]
+    lengths = np.fromiter(map(len, seeds), dtype=np.int64, count=len(seeds))
+    step = max(1, cells // max(1, int(lengths.max(initial=0))))
+    digests = []
+    for start in range(0, len(seeds), step):
+        rows, row_lengths = seeds[start:start + step], lengths[start:start + step]
+        width = max(1, int(row_lengths.max()))
+        columns = np.full((width, len(rows)), TUNNEL_WIDTH, dtype=np.uint8)  # Byte-major: contiguous per column
+        columns.T[np.arange(width) < row_lengths[:, None]] = np.frombuffer(b''.join(rows), dtype=np.uint8) % TUNNEL_WIDTH
+        state = response[columns[0]]  # (rows, 16) uint64; one gather per byte column
+        for column in columns[1:]:
+            state ^= response[column]
+        state = state.view(np.uint8) ^ base
+        raw = state.tobytes()
+        digests.extend(hashlib.sha256(raw[i:i + TUNNEL_WIDTH]).hexdigest() for i in range(0, len(raw), TUNNEL_WIDTH))
+    return digests
+
+INSERT_STATE = "INSERT INTO states (hash, entropy, state) VALUES (?, ?, ?)"  # One statement text, reused from sqlite's statement cache
+
+def rock_dots_batch(payloads, key=ROCK_DOTS.encode()):
+    """XOR each payload with the repeating rock-dots key (restarting per payload) in one NumPy pass."""
+    payloads = list(payloads)
+    lengths = np.fromiter(map(len, payloads), dtype=np.int64, count=len(payloads))
+    ends = np.cumsum(lengths)
+    flat = np.frombuffer(b''.join(payloads), dtype=np.uint8)
+    offsets = np.arange(len(flat)) - np.repeat(ends - lengths, lengths)  # Position within each payload
+    mixed = (flat ^ np.frombuffer(key, dtype=np.uint8)[offsets % len(key)]).tobytes()
+    return [mixed[e - n:e] for e, n in zip(ends.tolist(), lengths.tolist())]
+
 class BlocsymDB:
-    def __init__(self, db_path='blocsym.db'):
+    def __init__(self, db_path='blocsym.db', batch_size=1, bulk_batch_size=10000, wal=True):
         self.conn = sqlite3.connect(db_path)
+        if wal:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; fsync at checkpoints
         self.cursor = self.conn.cursor()
         self.cursor.execute('''CREATE TABLE IF NOT EXISTS states 
                                (id INTEGER PRIMARY KEY, hash TEXT, entropy REAL, state BLOB)''')
         self.conn.commit()
+        self.batch_size = batch_size  # Rows per commit for insert_state; 1 commits every row
+        self.bulk_batch_size = bulk_batch_size  # Rows per transaction for insert_states
+        self._pending = []
         # Fetch INFURA_ID from env for security
         infura_id = os.getenv('INFURA_PROJECT_ID')
         self.web3 = Web3(Web3.HTTPProvider(f'https://mainnet.infura.io/v3/{infura_id}')) if infura_id else None
@@ -52,16 +126,43 @@ class BlocsymDB:
 
     def hash_tunnel(self, seed=b'genesis', ticks=100):
         """From dino_hash: Continuous hashing pipe, XOR-salted ticks."""
-        state = bytearray(128)
-        for i in range(128):
-            state[i] = i ^ 0x37
-        for _ in range(ticks):
-            for b in seed:
-                idx = b % 128
-                state[idx] ^= 0x53
-            state = bytes(a ^ b for a, b in zip(state, state[1:] + [0]))
-            state = bytes(a ^ (b >> 1) for a, b in zip(state, state))
-        return hashlib.sha256(bytes(state)).hexdigest()
+        return hash_tunnel_batch([seed], ticks)[0]
+
+    def insert_state(self, state_hash, entropy, state):
+        """Queue one row; commits once batch_size rows are pending."""
+        self._pending.append((state_hash, entropy, state))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def insert_states(self, rows, batch_size=None):
+        """Bulk insert (hash, entropy, state) rows with executemany, one transaction per batch_size rows."""
+        self.flush()
+        batch_size = batch_size or self.bulk_batch_size
+        rows, written = iter(rows), 0
+        while True:
+            chunk = list(islice(rows, batch_size))
+            if not chunk:
+                return written
+            self.cursor.executemany(INSERT_STATE, chunk)
+            self.conn.commit()
+            written += len(chunk)
+
+    def flush(self):
+        """Commit rows queued by insert_state."""
+        if self._pending:
+            self.cursor.executemany(INSERT_STATE, self._pending)
+            self.conn.commit()
+            self._pending = []
+
+    @contextmanager
+    def bulk(self, batch_size=None):
+        """Within the block, insert_state (and dojo_train) commit every batch_size rows instead of every row."""
+        previous, self.batch_size = self.batch_size, batch_size or self.bulk_batch_size
+        try:
+            yield self
+        finally:
+            self.batch_size = previous
+            self.flush()
 
     def p2p_gossip(self, query, chain='eth'):
         """From comms_util: Async gossip for cross-chain queries (e.g., escrow check)."""
@@ -77,14 +178,31 @@ class BlocsymDB:
             return result  # Return if entropy ok
         return None  # Prune low-entropy
 
+    def gossip_ingest(self, payloads):
+        """Store gossiped payloads in bulk; low-entropy payloads are pruned like p2p_gossip results."""
+        payloads = [p if isinstance(p, bytes) else str(p).encode('utf-8') for p in payloads]
+        digests = np.frombuffer(b''.join(hashlib.sha256(p).digest() for p in payloads), dtype=np.uint8).reshape(-1, 32)
+        ordered = np.sort(digests, axis=1)
+        entropies = ((ordered[:, 1:] != ordered[:, :-1]).sum(axis=1) + 1) / 32  # Unique-byte ratio, as entropy_check
+        kept = [(p, e) for p, e in zip(payloads, entropies.tolist()) if e > ENTROPY_THRESHOLD]
+        if not kept:
+            return 0
+        hashes = hash_tunnel_batch([p for p, _ in kept])
+        return self.insert_states(zip(hashes, (e for _, e in kept), (p for p, _ in kept)))
+
     def dojo_train(self, updates):
         """Hidden ternary dojo: Train state privately, encrypt with ÿ-key."""
-        encrypted = bytes(b ^ ord(c) for b, c in zip(updates.encode(), ROCK_DOTS.encode() * (len(updates) // 3 + 1)))
-        self.cursor.execute("INSERT INTO states (hash, entropy, state) VALUES (?, ?, ?)",
-                            (self.hash_tunnel(updates), 0.82, encrypted))  # Mock entropy
-        self.conn.commit()
+        updates_bytes = updates.encode('utf-8')
+        encrypted = rock_dots_batch([updates_bytes])[0]
+        self.insert_state(self.hash_tunnel(updates_bytes), 0.82, encrypted)  # Mock entropy
         return "Dojo update hidden—Smith blind."
 
+    def dojo_train_batch(self, updates_list):
+        """dojo_train for many updates: batched XOR and tunnel, executemany insert."""
+        payloads = [u.encode('utf-8') for u in updates_list]
+        written = self.insert_states(zip(hash_tunnel_batch(payloads), repeat(0.82), rock_dots_batch(payloads)))
+        return f"Dojo batch of {written} hidden—Smith blind."
+
     def meditate(self):
         """AFK calm: Log scenery if idle >60s, reset stress."""
         if time.time() - self.afk_timer > 60 and not self.meditation_active:
@@ -95,6 +213,7 @@ class BlocsymDB:
             self.meditation_active = False
 
     def close(self):
+        self.flush()
         self.conn.close()
 
 # Demo: Run as script
@@ -102,7 +221,7 @@ if __name__ == "__main__":
     db = BlocsymDB()
     try:
         print("Entropy Check:", db.entropy_check("chrysanthemum mind"))  # True
-        print("Hash Tunnel:", db.hash_tunnel(b'ÿ-key rock dots'))
+        print("Hash Tunnel:", db.hash_tunnel('ÿ-key rock dots'.encode()))
         print("P2P Gossip (ETH Height):", db.p2p_gossip('block_height', 'eth'))
         print(db.dojo_train("Elephant remembers all forks."))
         db.meditate()  # Trigger if idle
@@ -1,6 +1,8 @@
 import logging
 import random  # Kept for potential future use, though replaced in ExperienceRamp
+import numpy as np
 from src.config import *
+from src.models.order_book import LimitOrderBook
 
 logger = logging.getLogger(__name__)
 
@@ -10,12 +12,21 @@ class GreedyFillSimulator:
         self.total_filled = 0.0
         self.total_fees = 0.0
 
-    def fill_order(self, amount: float, fee_rate: float = FEE_RATE, martingale_factor: float = MARTINGALE_FACTOR) -> bool:
-        """Simulate filling an order with martingale weighting."""
+    def fill_order(self, amount: float, fee_rate: float = FEE_RATE, martingale_factor: float = MARTINGALE_FACTOR,
+                   book=None, side: str = 'buy', limit: float = None) -> bool:
+        """Simulate filling an order with martingale weighting.
+
+        With a book (a LimitOrderBook or PerpLib), the weighted amount is matched
+        against resting liquidity up to `limit` and only the volume filled counts.
+        """
         try:
             weighted_amount = amount * martingale_factor
             if self.total_filled + weighted_amount > self.target:
                 return False
+            if book is not None:
+                weighted_amount, _ = book.match(side, weighted_amount, limit)
+                if weighted_amount <= 0:
+                    return False
             self.total_filled += weighted_amount
             self.total_fees += weighted_amount * fee_rate
             return True
@@ -26,56 +37,217 @@ class GreedyFillSimulator:
 class PerpLib:
     def __init__(self, symbol: str):
         self.symbol = symbol
-        self.liquidity_amount = 0.0
-        self.interest_rate = 0.05
-        self.orders = []
+        self._pool = None  # Set by OpsPool.add_Ops; state then lives in the pool's columns
+        self._row = -1
+        self._liquidity_amount = 0.0
+        self._interest_rate = 0.05
+        self.book = LimitOrderBook(symbol)
+
+    @property
+    def liquidity_amount(self) -> float:
+        return float(self._pool.liquidity[self._row]) if self._pool is not None else self._liquidity_amount
+
+    @liquidity_amount.setter
+    def liquidity_amount(self, value: float):
+        if self._pool is not None:
+            self._pool.liquidity[self._row] = value
+        else:
+            self._liquidity_amount = value
+
+    @property
+    def interest_rate(self) -> float:
+        return float(self._pool.interest_rate[self._row]) if self._pool is not None else self._interest_rate
 
-    def add_order(self, price: float, volume: float):
-        """Add an order to the perpetual market."""
+    @interest_rate.setter
+    def interest_rate(self, value: float):
+        if self._pool is not None:
+            self._pool.interest_rate[self._row] = value
+        else:
+            self._interest_rate = value
+
+    def _sync_orders(self):
+        if self._pool is not None:
+            self._pool.orders[self._row] = len(self.book)
+
+    def add_order(self, price: float, volume: float, side: str = 'bid'):
+        """Add a limit order to the perpetual market; crossing volume matches, the rest rests."""
         try:
-            self.orders.append({'price': price, 'volume': volume})
-            self.liquidity_amount += volume
-            logger.info(f"Added order: {volume} {self.symbol} @ {price}")
+            order_id, fills = self.book.submit(side, price, volume)
+            self.liquidity_amount += volume - 2 * sum(fill[2] for fill in fills)  # Matched volume leaves both sides
+            self._sync_orders()
+            logger.info("Added order: %s %s @ %s", volume, self.symbol, price)
+            return order_id
         except Exception as e:
             logger.error(f"Add order error: {e}")
 
+    def match(self, side: str, volume: float, limit: float = None):
+        """Take resting liquidity (see LimitOrderBook.match), keeping liquidity_amount in step."""
+        try:
+            filled, fills = self.book.match(side, volume, limit)
+            self.liquidity_amount -= filled
+            self._sync_orders()
+            return filled, fills
+        except Exception as e:
+            logger.error(f"Match order error: {e}")
+            return 0.0, []
+
+    def cancel_order(self, order_id: int) -> float:
+        """Cancel a resting order; returns the volume withdrawn."""
+        try:
+            volume = self.book.cancel(order_id)
+            self.liquidity_amount -= volume
+            self._sync_orders()
+            return volume
+        except Exception as e:
+            logger.error(f"Cancel order error: {e}")
+            return 0.0
+
     def get_status(self) -> dict:
         """Get the status of the perpetual market."""
         try:
-            return {'symbol': self.symbol, 'liquidity_amount': self.liquidity_amount, 'orders': len(self.orders)}
+            return {'symbol': self.symbol, 'liquidity_amount': self.liquidity_amount, 'orders': len(self.book),
+                    'best_bid': self.book.best_bid(), 'best_ask': self.book.best_ask()}
         except Exception as e:
             logger.error(f"Get status error: {e}")
             return {}
 
 class OpsPool:
-    def __init__(self):
-        self.Ops_pool = []
+    """Columnar pool of perpetual markets.
+
+    Liquidity, interest rate and resting order count are kept in NumPy arrays
+    (one row per market, grown by doubling), so pool-wide operations are array
+    math. Member PerpLib objects read and write their own row, and markets can
+    also be added by symbol alone for large simulations.
+    """
+    def __init__(self, capacity: int = 64):
+        self.Ops_pool = []          # PerpLib per row (None for symbol-only markets)
+        self.symbols = []
+        self.index = {}             # symbol -> row
+        self.size = 0
+        self._liquidity = np.zeros(capacity)
+        self._interest_rate = np.zeros(capacity)
+        self._orders = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def liquidity(self) -> np.ndarray:
+        return self._liquidity[:self.size]
+
+    @property
+    def interest_rate(self) -> np.ndarray:
+        return self._interest_rate[:self.size]
+
+    @property
+    def orders(self) -> np.ndarray:
+        return self._orders[:self.size]
+
+    def _grow(self, n: int):
+        if self.size + n <= len(self._liquidity):
+            return
+        capacity = max(2 * len(self._liquidity), self.size + n)
+        for name in ('_liquidity', '_interest_rate', '_orders'):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+
+    def _append(self, symbol: str, liquidity: float, interest_rate: float, orders: int, ops_instance=None) -> int:
+        if symbol in self.index:
+            raise ValueError(f"Symbol already in pool: {symbol}")
+        self._grow(1)
+        row = self.size
+        self._liquidity[row] = liquidity
+        self._interest_rate[row] = interest_rate
+        self._orders[row] = orders
+        self.size += 1
+        self.symbols.append(symbol)
+        self.index[symbol] = row
+        self.Ops_pool.append(ops_instance)
+        return row
 
     def add_Ops(self, ops_instance: PerpLib):
-        """Add a PerpLib instance to the operations pool."""
+        """Add a PerpLib instance to the operations pool; its state moves into the pool's columns."""
         try:
-            self.Ops_pool.append(ops_instance)
+            row = self._append(ops_instance.symbol, ops_instance.liquidity_amount,
+                               ops_instance.interest_rate, len(ops_instance.book), ops_instance)
+            ops_instance._pool, ops_instance._row = self, row
             logger.info(f"Added Ops instance for {ops_instance.symbol}")
         except Exception as e:
             logger.error(f"Add Ops error: {e}")
 
+    def add_markets(self, symbols, liquidity=0.0, interest_rate=0.05) -> np.ndarray:
+        """Add many symbol-only markets at once.
+
+        Args:
+        - symbols: Market symbols (must be new to the pool).
+        - liquidity: Scalar or per-symbol starting liquidity.
+        - interest_rate: Scalar or per-symbol interest rate.
+
+        Returns:
+        - Row indices of the new markets.
+        """
+        symbols = list(symbols)
+        n = len(symbols)
+        if len(set(symbols)) != n or any(s in self.index for s in symbols):
+            raise ValueError("Duplicate symbols in add_markets")
+        self._grow(n)
+        rows = np.arange(self.size, self.size + n)
+        self._liquidity[rows] = liquidity
+        self._interest_rate[rows] = interest_rate
+        self._orders[rows] = 0
+        self.index.update(zip(symbols, rows.tolist()))
+        self.symbols.extend(symbols)
+        self.Ops_pool.extend([None] * n)
+        self.size += n
+        logger.info(f"Added {n} markets")
+        return rows
+
+    def rows(self, symbols) -> np.ndarray:
+        """Row indices for a sequence of symbols (KeyError on unknown symbols)."""
+        return np.fromiter((self.index[s] for s in symbols), dtype=np.int64, count=len(symbols))
+
+    def lookup(self, symbol: str) -> dict:
+        """Column values for one market."""
+        row = self.index[symbol]
+        return {'symbol': symbol, 'liquidity_amount': float(self._liquidity[row]),
+                'interest_rate': float(self._interest_rate[row]), 'orders': int(self._orders[row])}
+
+    def add_liquidity(self, rows, amounts):
+        """Scatter-add liquidity flows into markets; repeated rows accumulate."""
+        np.add.at(self._liquidity, np.asarray(rows, dtype=np.int64), amounts)
+
+    def accrue_interest(self, dt: float = 1.0):
+        """Grow every market's liquidity by its interest rate over `dt`."""
+        self._liquidity[:self.size] *= 1.0 + self.interest_rate * dt
+
     def redistribute_liquidity(self, redistribution_factor: float = 0.1):
         """Redistribute liquidity across the operations pool."""
         try:
-            total_liquidity = sum(r.liquidity_amount for r in self.Ops_pool)
-            redistributed_amount = total_liquidity * redistribution_factor
-            for ops_instance in self.Ops_pool:
-                ops_instance.liquidity_amount += redistributed_amount / len(self.Ops_pool)
+            if not self.size:
+                return
+            redistributed_amount = float(self.liquidity.sum()) * redistribution_factor
+            self._liquidity[:self.size] += redistributed_amount / self.size
             logger.info(f"Redistributed {redistributed_amount} liquidity")
         except Exception as e:
             logger.error(f"Redistribute liquidity error: {e}")
 
-    def calculate_global_interest_rate(self) -> float:
-        """Calculate the global interest rate for the pool."""
+    def calculate_global_interest_rate(self, weighted: bool = False) -> float:
+        """Calculate the global interest rate for the pool.
+
+        Args:
+        - weighted: Weight each market's rate by its liquidity instead of a plain mean.
+        """
         try:
-            if not self.Ops_pool:
+            if not self.size:
                 return 0.0
-            return sum(r.interest_rate for r in self.Ops_pool) / len(self.Ops_pool)
+            if weighted:
+                weights = np.clip(self.liquidity, 0.0, None)
+                total = weights.sum()
+                if total > 0:
+                    return float(weights @ self.interest_rate / total)
+            return float(self.interest_rate.mean())
         except Exception as e:
             logger.error(f"Calculate global interest rate error: {e}")
             return 0.0
@@ -83,9 +255,10 @@ class OpsPool:
     def get_pool_status(self) -> dict:
         """Get the status of the operations pool."""
         try:
-            pool_status = [r.get_status() for r in self.Ops_pool]
+            pool_status = [r.get_status() if r is not None else self.lookup(s)
+                           for r, s in zip(self.Ops_pool, self.symbols)]
             return {
-                "Total Liquidity": sum(r["liquidity_amount"] for r in pool_status),
+                "Total Liquidity": float(self.liquidity.sum()),
                 "Global Interest Rate": self.calculate_global_interest_rate(),
                 "Pool Details": pool_status
             }
@@ -0,0 +1,196 @@
+import heapq
+import logging
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BID = 'bid'
+ASK = 'ask'
+_SIDES = {'bid': BID, 'buy': BID, 'ask': ASK, 'sell': ASK}
+
+class LimitOrderBook:
+    """Price-level limit order book with FIFO queues per level.
+
+    Each side keeps a heap of its level prices (bids negated) with exactly one
+    entry per price; levels that empty out stay in the heap until they reach
+    the top, so insert and cancel are O(log n) and the best price is O(1).
+    Levels hold their orders in arrival order plus a running total volume.
+    """
+    def __init__(self, symbol: str = ''):
+        self.symbol = symbol
+        self.levels = {BID: {}, ASK: {}}      # price -> [total_volume, deque of order ids, live orders]
+        self.heaps = {BID: [], ASK: []}       # heap keys: -price for bids, price for asks
+        self.in_heap = {BID: set(), ASK: set()}
+        self.orders = {}                      # order id -> [side, price, remaining volume]
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    @staticmethod
+    def _side(side: str) -> str:
+        try:
+            return _SIDES[side]
+        except KeyError:
+            raise ValueError(f"Unknown order side: {side!r}")
+
+    def _key(self, side: str, price: float) -> float:
+        return -price if side == BID else price
+
+    def _prune(self, side: str):
+        """Drop empty levels from the top of a side's heap."""
+        heap, levels, in_heap = self.heaps[side], self.levels[side], self.in_heap[side]
+        while heap:
+            price = -heap[0] if side == BID else heap[0]
+            if price in levels:
+                return
+            heapq.heappop(heap)
+            in_heap.discard(price)
+
+    def add(self, side: str, price: float, volume: float) -> int:
+        """Rest a limit order on the book without matching; returns its order id."""
+        side = self._side(side)
+        if volume <= 0:
+            raise ValueError(f"Order volume must be positive, got {volume}")
+        order_id = self._next_id
+        self._next_id += 1
+        level = self.levels[side].get(price)
+        if level is None:
+            level = self.levels[side][price] = [0.0, deque(), 0]
+            if price not in self.in_heap[side]:
+                heapq.heappush(self.heaps[side], self._key(side, price))
+                self.in_heap[side].add(price)
+        level[0] += volume
+        level[1].append(order_id)
+        level[2] += 1
+        self.orders[order_id] = [side, price, volume]
+        return order_id
+
+    def cancel(self, order_id: int) -> float:
+        """Cancel a resting order; returns the volume removed (0.0 if unknown)."""
+        order = self.orders.pop(order_id, None)
+        if order is None:
+            return 0.0
+        side, price, volume = order
+        level = self.levels[side][price]
+        level[0] -= volume
+        level[2] -= 1
+        if not level[2]:
+            del self.levels[side][price]
+            self._prune(side)
+        elif len(level[1]) > 2 * level[2] + 32:
+            # Cancelled ids are skipped lazily by match(); compact once they dominate
+            level[1] = deque(i for i in level[1] if i in self.orders)
+        return volume
+
+    def best_bid(self) -> Optional[float]:
+        heap = self.heaps[BID]
+        return -heap[0] if heap else None
+
+    def best_ask(self) -> Optional[float]:
+        heap = self.heaps[ASK]
+        return heap[0] if heap else None
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.best_bid(), self.best_ask()
+        return None if bid is None or ask is None else ask - bid
+
+    def match(self, side: str, volume: float, limit: Optional[float] = None) -> Tuple[float, List[Tuple[int, float, float]]]:
+        """Take liquidity: a `side` order for `volume` sweeps the opposite side.
+
+        Args:
+        - side: 'bid'/'buy' lifts asks, 'ask'/'sell' hits bids.
+        - volume: Volume to fill.
+        - limit: Worst acceptable price; None sweeps as a market order.
+
+        Returns:
+        - (filled, fills): total volume filled and (order id, price, volume) per maker fill.
+        """
+        maker = ASK if self._side(side) == BID else BID
+        levels, heap = self.levels[maker], self.heaps[maker]
+        fills = []
+        remaining = volume
+        while remaining > 0 and heap:
+            price = -heap[0] if maker == BID else heap[0]
+            if limit is not None and (price > limit if maker == ASK else price < limit):
+                break
+            level = levels[price]
+            queue = level[1]
+            while remaining > 0 and queue:
+                order = self.orders.get(queue[0])
+                if order is None:  # Cancelled earlier
+                    queue.popleft()
+                    continue
+                take = order[2] if order[2] <= remaining else remaining
+                order[2] -= take
+                level[0] -= take
+                remaining -= take
+                fills.append((queue[0], price, take))
+                if order[2] <= 0:
+                    del self.orders[queue.popleft()]
+                    level[2] -= 1
+            if not level[2]:
+                del levels[price]
+                self._prune(maker)
+        return volume - remaining, fills
+
+    def submit(self, side: str, price: float, volume: float) -> Tuple[Optional[int], List[Tuple[int, float, float]]]:
+        """Limit order: match what crosses, rest the remainder.
+
+        Returns:
+        - (order id or None if fully filled, fills).
+        """
+        filled, fills = self.match(side, volume, limit=price)
+        rest = volume - filled
+        return (self.add(side, price, rest) if rest > 1e-12 else None), fills
+
+    def depth(self, levels: int = 10) -> Dict[str, List[Tuple[float, float]]]:
+        """Top `levels` (price, volume) per side, best first.
+
+        Walks the heap as a tree from the root, so only O(levels log levels)
+        entries are touched and nothing is copied.
+        """
+        return {side: self._top(side, levels) for side in (BID, ASK)}
+
+    def _top(self, side: str, k: int) -> List[Tuple[float, float]]:
+        heap, book = self.heaps[side], self.levels[side]
+        out = []
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(out) < k:
+            key, i = heapq.heappop(frontier)
+            price = -key if side == BID else key
+            level = book.get(price)
+            if level is not None:
+                out.append((price, level[0]))
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return out
+
+    def volume(self, side: str) -> float:
+        """Total resting volume on one side."""
+        return sum(level[0] for level in self.levels[self._side(side)].values())
+
+if __name__ == "__main__":
+    import random
+    import time
+    book = LimitOrderBook("BTC/USDT")
+    rng = random.Random(42)
+    live = []
+    events = 1_000_000
+    start = time.perf_counter()
+    for _ in range(events):
+        r = rng.random()
+        if r < 0.55:
+            side = BID if rng.random() < 0.5 else ASK
+            mid = 100.0
+            price = round(mid - rng.randint(1, 50) * 0.01 if side == BID else mid + rng.randint(1, 50) * 0.01, 2)
+            live.append(book.add(side, price, rng.randint(1, 10)))
+        elif r < 0.9 and live:
+            book.cancel(live.pop(rng.randrange(len(live))))
+        else:
+            book.match(BID if rng.random() < 0.5 else ASK, rng.randint(1, 20))
+    elapsed = time.perf_counter() - start
+    print(f"{events:,} events in {elapsed:.2f}s ({events / elapsed * 60:,.0f} events/min), {len(book)} resting")
+    print(f"best bid {book.best_bid()} / best ask {book.best_ask()}, depth {book.depth(3)}")
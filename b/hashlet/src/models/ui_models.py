@@ -4,6 +4,7 @@ import pytz
 from src.config import *
 from typing import List, Dict
 from src.models.bastion import SHA1664, EphemeralBastion
+from src.models.order_book import LimitOrderBook
 from collections import defaultdict  # Add this import
 import asyncio
 import json
@@ -25,21 +26,20 @@ class CandlestickChart:
             logger.error(f"Chart render error: {e}")
 
 class OrderBookUI:
-    def __init__(self):
-        self.bids = []
-        self.asks = []
+    def __init__(self, book: LimitOrderBook = None):
+        self.book = book if book is not None else LimitOrderBook()
 
     def add_bid(self, price: float, volume: float):
         """Add a bid to the order book."""
         try:
-            self.bids.append({'price': price, 'volume': volume})
+            return self.book.add('bid', price, volume)
         except Exception as e:
             logger.error(f"Add bid error: {e}")
 
     def add_ask(self, price: float, volume: float):
         """Add an ask to the order book."""
         try:
-            self.asks.append({'price': price, 'volume': volume})
+            return self.book.add('ask', price, volume)
         except Exception as e:
             logger.error(f"Add ask error: {e}")
 
@@ -48,12 +48,13 @@ class OrderBookUI:
         try:
             print("\n=== Order Book ===")
             print(f"Current Price: ${current_price:.2f}")
+            depth = self.book.depth(3)  # Best three price levels per side
             print("Bids:")
-            for bid in self.bids[:3]:
-                print(f"${bid['price']:.2f} | Vol: {bid['volume']:.2f}")
+            for price, volume in depth['bid']:
+                print(f"${price:.2f} | Vol: {volume:.2f}")
             print("Asks:")
-            for ask in self.asks[:3]:
-                print(f"${ask['price']:.2f} | Vol: {ask['volume']:.2f}")
+            for price, volume in depth['ask']:
+                print(f"${price:.2f} | Vol: {volume:.2f}")
         except Exception as e:
             logger.error(f"Order book render error: {e}")
 
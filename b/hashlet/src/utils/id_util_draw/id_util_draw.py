@@ -27,6 +27,7 @@ from matplotlib import MatplotlibDeprecationWarning
 import struct
 import base64
 from kappawise import compute_kappa_grid
+from tetra.gcode import iter_gcode, write_gcode
 
 # Try to import mpld3; if it fails, set a flag to skip HTML export
 try:
@@ -510,26 +511,19 @@ def on_click_dimension(event):
             dimension_labels.append(dim_text)
         fig_2d.canvas.draw()
 # Generate G-code for the curve with variable speeds (for 2D plotting/CNC, scaled to mm)
-def generate_gcode(x, y, speeds, scale=297):
+def generate_gcode(x, y, speeds, scale=297, tolerance=0.02):
     """
-    Generates simple G-code for linear moves along the curve with variable feedrates.
+    Generates G-code for the curve with variable feedrates, simplified to lines and arcs.
     Args:
         x (array): X coordinates (normalized).
         y (array): Y coordinates (normalized).
         speeds (list): Normalized speeds (0-1) for each point.
         scale (float): Scale factor to convert normalized units to mm (based on A3 height=297mm).
+        tolerance (float): Path tolerance in mm; 0 gives one G1 per point.
     Returns:
-        str: G-code string.
+        str: G-code string. Use write_gcode to stream straight to a file instead.
     """
-    gcode = "G21 ; Set units to millimeters\n"
-    gcode += "G90 ; Absolute positioning\n"
-    # Move to start position (rapid)
-    gcode += f"G0 X{x[0] * scale:.2f} Y{y[0] * scale:.2f}\n"
-    # Linear moves with varying feedrate
-    for i in range(1, len(x)):
-        feedrate = speeds[i] * 900 + 100 # Scale speed to 100-1000 mm/min
-        gcode += f"G1 X{x[i] * scale:.2f} Y{y[i] * scale:.2f} F{feedrate:.0f}\n"
-    return gcode
+    return "".join(iter_gcode(x, y, speeds, scale=scale, tolerance=tolerance))
 # Drawing mode: Add kappa nodes and update continuous greencurve
 def on_click_draw(event):
     global green_curve_line, selected_curve, previous_kappa, vanishing_points, current_vertices, current_faces, is_closed
@@ -582,11 +576,9 @@ def on_click_draw(event):
                         print(f"Point {i}: ({x_curve[i]:.4f}, {y_curve[i]:.4f}), Speed: {speed:.4f}")
                         speeds.append(speed)
                     # Generate G-Code
-                    gcode = generate_gcode(x_curve, y_curve, speeds)
                     with open('model.gcode', 'w') as f:
-                        f.write(gcode)
-                    print("G-Code saved to model.gcode")
-                    print(gcode)
+                        line_count = write_gcode(f, x_curve, y_curve, speeds)
+                    print(f"G-Code saved to model.gcode ({line_count} lines)")
                     fig_2d.canvas.draw()
                     return
             # Add new kappa node (first endpoint)
@@ -701,11 +693,9 @@ def auto_close(event):
             print(f"Point {i}: ({x_curve[i]:.4f}, {y_curve[i]:.4f}), Speed: {speed:.4f}")
             speeds.append(speed)
         # Generate G-Code
-        gcode = generate_gcode(x_curve, y_curve, speeds)
         with open('model.gcode', 'w') as f:
-            f.write(gcode)
-        print("G-Code saved to model.gcode")
-        print(gcode)
+            line_count = write_gcode(f, x_curve, y_curve, speeds)
+        print(f"G-Code saved to model.gcode ({line_count} lines)")
         fig_2d.canvas.draw()
 # Change to construction geometry
 def to_construction(event):
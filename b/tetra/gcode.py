@@ -0,0 +1,236 @@
+# gcode.py - Streaming G-code emitter with path simplification and arc fitting
+# Copyright 2025 Beau Ayres
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# Proprietary Software - All Rights Reserved
+#
+# This software is proprietary and confidential. Unauthorized copying,
+# distribution, modification, or use is strictly prohibited without
+# express written permission from Beau Ayres.
+#
+# AGPL-3.0-or-later licensed
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import numpy as np
+
+def simplify_polyline(points, tolerance):
+    """
+    Douglas-Peucker simplification of a 2D polyline.
+    Args:
+        points (array): (N, 2) points.
+        tolerance (float): Max distance of a dropped point from the kept segment.
+    Returns:
+        array: Sorted indices of the points to keep (always includes both ends).
+    """
+    pts = np.asarray(points, dtype=float)
+    n = len(pts)
+    if n < 3 or tolerance <= 0:
+        return np.arange(n)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        seg = pts[b] - pts[a]
+        rel = pts[a + 1:b] - pts[a]
+        seg_len2 = seg @ seg
+        # Distance to the segment (not the infinite line) so doubling-back paths are kept
+        t = np.clip(rel @ seg / seg_len2, 0.0, 1.0) if seg_len2 > 0 else np.zeros(len(rel))
+        d = np.hypot(*(rel - t[:, None] * seg).T)
+        k = int(np.argmax(d))
+        if d[k] > tolerance:
+            m = a + 1 + k
+            keep[m] = True
+            stack.append((a, m))
+            stack.append((m, b))
+    return np.flatnonzero(keep)
+
+def _circle_through(p0, p1, p2):
+    """Center and radius of the circle through three points, or None if collinear."""
+    ax, ay = p0
+    bx, by = p1
+    cx, cy = p2
+    d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    if abs(d) < 1e-12:
+        return None
+    a2, b2, c2 = ax * ax + ay * ay, bx * bx + by * by, cx * cx + cy * cy
+    ux = (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / d
+    uy = (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / d
+    center = np.array([ux, uy])
+    return center, float(np.hypot(*(p0 - center)))
+
+def fit_arc(points, tolerance, max_radius=1e4):
+    """
+    Fits one circular arc through a run of points.
+    Args:
+        points (array): (N, 2) run, N >= 3.
+        tolerance (float): Max radial deviation of any point from the arc.
+        max_radius (float): Larger radii are treated as straight lines.
+    Returns:
+        tuple: (center, clockwise) or None if the run is not an arc within tolerance.
+    """
+    pts = np.asarray(points, dtype=float)
+    if len(pts) < 3:
+        return None
+    circle = _circle_through(pts[0], pts[len(pts) // 2], pts[-1])
+    if circle is None:
+        return None
+    center, radius = circle
+    if radius > max_radius:
+        return None
+    rel = pts - center
+    if np.max(np.abs(np.hypot(rel[:, 0], rel[:, 1]) - radius)) > tolerance:
+        return None
+    # Points must sweep monotonically one way, less than a full turn
+    sweep = np.diff(np.unwrap(np.arctan2(rel[:, 1], rel[:, 0])))
+    if not (np.all(sweep > 0) or np.all(sweep < 0)) or abs(sweep.sum()) >= 2 * np.pi:
+        return None
+    # Chord sag between samples must also stay within tolerance
+    chord = np.hypot(*np.diff(pts, axis=0).T)
+    if np.max(radius - np.sqrt(np.maximum(radius ** 2 - (chord / 2) ** 2, 0.0))) > tolerance:
+        return None
+    return center, bool(sweep[0] < 0)
+
+def _longest_arc(pts, start, tolerance, min_points, max_radius):
+    """Largest end index j such that pts[start:j+1] fits an arc, or None."""
+    n = len(pts)
+    j = start + min_points - 1
+    if j >= n or fit_arc(pts[start:j + 1], tolerance, max_radius) is None:
+        return None
+    # Grow by doubling, then binary search the boundary
+    good, step = j, min_points
+    while good + step < n and fit_arc(pts[start:good + step + 1], tolerance, max_radius) is not None:
+        good += step
+        step *= 2
+    lo, hi = good, min(good + step, n - 1)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if fit_arc(pts[start:mid + 1], tolerance, max_radius) is not None:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def _plan_run(pts, feed, tolerance, arcs, min_arc_points, max_radius, moves):
+    """Appends line and arc moves for one run of points that share a feedrate."""
+    n = len(pts)
+
+    def lines(a, b):
+        idx = simplify_polyline(pts[a:b + 1], tolerance) + a
+        for e in idx[1:]:
+            moves.append(('G1', pts[e], feed))
+
+    line_start = i = 0
+    while i < n - 1:
+        j = _longest_arc(pts, i, tolerance, min_arc_points, max_radius) if arcs else None
+        if j is None:
+            i += 1
+            continue
+        if i > line_start:
+            lines(line_start, i)
+        center, clockwise = fit_arc(pts[i:j + 1], tolerance, max_radius)
+        moves.append(('G2' if clockwise else 'G3', pts[j], feed, center - pts[i]))
+        i = line_start = j
+    if line_start < n - 1:
+        lines(line_start, n - 1)
+
+def plan_moves(points, feeds, tolerance=0.02, arcs=True, min_arc_points=4, max_radius=1e4):
+    """
+    Reduces a sampled path to line and arc moves.
+    Args:
+        points (array): (N, 2) path in machine units.
+        feeds (array): Feedrate of the move ending at each point (feeds[0] unused).
+        tolerance (float): Simplification and arc-fit tolerance in machine units.
+        arcs (bool): Fit G2/G3 arcs before simplifying the remaining lines.
+    Returns:
+        list: Moves as ('G1', end, feed) or ('G2'/'G3', end, feed, center).
+        Only consecutive moves with equal feeds are merged, so the feed profile is kept;
+        the path is split wherever the feed changes and each run is simplified on its own.
+    """
+    pts = np.asarray(points, dtype=float)
+    feeds = np.asarray(feeds, dtype=float)
+    n = len(pts)
+    moves = []
+    if n < 2:
+        return moves
+    # Point k ends a run when the move after it has a different feed
+    bounds = np.concatenate(([0], np.flatnonzero(feeds[2:] != feeds[1:-1]) + 1, [n - 1]))
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        _plan_run(pts[a:b + 1], feeds[b], tolerance, arcs, min_arc_points, max_radius, moves)
+    return moves
+
+def iter_gcode(x, y, speeds, scale=297, tolerance=0.02, arcs=True, feed_step=0):
+    """
+    Streams G-code lines for a curve with variable feedrates.
+    Args:
+        x (array): X coordinates (normalized).
+        y (array): Y coordinates (normalized).
+        speeds (list): Normalized speeds (0-1) for each point.
+        scale (float): Scale factor to convert normalized units to mm (based on A3 height=297mm).
+        tolerance (float): Path tolerance in mm; 0 emits one G1 per point.
+        arcs (bool): Fit G2/G3 arcs where the path allows.
+        feed_step (float): Round feedrates down to this step (mm/min) so more moves share one
+            (default 0: whole mm/min, as emitted).
+    Yields:
+        str: One G-code line at a time, newline-terminated. F is only emitted when it changes.
+    """
+    points = np.column_stack([np.asarray(x, dtype=float), np.asarray(y, dtype=float)]) * scale
+    feeds = np.asarray(speeds, dtype=float) * 900 + 100  # Scale speed to 100-1000 mm/min
+    # Quantize to what is emitted, so runs split exactly where the F word would change
+    feeds = np.floor(feeds / feed_step) * feed_step if feed_step > 0 else np.round(feeds)
+    yield "G21 ; Set units to millimeters\n"
+    yield "G90 ; Absolute positioning\n"
+    if len(points) == 0:
+        return
+    # Move to start position (rapid)
+    yield f"G0 X{points[0, 0]:.2f} Y{points[0, 1]:.2f}\n"
+    last_feed = None
+    for move in plan_moves(points, feeds, tolerance, arcs=arcs and tolerance > 0):
+        code, end, feed = move[:3]
+        line = f"{code} X{end[0]:.2f} Y{end[1]:.2f}"
+        if code != 'G1':
+            line += f" I{move[3][0]:.2f} J{move[3][1]:.2f}"
+        feed = f"{feed:.0f}"
+        if feed != last_feed:
+            line += f" F{feed}"
+            last_feed = feed
+        yield line + "\n"
+
+def write_gcode(stream, x, y, speeds, **kwargs):
+    """Writes G-code to an open text stream without building the program in memory; returns the line count."""
+    count = 0
+    for line in iter_gcode(x, y, speeds, **kwargs):
+        stream.write(line)
+        count += 1
+    return count
+
+# Example usage
+if __name__ == "__main__":
+    t = np.linspace(0, 2 * np.pi, 2000)
+    x, y = 0.5 + 0.3 * np.cos(t), 0.5 + 0.3 * np.sin(t)
+    speeds = np.full(len(t), 0.5)
+    dense = sum(1 for _ in iter_gcode(x, y, speeds, tolerance=0))
+    fitted = sum(1 for _ in iter_gcode(x, y, speeds))
+    print(f"G-code lines: {dense} dense, {fitted} fitted")
@@ -0,0 +1,407 @@
+# geometry.py - Headless geometry core: curves, loft mesh, NURKS surface and STL export
+# Copyright 2025 Beau Ayres
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# Proprietary Software - All Rights Reserved
+#
+# This software is proprietary and confidential. Unauthorized copying,
+# distribution, modification, or use is strictly prohibited without
+# express written permission from Beau Ayres.
+#
+# AGPL-3.0-or-later licensed
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+# No figures, sliders or golden-spiral globals are built at import; the editors
+# (id_util_nurks_surface.py, tetra.py, vorseed.py) are thin clients over this module,
+# and batch jobs can fan build_mesh out over a process pool.
+
+import hashlib
+import struct
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+try:
+    from kappa_grid import kappa_grid as _kappa_grid
+except ImportError:
+    from tetra.kappa_grid import kappa_grid as _kappa_grid
+
+PHI = (1 + np.sqrt(5)) / 2
+A_SPIRAL = 0.001
+B_SPIRAL = np.log(PHI) / (np.pi / 2)
+
+_kappa_grids = {}  # grid_size -> kappa grid, filled on first use per process
+
+def get_kappa_grid(grid_size=100):
+    """Kappa grid for curvature modulation, computed once per process and size."""
+    if grid_size not in _kappa_grids:
+        _kappa_grids[grid_size] = _kappa_grid(grid_size=grid_size)
+    return _kappa_grids[grid_size]
+
+class MeshParams:
+    """Explicit loft/flower parameters for build_mesh (the editors fill these from their sliders)."""
+    def __init__(self, height=0.5, num_rings=20, num_points=None, fractal_level=3, radial_chord=0.5,
+                 tangential_chord=0.2, height_chord=0.1, last_angle=0.0, kappa_grid_size=100):
+        self.height = height
+        self.num_rings = num_rings
+        self.num_points = num_points
+        self.fractal_level = fractal_level
+        self.radial_chord = radial_chord
+        self.tangential_chord = tangential_chord
+        self.height_chord = height_chord
+        self.last_angle = last_angle  # Protractor angle selecting the kappa grid slice
+        self.kappa_grid_size = kappa_grid_size
+
+class SurfaceParams:
+    """Explicit parameters for the NURKS surface (same names as generate_nurks_surface)."""
+    def __init__(self, ns_diam=1.0, sw_ne_diam=1.0, nw_se_diam=1.0, twist=0.0, amplitude=0.3, radii=1.0,
+                 kappa=1.0, height=1.0, inflection=0.5, morph=0.0, hex_mode=False):
+        self.ns_diam = ns_diam
+        self.sw_ne_diam = sw_ne_diam
+        self.nw_se_diam = nw_se_diam
+        self.twist = twist
+        self.amplitude = amplitude
+        self.radii = radii
+        self.kappa = kappa
+        self.height = height
+        self.inflection = inflection
+        self.morph = morph
+        self.hex_mode = hex_mode
+
+# Curves
+def green_curve(points, kappas, is_closed=False):
+    """NURKS green curve through kappa nodes; returns (x, y)."""
+    try:
+        from green_curve import custom_interoperations_green_curve
+    except ImportError:
+        from tetra.green_curve import custom_interoperations_green_curve
+    return custom_interoperations_green_curve(points, kappas, is_closed=is_closed)
+
+def golden_spiral(width=420 / 297, height=1.0, num_points=1000):
+    """Golden spiral scaled to fit the page; returns (x, y)."""
+    theta = np.linspace(0, 10 * np.pi, num_points)
+    r = A_SPIRAL * np.exp(B_SPIRAL * theta)
+    x = r * np.cos(theta)
+    y = r * np.sin(theta)
+    # Scale down to fit within page bounds
+    scale_factor = min(width, height) / (2 * np.max(np.abs([x, y]))) * 0.8  # 80% of max to fit comfortably
+    return x * scale_factor, y * scale_factor
+
+def pod_curve(num_points=200, phase=0.0, params=None):
+    """Closed flower-profile pod curve (3D); returns (x, y, z)."""
+    params = params or MeshParams()
+    t = np.linspace(0, 2 * np.pi, num_points)  # Full closed loop
+    r = params.radial_chord + params.tangential_chord * np.cos(6 * t + phase)  # Flower-like top profile
+    x = r * np.cos(t)
+    y = r * np.sin(t)
+    z = params.height_chord * np.sin(6 * t + phase)  # Add z variation for 3D curve
+    return x, y, z
+
+def datum_center(drawing_points, is_closed, x_curve, y_curve):
+    """Loft datum: node 2 when closed, else node 1, else the curve centroid."""
+    if drawing_points:
+        node = drawing_points[1] if is_closed and len(drawing_points) > 1 else drawing_points[0]
+        return node[0], node[1]
+    return np.mean(x_curve), np.mean(y_curve)
+
+# Loft
+def fractal_flower(center, scale, level, all_polygons, all_guide_curves, rotation_angle=0.0, params=None):
+    """
+    Recursively generates flower-shaped polygons for the surface.
+    Collects all base-level flower polygons in all_polygons (list of list of [x,y,z]).
+    Uses 36 points for better flower resolution with curved petals.
+    Applies rotation to the points.
+    Adds guide curves from petal to petal control points using diameter logic (connecting opposite petals).
+    Args:
+        center: [x, y, z] center of the flower.
+        scale: Scale factor for the flower size.
+        level: Current recursion depth.
+        all_polygons: List to collect all base flower polygons.
+        all_guide_curves: List to collect guide curves (list of [p1, p2] pairs for lines).
+        rotation_angle: Rotation angle in radians for the flower.
+        params: MeshParams supplying the radial/tangential/height chords.
+    """
+    params = params or MeshParams()
+    rot_cos = np.cos(rotation_angle)
+    rot_sin = np.sin(rotation_angle)
+    num_points = 37  # 36 points for higher resolution
+    t = np.linspace(0, 2 * np.pi, num_points)[:-1]
+    r = scale * (params.radial_chord + params.tangential_chord * np.sin(6 * t))  # 6 petals, use sin for symmetry if needed
+    dx = r * np.cos(t)
+    dy = r * np.sin(t)
+    dz = scale * params.height_chord * np.cos(6 * t)  # Curved z for surface
+    # Apply rotation to dx, dy (around z)
+    x_rot = center[0] + dx * rot_cos - dy * rot_sin
+    y_rot = center[1] + dx * rot_sin + dy * rot_cos
+    z_rot = center[2] + dz
+    polygon = [[x_rot[j], y_rot[j], z_rot[j]] for j in range(len(t))]
+    all_polygons.append(polygon)
+    # Add guide curves using diameter logic (connect opposite points for each petal pair)
+    num_petals = 6
+    points_per_petal = len(t) // num_petals
+    for p in range(num_petals // 2):  # Pair opposite petals (0-3, 1-4, 2-5)
+        petal1_mid = p * points_per_petal + points_per_petal // 2
+        petal2_mid = (p + num_petals // 2) * points_per_petal + points_per_petal // 2
+        all_guide_curves.append([polygon[petal1_mid], polygon[petal2_mid]])  # Add line between control points
+    if level == 0:
+        return
+    # Add smaller flowers at petal tips
+    small_scale = scale / PHI  # Golden ratio scale
+    for i in range(6):
+        theta = i * (2 * np.pi / 6)
+        tip_r = scale * (params.radial_chord + params.tangential_chord)  # Max r for tip
+        tip_dx = tip_r * np.cos(theta)
+        tip_dy = tip_r * np.sin(theta)
+        tip_dz = scale * params.height_chord
+        # Rotate tip offset
+        tip_x = center[0] + tip_dx * rot_cos - tip_dy * rot_sin
+        tip_y = center[1] + tip_dx * rot_sin + tip_dy * rot_cos
+        tip_z = center[2] + tip_dz
+        fractal_flower([tip_x, tip_y, tip_z], small_scale, level - 1, all_polygons, all_guide_curves,
+                       rotation_angle + np.pi, params)
+
+def triangulate_poly(poly):
+    """Fan triangulation of a polygon."""
+    tris = []
+    for i in range(1, len(poly) - 1):
+        tris.append([poly[0], poly[i], poly[i + 1]])
+    return tris
+
+def hash_entropy(p):
+    """Deterministic +-0.025 jitter for the lower surface."""
+    h_str = f"{p[0]:.6f}{p[1]:.6f}{p[2]:.6f}"
+    return int(hashlib.sha256(h_str.encode()).hexdigest(), 16) % 1000 / 1000.0 * 0.05 - 0.025
+
+def build_mesh(x_curve, y_curve, z_curve=None, params=None, center=None):
+    """
+    Builds two surfaces meeting at the 3D curve with vertical tangent, inheriting each other's curvature in transition.
+    Integrates fractal flower for complex surface detail on caps, scaled by curve length.
+    Uses flower modulation in loft rings for interlacing petals.
+    Args:
+        x_curve, y_curve, z_curve: Curve coordinates.
+        params: MeshParams (height, rings, sampling, flower chords, kappa grid angle).
+        center: (x, y) loft datum; defaults to the curve centroid (see datum_center).
+    Returns:
+        vertices (np.array): Array of [x, y, z].
+        faces (list): List of [idx1, idx2, idx3].
+    """
+    params = params or MeshParams()
+    height = params.height
+    num_rings = params.num_rings
+    radial_chord = params.radial_chord
+    tangential_chord = params.tangential_chord
+    height_chord = params.height_chord
+    x_curve = np.asarray(x_curve)
+    y_curve = np.asarray(y_curve)
+    if params.num_points is not None:
+        indices = np.linspace(0, len(x_curve) - 1, params.num_points, dtype=int)
+        x_curve = x_curve[indices]
+        y_curve = y_curve[indices]
+        if z_curve is not None:
+            z_curve = np.asarray(z_curve)[indices]
+    n = len(x_curve)
+    if z_curve is None:
+        z_curve = np.zeros(n)  # Default to flat if no z provided
+    center_x, center_y = center if center is not None else (np.mean(x_curve), np.mean(y_curve))
+    vertices = []
+    faces = []
+    # Parting line on 3D curve
+    parting_base = len(vertices)
+    for i in range(n):
+        vertices.append([x_curve[i], y_curve[i], z_curve[i]])
+    z = 0.0  # Lower-surface entropy seeds from the last z computed
+    # Upper surface: rings inward with vertical tangent at edge and flower modulation
+    upper_bases = [parting_base]
+    for l in range(1, num_rings):
+        s = l / (num_rings - 1.0)
+        scale = 1 - s**2  # Vertical tangent at s=0 (dr/ds=0)
+        g_val = (height / 2) * s**2  # Quadratic for constant curvature
+        base = len(vertices)
+        upper_bases.append(base)
+        for i in range(n):
+            vec_x = x_curve[i] - center_x
+            vec_y = y_curve[i] - center_y
+            norm = np.sqrt(vec_x**2 + vec_y**2)
+            if norm > 0:
+                dir_x = vec_x / norm
+                dir_y = vec_y / norm
+            else:
+                dir_x = 1.0
+                dir_y = 0.0
+            theta = np.arctan2(vec_y, vec_x)
+            phase = 0.0  # Upper phase
+            flower_mod = tangential_chord * np.cos(6 * theta + phase) * s  # Modulation increases inward
+            r = norm * scale * (radial_chord + flower_mod)
+            x = center_x + r * dir_x
+            y = center_y + r * dir_y
+            z = z_curve[i] * (1 - s) + g_val + height_chord * np.sin(6 * theta + phase)
+            vertices.append([x, y, z])
+    center_upper_idx = len(vertices)
+    vertices.append([center_x, center_y, height / 2])
+    # Lower surface: mirrored with phase offset for interlacing and entropy
+    lower_bases = [parting_base]  # Shared edge
+    for l in range(1, num_rings):
+        s = l / (num_rings - 1.0)
+        scale = 1 - s**2
+        g_val = (height / 2) * s**2  # Quadratic for constant curvature (sign same for inheritance magnitude)
+        base = len(vertices)
+        lower_bases.append(base)
+        for i in range(n):
+            vec_x = x_curve[i] - center_x
+            vec_y = y_curve[i] - center_y
+            norm = np.sqrt(vec_x**2 + vec_y**2)
+            if norm > 0:
+                dir_x = vec_x / norm
+                dir_y = vec_y / norm
+            else:
+                dir_x = 1.0
+                dir_y = 0.0
+            theta = np.arctan2(vec_y, vec_x)
+            phase = np.pi / 6  # Lower phase offset for interlacing
+            flower_mod = tangential_chord * np.cos(6 * theta + phase) * s
+            r = norm * scale * (radial_chord + flower_mod)
+            x = center_x + r * dir_x
+            y = center_y + r * dir_y
+            z = z_curve[i] * (1 - s) - g_val + hash_entropy([x, y, z]) + height_chord * np.sin(6 * theta + phase)
+            vertices.append([x, y, z])
+    center_lower_idx = len(vertices)
+    vertices.append([center_x, center_y, -height / 2])
+    # Faces for upper surface
+    for ll in range(len(upper_bases) - 1):
+        base = upper_bases[ll]
+        next_base = upper_bases[ll + 1]
+        for i in range(n):
+            next_i = (i + 1) % n
+            faces.append([base + i, base + next_i, next_base + next_i])
+            faces.append([base + i, next_base + next_i, next_base + i])
+    # Faces for lower surface
+    for ll in range(len(lower_bases) - 1):
+        base = lower_bases[ll]
+        next_base = lower_bases[ll + 1]
+        for i in range(n):
+            next_i = (i + 1) % n
+            faces.append([base + i, next_base + i, next_base + next_i])
+            faces.append([base + i, next_base + next_i, base + next_i])
+    # Integrate fractal flower for caps, scaled by curve length
+    curve_length = np.sum(np.sqrt(np.diff(x_curve)**2 + np.diff(y_curve)**2))
+    flower_scale = curve_length * 0.1 if curve_length > 0 else 0.5  # Scale to curve
+    all_polygons = []  # List of list of [x,y,z] for each polygon
+    all_guide_curves = []  # Guide curve pairs
+    fractal_flower(vertices[center_upper_idx], flower_scale, params.fractal_level, all_polygons, all_guide_curves,
+                   rotation_angle=np.pi, params=params)  # Upper cap flower
+    fractal_flower(vertices[center_lower_idx], flower_scale, params.fractal_level, all_polygons, all_guide_curves,
+                   rotation_angle=np.pi, params=params)  # Lower cap flower
+    # Add polygons to mesh (triangulate for rendering)
+    for poly in all_polygons:
+        base_idx = len(vertices)
+        vertices.extend(poly)
+        for tri in triangulate_poly(range(len(poly))):
+            faces.append([base_idx + tri[0], base_idx + tri[1], base_idx + tri[2]])
+    # Add guide curves as edges (degenerate faces, visual only)
+    for guide in all_guide_curves:
+        base_idx = len(vertices)
+        vertices.append(guide[0])
+        vertices.append(guide[1])
+        faces.append([base_idx, base_idx + 1, base_idx + 1])
+    vertices = np.array(vertices)
+    # Snap to integers if hash ends with 0
+    for i in range(len(vertices)):
+        v = vertices[i]
+        h_str = f"{v[0]:.6f}{v[1]:.6f}{v[2]:.4f}"
+        if hashlib.sha256(h_str.encode()).hexdigest()[-1] == '0':
+            vertices[i] = np.round(vertices[i])
+    # Add compound curvature modulation with angle and 3D kappa grid for smooth orthographic projections
+    kappa_grid = get_kappa_grid(params.kappa_grid_size)
+    grid_size, _, num_angles = kappa_grid.shape
+    angle_idx = int((params.last_angle / 360) * num_angles) % num_angles
+    kappa_slice = kappa_grid[:, :, angle_idx]
+    # Normalize vertices to -1 to 1 for grid mapping
+    max_dim = max(np.max(np.abs(vertices[:, 0])), np.max(np.abs(vertices[:, 1])))
+    norm_x = np.clip(((vertices[:, 0] / max_dim) + 1) / 2 * (grid_size - 1), 0, grid_size - 1).astype(int)
+    norm_y = np.clip(((vertices[:, 1] / max_dim) + 1) / 2 * (grid_size - 1), 0, grid_size - 1).astype(int)
+    kappa_mod = kappa_slice[norm_y, norm_x]
+    vertices[:, 2] += kappa_mod * 0.1  # Scale z modulation
+    vertices[:, 0] += kappa_mod * 0.05 * np.sin(2 * np.pi * vertices[:, 2] / height)  # Compound in x
+    vertices[:, 1] += kappa_mod * 0.05 * np.cos(2 * np.pi * vertices[:, 2] / height)  # Compound in y
+    # Make flowers sacrificial: remove flower faces after modulation (last added are flowers)
+    flower_face_start = len(faces) - len(all_polygons) * 35  # 36 points per flower (approx 35 triangles)
+    return vertices, faces[:flower_face_start]
+
+def _build_mesh_job(job):
+    x_curve, y_curve, z_curve, params = job
+    return build_mesh(x_curve, y_curve, z_curve, params=params)
+
+def build_meshes(jobs, workers=None):
+    """
+    Builds many meshes headlessly across a process pool.
+    Args:
+        jobs: Iterable of (x_curve, y_curve, z_curve, MeshParams) tuples.
+        workers: Pool size (default os.cpu_count()); 1 runs inline.
+    Returns:
+        list: (vertices, faces) per job, in job order.
+    """
+    jobs = list(jobs)
+    if workers == 1:
+        return [_build_mesh_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_build_mesh_job, jobs))
+
+# NURKS surface
+def nurks_surface(params=None):
+    """NURKS surface grids for SurfaceParams; returns (X, Y, Z, surface_id, X_cap, Y_cap, Z_cap)."""
+    try:
+        from nurks_surface import generate_nurks_surface  # Deferred: pulls in kappasha256 and ribit
+    except ImportError:
+        from tetra.nurks_surface import generate_nurks_surface
+    return generate_nurks_surface(**vars(params or SurfaceParams()), verbose=False)
+
+# STL
+def compute_normal(v1, v2, v3):
+    """Unit normal of a triangle (zero vector when degenerate)."""
+    normal = np.cross(v2 - v1, v3 - v1)
+    norm = np.linalg.norm(normal)
+    return normal / norm if norm != 0 else normal
+
+def stl_bytes(vertices, faces, header=b''):
+    """Binary STL for a vertex/face mesh."""
+    vertices = np.asarray(vertices, dtype=float)
+    tris = vertices[np.asarray(faces, dtype=int).reshape(-1, 3)]
+    normals = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths != 0)
+    records = np.zeros(len(tris), dtype=[('normal', '<f4', 3), ('verts', '<f4', (3, 3)), ('attr', '<u2')])
+    records['normal'] = normals
+    records['verts'] = tris
+    return header[:80].ljust(80, b'\x00') + struct.pack('<I', len(tris)) + records.tobytes()
+
+def write_stl(vertices, faces, filename, header=b''):
+    """Writes a binary STL and returns the bytes written."""
+    data = stl_bytes(vertices, faces, header)
+    with open(filename, 'wb') as f:
+        f.write(data)
+    return data
+
+# Example usage
+if __name__ == "__main__":
+    params = MeshParams(num_points=60)
+    curves = [pod_curve(200, phase=p, params=params) for p in np.linspace(0, np.pi / 3, 4)]
+    meshes = build_meshes([(x, y, z, params) for x, y, z in curves])
+    for k, (vertices, faces) in enumerate(meshes):
+        print(f"Mesh {k}: {len(vertices)} vertices, {len(faces)} faces, {len(stl_bytes(vertices, faces))} STL bytes")
@@ -32,7 +32,6 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 #
 import numpy as np
-import matplotlib.pyplot as plt
 
 def bspline_basis(u, i, p, knots):
     """B-spline basis function for curve interpolation.
@@ -131,6 +130,7 @@ def custom_interoperations_green_curve(points, kappas, is_closed=False):
     return smooth_x, smooth_y
 
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
     # Example usage: Open curve with 3 points
     points = [[0, 0], [0.5, 1], [1, 0]]  # Simple curve points
     kappas = [1.0, 1.0, 1.0]  # Weights
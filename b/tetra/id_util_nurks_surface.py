@@ -51,6 +51,8 @@ except ImportError:
 from temperature_salt import secure_hash_two
 from kappawise import kappa_coord
 from nurks_surface import bspline_basis, bspline_basis_periodic, custom_interoperations_green_curve
+from gcode import iter_gcode, write_gcode
+from geometry import MeshParams, build_mesh as geometry_build_mesh, datum_center, golden_spiral, pod_curve, stl_bytes
 # Set precision for Decimal
 getcontext().prec = 28
 # Suppress warnings
@@ -208,231 +210,15 @@ last_angle = 0.0 # Last measured angle from protractor
 show_harmonics = False
 harmonic_texts = []
 annotation_objects = []
-# Pre-compute kappa grid
-kappa_grid = compute_kappa_grid(grid_size=100)
-# Fractal Flower Mesh with guide curves using diameter logic
-def fractal_flower(center, scale, level, all_polygons, all_guide_curves, rotation_angle=0.0):
-    """
-    Recursively generates flower-shaped polygons for the surface.
-    Collects all base-level flower polygons in all_polygons (list of list of [x,y,z]).
-    Uses 36 points for better flower resolution with curved petals.
-    Applies rotation to the points.
-    Adds guide curves from petal to petal control points using diameter logic (connecting opposite petals).
-    Args:
-        center: [x, y, z] center of the flower.
-        scale: Scale factor for the flower size.
-        level: Current recursion depth.
-        all_polygons: List to collect all base flower polygons.
-        all_guide_curves: List to collect guide curves (list of [p1, p2] pairs for lines).
-        rotation_angle: Rotation angle in radians for the flower.
-    """
-    rot_cos = np.cos(rotation_angle)
-    rot_sin = np.sin(rotation_angle)
-    num_points = 37 # 36 points for higher resolution
-    t = np.linspace(0, 2 * np.pi, num_points)[:-1]
-    r = scale * (radial_chord + tangential_chord * np.sin(6 * t)) # 6 petals, use sin for symmetry if needed
-    dx = r * np.cos(t)
-    dy = r * np.sin(t)
-    dz = scale * height_chord * np.cos(6 * t) # Curved z for surface
-    # Apply rotation to dx, dy (around z)
-    x_rot = center[0] + dx * rot_cos - dy * rot_sin
-    y_rot = center[1] + dx * rot_sin + dy * rot_cos
-    z_rot = center[2] + dz
-    polygon = [[x_rot[j], y_rot[j], z_rot[j]] for j in range(len(t))]
-    all_polygons.append(polygon)
-    # Add guide curves using diameter logic (connect opposite points for each petal pair)
-    num_petals = 6
-    points_per_petal = len(t) // num_petals
-    for p in range(num_petals // 2): # Pair opposite petals (0-3, 1-4, 2-5)
-        petal1_start = p * points_per_petal
-        petal2_start = (p + num_petals // 2) * points_per_petal
-        # Take midpoint control points of each petal
-        petal1_mid = petal1_start + points_per_petal // 2
-        petal2_mid = petal2_start + points_per_petal // 2
-        p1 = polygon[petal1_mid]
-        p2 = polygon[petal2_mid]
-        all_guide_curves.append([p1, p2]) # Add line between control points
-    if level == 0:
-        return
-    # Add smaller flowers at petal tips
-    small_scale = scale / PHI # Golden ratio scale
-    for i in range(6):
-        theta = i * (2 * np.pi / 6)
-        tip_r = scale * (radial_chord + tangential_chord) # Max r for tip
-        tip_dx = tip_r * np.cos(theta)
-        tip_dy = tip_r * np.sin(theta)
-        tip_dz = scale * height_chord
-        # Rotate tip offset
-        tip_x = center[0] + tip_dx * rot_cos - tip_dy * rot_sin
-        tip_y = center[1] + tip_dx * rot_sin + tip_dy * rot_cos
-        tip_z = center[2] + tip_dz
-        tip_center = [tip_x, tip_y, tip_z]
-        fractal_flower(tip_center, small_scale, level - 1, all_polygons, all_guide_curves, rotation_angle + np.pi)
-# Triangulate polygon for rendering (fan triangulation)
-def triangulate_poly(poly):
-    tris = []
-    for i in range(1, len(poly) - 1):
-        tris.append([poly[0], poly[i], poly[i+1]])
-    return tris
-# Hash entropy for lower surface
-def hash_entropy(p):
-    h_str = f"{p[0]:.6f}{p[1]:.6f}{p[2]:.6f}"
-    h = int(hashlib.sha256(h_str.encode()).hexdigest(), 16) % 1000 / 1000.0 * 0.05 - 0.025
-    return h
-# Build mesh using fractal flower (ties to curve by scaling to curve length)
+# Build mesh through the headless geometry core, filling its parameters from the editor state
+def mesh_params(height=0.5, num_rings=20, num_points=None, fractal_level=3):
+    return MeshParams(height=height, num_rings=num_rings, num_points=num_points, fractal_level=fractal_level,
+                      radial_chord=radial_chord, tangential_chord=tangential_chord, height_chord=height_chord,
+                      last_angle=last_angle)
 def build_mesh(x_curve, y_curve, z_curve=None, height=0.5, num_rings=20, num_points=None, fractal_level=3):
-    """
-    Builds two surfaces meeting at the 3D curve with vertical tangent, inheriting each other's curvature in transition.
-    Integrates fractal flower for complex surface detail on caps, scaled by curve length.
-    Uses flower modulation in loft rings for interlacing petals.
-    Now collects guide curves from petal to petal and adds them as edges in the mesh.
-    Args:
-        x_curve, y_curve, z_curve: Curve coordinates.
-        height: Height for lofting.
-        num_rings: Number of rings for loft.
-        num_points: Number of points to sample curve.
-        fractal_level: Recursion level for fractal flower.
-    Returns:
-        vertices (np.array): Array of [x, y, z].
-        faces (list): List of [idx1, idx2, idx3].
-    """
-    if num_points is not None:
-        indices = np.linspace(0, len(x_curve) - 1, num_points, dtype=int)
-        x_curve = x_curve[indices]
-        y_curve = y_curve[indices]
-        if z_curve is not None:
-            z_curve = z_curve[indices]
-    n = len(x_curve)
-    if z_curve is None:
-        z_curve = np.zeros(n) # Default to flat if no z provided
-    # Use node 2 as datum when closed
-    center_x = drawing_points[1][0] if is_closed and len(drawing_points) > 1 else drawing_points[0][0] if drawing_points else np.mean(x_curve)
-    center_y = drawing_points[1][1] if is_closed and len(drawing_points) > 1 else drawing_points[0][1] if drawing_points else np.mean(y_curve)
-    vertices = []
-    faces = []
-    # Parting line on 3D curve
-    parting_base = len(vertices)
-    for i in range(n):
-        vertices.append([x_curve[i], y_curve[i], z_curve[i]])
-    # Upper surface: rings inward with vertical tangent at edge and flower modulation
-    upper_bases = [parting_base]
-    for l in range(1, num_rings):
-        s = l / (num_rings - 1.0)
-        scale = 1 - s**2 # Vertical tangent at s=0 (dr/ds=0)
-        g_val = (height / 2) * s**2 # Quadratic for constant curvature
-        base = len(vertices)
-        upper_bases.append(base)
-        for i in range(n):
-            vec_x = x_curve[i] - center_x
-            vec_y = y_curve[i] - center_y
-            norm = np.sqrt(vec_x**2 + vec_y**2)
-            if norm > 0:
-                dir_x = vec_x / norm
-                dir_y = vec_y / norm
-            else:
-                dir_x = 1.0
-                dir_y = 0.0
-            theta = np.arctan2(vec_y, vec_x)
-            phase = 0.0 # Upper phase
-            flower_mod = tangential_chord * np.cos(6 * theta + phase) * s # Modulation increases inward
-            r = norm * scale * (radial_chord + flower_mod)
-            x = center_x + r * dir_x
-            y = center_y + r * dir_y
-            z = z_curve[i] * (1 - s) + g_val + height_chord * np.sin(6 * theta + phase)
-            vertices.append([x, y, z])
-    center_upper_idx = len(vertices)
-    vertices.append([center_x, center_y, height / 2])
-    # Lower surface: mirrored with phase offset for interlacing and entropy
-    lower_bases = [parting_base] # Shared edge
-    for l in range(1, num_rings):
-        s = l / (num_rings - 1.0)
-        scale = 1 - s**2
-        g_val = (height / 2) * s**2 # Quadratic for constant curvature (sign same for inheritance magnitude)
-        base = len(vertices)
-        lower_bases.append(base)
-        for i in range(n):
-            vec_x = x_curve[i] - center_x
-            vec_y = y_curve[i] - center_y
-            norm = np.sqrt(vec_x**2 + vec_y**2)
-            if norm > 0:
-                dir_x = vec_x / norm
-                dir_y = vec_y / norm
-            else:
-                dir_x = 1.0
-                dir_y = 0.0
-            theta = np.arctan2(vec_y, vec_x)
-            phase = np.pi / 6 # Lower phase offset for interlacing
-            flower_mod = tangential_chord * np.cos(6 * theta + phase) * s
-            r = norm * scale * (radial_chord + flower_mod)
-            x = center_x + r * dir_x
-            y = center_y + r * dir_y
-            z = z_curve[i] * (1 - s) - g_val + hash_entropy([x, y, z]) + height_chord * np.sin(6 * theta + phase)
-            vertices.append([x, y, z])
-    center_lower_idx = len(vertices)
-    vertices.append([center_x, center_y, -height / 2])
-    # Faces for upper surface
-    for ll in range(len(upper_bases) - 1):
-        base = upper_bases[ll]
-        next_base = upper_bases[ll + 1]
-        for i in range(n):
-            next_i = (i + 1) % n
-            faces.append([base + i, base + next_i, next_base + next_i])
-            faces.append([base + i, next_base + next_i, next_base + i])
-    # Faces for lower surface
-    for ll in range(len(lower_bases) - 1):
-        base = lower_bases[ll]
-        next_base = lower_bases[ll + 1]
-        for i in range(n):
-            next_i = (i + 1) % n
-            faces.append([base + i, next_base + i, next_base + next_i])
-            faces.append([base + i, next_base + next_i, base + next_i])
-    # Integrate fractal flower for caps (no fan, use flower fractals)
-    # Compute curve length for scale
-    curve_length = np.sum(np.sqrt(np.diff(x_curve)**2 + np.diff(y_curve)**2))
-    flower_scale = curve_length * 0.1 if curve_length > 0 else 0.5 # Scale to curve
-    all_polygons = [] # List of list of [x,y,z] for each polygon
-    all_guide_curves = [] # New: Collect guide curve pairs
-    # Upper cap flower
-    fractal_flower(vertices[center_upper_idx], flower_scale, fractal_level, all_polygons, all_guide_curves, rotation_angle=np.pi)
-    # Lower cap flower
-    fractal_flower(vertices[center_lower_idx], flower_scale, fractal_level, all_polygons, all_guide_curves, rotation_angle=np.pi)
-    # Add polygons to mesh (triangulate for rendering)
-    for poly in all_polygons:
-        base_idx = len(vertices)
-        vertices.extend(poly)
-        for tri in triangulate_poly(range(len(poly))):
-            faces.append([base_idx + tri[0], base_idx + tri[1], base_idx + tri[2]])
-    # Add guide curves as edges (simple lines, add as degenerate faces or separate for visualization)
-    for guide in all_guide_curves:
-        base_idx = len(vertices)
-        vertices.append(guide[0])
-        vertices.append(guide[1])
-        faces.append([base_idx, base_idx + 1, base_idx + 1]) # Degenerate tri for line (visual only)
-    # Convert to numpy array
-    vertices = np.array(vertices)
-    # Snap to integers if hash ends with 0
-    for i in range(len(vertices)):
-        v = vertices[i]
-        h_str = f"{v[0]:.6f}{v[1]:.6f}{v[2]:.4f}"
-        h = hashlib.sha256(h_str.encode()).hexdigest()[-1]
-        if h == '0':
-            vertices[i] = np.round(vertices[i])
-    # Add compound curvature modulation with angle and 3D kappa grid for smooth orthographic projections
-    grid_size, _, num_angles = kappa_grid.shape
-    angle_idx = int((last_angle / 360) * num_angles) % num_angles
-    kappa_slice = kappa_grid[:, :, angle_idx]
-    # Normalize vertices to -1 to 1 for grid mapping (assuming curve bounds approx [0, WIDTH] x [0, HEIGHT])
-    max_dim = max(np.max(np.abs(vertices[:, 0])), np.max(np.abs(vertices[:, 1])))
-    norm_x = np.clip(((vertices[:, 0] / max_dim) + 1) / 2 * (grid_size - 1), 0, grid_size - 1).astype(int)
-    norm_y = np.clip(((vertices[:, 1] / max_dim) + 1) / 2 * (grid_size - 1), 0, grid_size - 1).astype(int)
-    kappa_mod = kappa_slice[norm_y, norm_x]
-    vertices[:, 2] += kappa_mod * 0.1 # Scale z modulation
-    vertices[:, 0] += kappa_mod * 0.05 * np.sin(2 * np.pi * vertices[:, 2] / height) # Compound in x
-    vertices[:, 1] += kappa_mod * 0.05 * np.cos(2 * np.pi * vertices[:, 2] / height) # Compound in y
-    # Make flowers sacrificial: remove flower faces after modulation (assume last added are flowers)
-    flower_face_start = len(faces) - len(all_polygons) * 35 # Adjusted for 36 points per flower (approx 35 triangles)
-    faces = faces[:flower_face_start]
-    return vertices, faces
+    """Editor wrapper over geometry.build_mesh using the drawn kappa nodes as loft datum."""
+    center = datum_center(drawing_points, is_closed, x_curve, y_curve)
+    return geometry_build_mesh(x_curve, y_curve, z_curve, params=mesh_params(height, num_rings, num_points, fractal_level), center=center)
 # NURBS basis function
 def nurbs_basis(u, i, p, knots):
     if p == 0:
@@ -469,15 +255,7 @@ def generate_nurbs_curve(points, weights, p, knots, num_points=1000):
     return np.array([list(pt) for pt in curve]) # Convert to np.array of shape (num_points+1, 2)
 # Compute golden spiral
 def compute_golden_spiral():
-    theta = np.linspace(0, 10 * np.pi, 1000)
-    r = A_SPIRAL * np.exp(B_SPIRAL * theta)
-    x = r * np.cos(theta)
-    y = r * np.sin(theta)
-    # Scale down to fit within page bounds
-    scale_factor = min(WIDTH, HEIGHT) / (2 * np.max(np.abs([x, y]))) * 0.8 # 80% of max to fit comfortably
-    x *= scale_factor
-    y *= scale_factor
-    return x, y
+    return golden_spiral(WIDTH, HEIGHT)
 def bspline_basis(u, i, p, knots):
     if p == 0:
         if i < 0 or i + 1 >= len(knots):
@@ -940,26 +718,19 @@ def on_motion(event):
         ghost_curve.set_data(x_ghost, y_ghost)
         fig_2d.canvas.draw()
 # Generate G-code for the curve with variable speeds (for 2D plotting/CNC, scaled to mm)
-def generate_gcode(x, y, speeds, scale=297):
+def generate_gcode(x, y, speeds, scale=297, tolerance=0.02):
     """
-    Generates simple G-code for linear moves along the curve with variable feedrates.
+    Generates G-code for the curve with variable feedrates, simplified to lines and arcs.
     Args:
         x (array): X coordinates (normalized).
         y (array): Y coordinates (normalized).
         speeds (list): Normalized speeds (0-1) for each point.
         scale (float): Scale factor to convert normalized units to mm (based on A3 height=297mm).
+        tolerance (float): Path tolerance in mm; 0 gives one G1 per point.
     Returns:
-        str: G-code string.
+        str: G-code string. Use write_gcode to stream straight to a file instead.
     """
-    gcode = "G21 ; Set units to millimeters\n"
-    gcode += "G90 ; Absolute positioning\n"
-    # Move to start position (rapid)
-    gcode += f"G0 X{x[0] * scale:.2f} Y{y[0] * scale:.2f}\n"
-    # Linear moves with varying feedrate
-    for i in range(1, len(x)):
-        feedrate = speeds[i] * 900 + 100 # Scale speed to 100-1000 mm/min
-        gcode += f"G1 X{x[i] * scale:.2f} Y{y[i] * scale:.2f} F{feedrate:.0f}\n"
-    return gcode
+    return "".join(iter_gcode(x, y, speeds, scale=scale, tolerance=tolerance))
 # Drawing mode: Add kappa nodes and update continuous greencurve
 def on_click_draw(event):
     global green_curve_line, selected_curve, previous_kappa, vanishing_points, current_vertices, current_faces, is_closed
@@ -1012,11 +783,9 @@ def on_click_draw(event):
                         print(f"Point {i}: ({x_curve[i]:.4f}, {y_curve[i]:.4f}), Speed: {speed:.4f}")
                         speeds.append(speed)
                     # Generate G-Code
-                    gcode = generate_gcode(x_curve, y_curve, speeds)
                     with open('model.gcode', 'w') as f:
-                        f.write(gcode)
-                    print("G-Code saved to model.gcode")
-                    print(gcode)
+                        line_count = write_gcode(f, x_curve, y_curve, speeds)
+                    print(f"G-Code saved to model.gcode ({line_count} lines)")
                     fig_2d.canvas.draw()
                     return
             # Add new kappa node (first endpoint)
@@ -1097,11 +866,9 @@ def auto_close(event):
             print(f"Point {i}: ({x_curve[i]:.4f}, {y_curve[i]:.4f}), Speed: {speed:.4f}")
             speeds.append(speed)
         # Generate G-Code
-        gcode = generate_gcode(x_curve, y_curve, speeds)
         with open('model.gcode', 'w') as f:
-            f.write(gcode)
-        print("G-Code saved to model.gcode")
-        print(gcode)
+            line_count = write_gcode(f, x_curve, y_curve, speeds)
+        print(f"G-Code saved to model.gcode ({line_count} lines)")
         fig_2d.canvas.draw()
 # Change to construction geometry
 def to_construction(event):
@@ -1173,37 +940,14 @@ def compute_curvature(x, y, t):
     return numerator / denominator
 # Generate base pod curve (closed for boundary surface, now 3D curve)
 def generate_pod_curve_closed(num_points=200, phase=0.0): # Increased num_points for better resolution
-    t = np.linspace(0, 2 * np.pi, num_points) # Full closed loop
-    r = radial_chord + tangential_chord * np.cos(6 * t + phase) # Flower-like top profile
-    x = r * np.cos(t)
-    y = r * np.sin(t)
-    z = height_chord * np.sin(6 * t + phase) # Add z variation for 3D curve
-    return x, y, z
-# Function to compute normals
-def compute_normal(v1, v2, v3):
-    vec1 = v2 - v1
-    vec2 = v3 - v1
-    normal = np.cross(vec1, vec2)
-    norm = np.linalg.norm(normal)
-    return normal / norm if norm != 0 else normal
+    return pod_curve(num_points, phase, mesh_params())
 # Export current model to STL
 def export_stl():
     global current_vertices, current_faces
     if current_vertices is None or current_faces is None:
         print("No model to export")
         return
-    stl_data = b'\x00' * 80 # Header
-    stl_data += struct.pack('<I', len(current_faces)) # Number of triangles
-    for face in current_faces:
-        v1 = current_vertices[face[0]]
-        v2 = current_vertices[face[1]]
-        v3 = current_vertices[face[2]]
-        normal = compute_normal(v1, v2, v3)
-        stl_data += struct.pack('<3f', *normal)
-        stl_data += struct.pack('<3f', *v1)
-        stl_data += struct.pack('<3f', *v2)
-        stl_data += struct.pack('<3f', *v3)
-        stl_data += b'\x00\x00' # Attribute byte count
+    stl_data = stl_bytes(current_vertices, current_faces)
     filename = 'model.stl'
     with open(filename, 'wb') as f:
         f.write(stl_data)
@@ -58,6 +58,22 @@ def kappa_orbit(t, freqs=[3, 5, 7], polarity_swap=True):
         return -k_real + 1j * k_imag
     return k_real + 1j * k_imag
 
+def diagonal_swap(bits):
+    """Perform a tetrahedral diagonal swap on a bit array.
+
+    Bit i moves to (i + n // 4) % n, i.e. a roll along the last axis done as
+    two slice copies, so a (batch, n) array swaps every row at once.
+    """
+    bits = np.asarray(bits)
+    shift = bits.shape[-1] // 4
+    swapped = np.empty(bits.shape, dtype=np.int8)
+    if not shift:
+        swapped[...] = bits
+        return swapped
+    swapped[..., shift:] = bits[..., :-shift]
+    swapped[..., :shift] = bits[..., -shift:]
+    return swapped
+
 def kappa_spiral_hash(data: str, comfort_vec: np.ndarray, theta_base=100, laps=18):
     """Generate 1664/3328-bit hash with reverse-tuple, polarity swap, spiral mapping."""
     # Step 1: Base 1664-bit hash
@@ -77,7 +93,7 @@ def kappa_spiral_hash(data: str, comfort_vec: np.ndarray, theta_base=100, laps=1
         full_hash = (~full_hash) & ((1 << 3328) - 1)  # Bitwise NOT with wrap
     # Step 4: Spiral mapping with tetrahedral recursion
     bits = np.array(list(bin(full_hash)[2:].zfill(3328)), dtype=np.int8)
-    swapped = diagonal_swap(bits)  # Assuming diagonal_swap is defined elsewhere
+    swapped = diagonal_swap(bits)
     theta_spiral = np.linspace(0, 2 * math.pi * laps, 3328) * theta_base / 180
     r_spiral = np.abs(np.linspace(-1664, 1664, 3328) / 1664)  # Inward/outward
     x = r_spiral * np.cos(theta_spiral)
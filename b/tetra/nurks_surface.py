@@ -40,10 +40,14 @@ import os
 import sys
 from datetime import datetime
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'KappashaOS')))
-from kappasha_256 import hash_surface, kappasha256
-from ribit import ribit_generate
-from kappawise import kappa_coord
-from green_curve import bspline_basis, custom_interoperations_green_curve
+try:
+    from kappasha_256 import hash_surface, kappasha256
+    from ribit import ribit_generate
+    from green_curve import bspline_basis, custom_interoperations_green_curve
+except ImportError:
+    from tetra.kappasha_256 import hash_surface, kappasha256
+    from tetra.ribit import ribit_generate
+    from tetra.green_curve import bspline_basis, custom_interoperations_green_curve
 
 u_num = 36
 v_num = 20
@@ -52,18 +56,12 @@ v_num_cap = 10
 # Define userid (placeholder; replace with actual user ID, e.g., from auth system)
 userid = 1234  # Example; must be defined to avoid NameError
 
-kappa_grid = kappa_coord(userid, theta=100)
-
-u_num = 36
-v_num = 20
-v_num_cap = 10
-
 # Optional: Compute kappa_coord if needed for other features (e.g., seeding elsewhere); skipped here per note
 # userid = 1234  # Placeholder if needed
 # kappa_coords = kappa_coord(userid, theta=100)  # Returns e.g., (814, 330, 818); unused for grid
 
-def generate_nurks_surface(ns_diam=1.0, sw_ne_diam=1.0, nw_se_diam=1.0, twist=0.0, amplitude=0.3, radii=1.0, kappa=1.0, height=1.0, inflection=0.5, morph=0.0, hex_mode=False):
-    """Generate parametric NURKS surface points (X, Y, Z) and copyright hash ID using kappasha256."""
+def generate_nurks_surface(ns_diam=1.0, sw_ne_diam=1.0, nw_se_diam=1.0, twist=0.0, amplitude=0.3, radii=1.0, kappa=1.0, height=1.0, inflection=0.5, morph=0.0, hex_mode=False, verbose=True):
+    """Generate parametric NURKS surface points (X, Y, Z) and copyright hash ID using kappasha256 (verbose=False for batch runs)."""
     # 36 nodes for angular control.
     u_num = 36
     v_num = 20
@@ -128,11 +126,13 @@ def generate_nurks_surface(ns_diam=1.0, sw_ne_diam=1.0, nw_se_diam=1.0, twist=0.
         param_str += ',bspline_degree=3,bspline_coarse=36'
     key = hashlib.sha256(struct.pack('f', kappa)).digest() * 2  # 64-byte key from kappa.
     surface_id = kappasha256(param_str.encode('utf-8'), key)[0]  # hash_hex as ID.
-    print(f"Surface Copyright ID: {surface_id}")
+    if verbose:
+        print(f"Surface Copyright ID: {surface_id}")
     # Integrate ribit for center modulation if hex_mode.
     if hex_mode:
         ribit_int, state, color = ribit_generate(param_str)
-        print(f"Ribit State: {state}, Color: {color}, Int: {ribit_int}")
+        if verbose:
+            print(f"Ribit State: {state}, Color: {color}, Int: {ribit_int}")
         # Use ribit state to modulate cap parameters.
         kappa_cap = 3 + state  # >7th for higher states
         twist_cap = twist + 2 * np.pi * state / 7  # Azimuth change
@@ -180,7 +180,8 @@ def generate_nurks_surface(ns_diam=1.0, sw_ne_diam=1.0, nw_se_diam=1.0, twist=0.
         param_str += f',bspline_degree=3,bspline_coarse=36,ribit_state={state},kappa_cap={kappa_cap},mini_factor={mini_factor}'
         key = hashlib.sha256(struct.pack('f', kappa)).digest() * 2  # 64-byte key from kappa.
         surface_id = kappasha256(param_str.encode('utf-8'), key)[0]  # hash_hex as ID.
-        print(f"Surface Copyright ID: {surface_id}")
+        if verbose:
+            print(f"Surface Copyright ID: {surface_id}")
     else:
         X_cap = None
         Y_cap = None
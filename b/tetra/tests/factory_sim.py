@@ -36,21 +36,83 @@ import simpy
 import numpy as np
 import hashlib
 import time
-from ghost_hand import Ghosthand
+from concurrent.futures import ProcessPoolExecutor
+try:
+    from ghost_hand import GhostHand
+    GHOSTHAND_AVAILABLE = True
+except ImportError:
+    GHOSTHAND_AVAILABLE = False
+
+class FactoryTrace:
+    """Lightweight event-trace collector for one factory day (replaces prints)."""
+    def __init__(self):
+        self.counts = {}  # event name -> count
+        self.incident_times = {}  # incident -> sim time raised
+        self.incident_latency = []  # sim seconds from incident to lockout clear
+        self.repair_times = []  # auto-rig repair durations
+        self.kappa_trace = []  # (sim time, situational kappa)
+
+    def count(self, event):
+        self.counts[event] = self.counts.get(event, 0) + 1
+
+    def incident(self, name, now):
+        self.count(name)
+        self.incident_times[name] = now
+
+    def cleared(self, name, now, repair_time):
+        self.count("cleared")
+        self.repair_times.append(repair_time)
+        raised = self.incident_times.pop(name, None)
+        if raised is not None:
+            self.incident_latency.append(now - raised)
+
+    def kappa(self, now, value):
+        self.kappa_trace.append((now, value))
+
+    def summary(self):
+        """
+        Flatten the trace into scalar metrics for aggregation across replications.
+        Latency/repair means are NaN when nothing cleared before the run ended.
+        """
+        return {
+            "incidents": sum(v for k, v in self.counts.items() if k not in ("cleared", "drift")),
+            "cleared": self.counts.get("cleared", 0),
+            "drift_events": self.counts.get("drift", 0),
+            "mean_incident_latency": float(np.mean(self.incident_latency)) if self.incident_latency else float("nan"),
+            "mean_repair_time": float(np.mean(self.repair_times)) if self.repair_times else float("nan"),
+            "final_kappa": self.kappa_trace[-1][1] if self.kappa_trace else 0.0,
+        }
 
 class FactorySim:
-    def __init__(self, env):
+    def __init__(self, env, seed=None, trace=None, fast_forward=False, repair_time=5, stochastic=False, verbose=True):
         self.env = env
         self.gate = np.array([0, 0, 0])
         self.kappa = 0.1  # baseline curvature
         self.history = []  # kappa register
         self.lockouts = set()  # lockout tags
         self.sensors = []  # two-camera array placeholder
-        self.ghosthand = GhostHand()  # haptic feedback
+        self.rng = np.random.default_rng(seed)  # per-run stream, independent across replications
+        self.trace = trace if trace is not None else FactoryTrace()
+        self.fast_forward = fast_forward  # skip register hashing and haptics, sim clock only
+        self.repair_time = repair_time
+        self.stochastic = stochastic  # exponential rupture/repair times around the nominal ones
+        self.verbose = verbose
+        # haptic feedback, skipped in fast-forward so workers stay light
+        self.ghosthand = GhostHand() if GHOSTHAND_AVAILABLE and not fast_forward else None
+
+    def log(self, msg):
+        if self.verbose:
+            print(msg)
+
+    def pulse(self, count):
+        if self.ghosthand is not None:
+            self.ghosthand.pulse(count)
 
     def register_kappa(self, incident=None):
-        now = time.time()
-        key = hashlib.sha3_256(f"{now}{self.kappa:.2f}{incident or ''}".encode()).hexdigest()
+        now = self.env.now if self.fast_forward else time.time()
+        key = None
+        if not self.fast_forward:
+            key = hashlib.sha3_256(f"{now}{self.kappa:.2f}{incident or ''}".encode()).hexdigest()
         self.history.append((now, self.kappa, key))
         if len(self.history) > 1000:
             self.history.pop(0)  # keep last 1000
@@ -68,37 +130,107 @@ class FactorySim:
     def trigger_emergency(self, incident):
         self.kappa += 0.2  # reflex to hazard
         self.lockouts.add(incident)
-        self.ghosthand.pulse(2)  # alert workers
-        print(f"{incident.upper()} - Kappa now {self.kappa:.2f}")
+        self.pulse(2)  # alert workers
+        self.trace.incident(incident, self.env.now)
+        self.log(f"{incident.upper()} - Kappa now {self.kappa:.2f}")
 
-    def auto_rig(self, target, repair_time=5):
+    def auto_rig(self, target, repair_time=None, incident=None):
+        if repair_time is None:
+            repair_time = self.rng.exponential(self.repair_time) if self.stochastic else self.repair_time
         yield self.env.timeout(repair_time)
-        print(f"{target} fixed by drone. Lockout cleared.")
-        self.lockouts.discard(target)
+        self.log(f"{target} fixed by drone. Lockout cleared.")
+        self.lockouts.discard(incident or target)
         self.kappa -= 0.2  # settle
-        self.ghosthand.pulse(1)  # clear signal
+        self.pulse(1)  # clear signal
+        self.trace.cleared(incident or target, self.env.now, repair_time)
 
     def camera_array(self):
         # two-camera stereo, 15in baseline
-        points = np.random.rand(100, 3) * 100  # mock point cloud
+        if self.fast_forward:
+            points = self.rng.random((1, 3)) * 100  # only the last point drives drift
+        else:
+            points = self.rng.random((100, 3)) * 100  # mock point cloud
         drift = np.linalg.norm(points[-1] - self.gate)
         if drift > 5:  # threshold for path deviation
             self.kappa += 0.05
-            self.ghosthand.pulse(3)  # warn of drift
+            self.pulse(3)  # warn of drift
+            self.trace.count("drift")
         return points
 
     def run_day(self):
-        print(f"Day start - Situational Kappa = {self.get_situational_kappa():.3f}")
-        yield self.env.timeout(20)  # 20s to rupture
+        self.log(f"Day start - Situational Kappa = {self.get_situational_kappa():.3f}")
+        self.trace.kappa(self.env.now, self.get_situational_kappa())
+        yield self.env.timeout(self.rng.exponential(20) if self.stochastic else 20)  # 20s to rupture
         self.trigger_emergency("gas_rupture")
         self.register_kappa("gas_rupture")
-        yield self.env.process(self.auto_rig("gas_line"))
+        yield self.env.process(self.auto_rig("gas_line", incident="gas_rupture"))
         self.camera_array()  # update kappa
         self.register_kappa()
-        print(f"Day end - Situational Kappa = {self.get_situational_kappa():.3f}")
+        self.trace.kappa(self.env.now, self.get_situational_kappa())
+        self.log(f"Day end - Situational Kappa = {self.get_situational_kappa():.3f}")
+
+def run_replication(seed, until=60, fast_forward=True, repair_time=5, stochastic=True):
+    """
+    Runs one independently seeded factory day and returns its trace summary.
+    - seed: int or np.random.SeedSequence for this replication.
+    - until: Sim seconds to run (default 60).
+    - fast_forward: Skip wall-clock hashing and haptics (default True).
+    - repair_time: Auto-rig repair duration in sim seconds (default 5).
+    - stochastic: Draw rupture/repair times from the seeded stream (default True).
+    Returns: Dict of scalar metrics from FactoryTrace.summary().
+    """
+    env = simpy.Environment()
+    sim = FactorySim(env, seed=seed, fast_forward=fast_forward, repair_time=repair_time,
+                     stochastic=stochastic, verbose=False)
+    env.process(sim.run_day())
+    env.run(until=until)
+    return sim.trace.summary()
+
+def confidence_interval(values, confidence=0.95):
+    """
+    Student-t confidence interval for the mean of replication values.
+    NaN values (runs where the metric never occurred) are left out.
+    Returns: (mean, low, high); the bounds collapse to the mean for fewer than 2 values.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    mean = float(values.mean()) if values.size else float("nan")
+    if values.size < 2:
+        return mean, mean, mean
+    from scipy import stats
+    half = stats.t.ppf((1 + confidence) / 2, values.size - 1) * values.std(ddof=1) / np.sqrt(values.size)
+    return mean, float(mean - half), float(mean + half)
+
+def run_replications(n, base_seed=0, until=60, fast_forward=True, repair_time=5, stochastic=True,
+                     workers=None, confidence=0.95):
+    """
+    Runs n factory days across a process pool and aggregates them into confidence intervals.
+    - n: Number of replications.
+    - base_seed: Root seed; each run gets an independent SeedSequence child.
+    - workers: Pool size (default os.cpu_count()); 1 runs inline without a pool.
+    Returns: Dict metric -> (mean, low, high), plus 'replications': n and
+    'contributing': metric -> number of runs with a value (NaN runs are skipped).
+    """
+    seeds = np.random.SeedSequence(base_seed).spawn(n)
+    args = [(seed, until, fast_forward, repair_time, stochastic) for seed in seeds]
+    if workers == 1:
+        results = [run_replication(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_replication, *zip(*args), chunksize=max(1, n // 64)))
+    aggregate = {"replications": n, "contributing": {}}
+    for metric in results[0] if results else []:
+        values = [r[metric] for r in results]
+        aggregate[metric] = confidence_interval(values, confidence)
+        aggregate["contributing"][metric] = int(np.count_nonzero(~np.isnan(np.asarray(values, dtype=float))))
+    return aggregate
 
 if __name__ == "__main__":
     env = simpy.Environment()
     sim = FactorySim(env)
     env.process(sim.run_day())
     env.run(until=60)
+    # Capacity-planning sweep over independent factory days
+    sweep = run_replications(200, base_seed=42)
+    for metric, value in sweep.items():
+        print(f"{metric}: {value}")
@@ -0,0 +1,61 @@
+# Copyright 2025 Beau Ayres
+# Proprietary Software - All Rights Reserved
+#
+# This software is proprietary and confidential. Unauthorized copying,
+# distribution, modification, or use is strictly prohibited without
+# express written permission from Beau Ayres.
+#
+# AGPL-3.0-or-later licensed
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+from factory_sim import run_replication, run_replications, confidence_interval
+
+def test_replication_is_seed_deterministic():
+    """Same seed gives the same factory day; trace replaces prints."""
+    assert run_replication(7) == run_replication(7)
+    summary = run_replication(7, stochastic=False)
+    assert summary["incidents"] == 1
+    assert summary["mean_repair_time"] == 5
+
+def test_replications_pool_matches_inline():
+    """Process pool and inline runs aggregate to identical intervals."""
+    inline = run_replications(16, base_seed=3, workers=1)
+    pooled = run_replications(16, base_seed=3, workers=2)
+    assert inline == pooled
+    mean, low, high = inline["mean_repair_time"]
+    assert low <= mean <= high
+
+def test_confidence_interval_single_value():
+    assert confidence_interval([2.0]) == (2.0, 2.0, 2.0)
+
+def test_unfinished_runs_are_left_out_of_intervals():
+    """Runs with no cleared incident report NaN and do not drag the interval down."""
+    summary = run_replication(7, until=1, stochastic=False)
+    assert np.isnan(summary["mean_repair_time"])
+    assert np.isnan(summary["mean_incident_latency"])
+    sweep = run_replications(200, base_seed=5, until=25, workers=1)
+    contributing = sweep["contributing"]["mean_repair_time"]
+    assert 0 < contributing < 200
+    mean, low, high = sweep["mean_repair_time"]
+    assert low <= mean <= high
+    assert np.isnan(confidence_interval([np.nan, np.nan])[0])
+    assert confidence_interval([np.nan, 2.0]) == (2.0, 2.0, 2.0)
@@ -0,0 +1,55 @@
+# Copyright 2025 Beau Ayres
+# Proprietary Software - All Rights Reserved
+#
+# This software is proprietary and confidential. Unauthorized copying,
+# distribution, modification, or use is strictly prohibited without
+# express written permission from Beau Ayres.
+#
+# AGPL-3.0-or-later licensed
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gcode import iter_gcode, plan_moves
+
+def feed_words(lines):
+    return [int(word[1:]) for line in lines for word in line.split() if word.startswith('F')]
+
+def test_feed_profile_survives_simplification():
+    """A straight ramp keeps one move per distinct feed instead of one slow merged move."""
+    x, y, speeds = np.linspace(0, 1, 100), np.zeros(100), np.linspace(0, 1, 100)
+    lines = list(iter_gcode(x, y, speeds))
+    expected = np.round(speeds[1:] * 900 + 100).astype(int)
+    assert feed_words(lines) == [int(f) for i, f in enumerate(expected) if i == 0 or f != expected[i - 1]]
+    assert lines[-1].startswith("G1 X297.00 Y0.00 F1000")
+
+def test_equal_feed_runs_are_merged():
+    """Collinear points merge within a run but never across a feed change."""
+    x, y = np.linspace(0, 1, 100), np.zeros(100)
+    speeds = np.where(np.arange(100) < 50, 0.2, 0.8)
+    moves = plan_moves(np.column_stack([x, y]) * 297, np.round(speeds * 900 + 100))
+    assert [m[2] for m in moves] == [280, 820]
+    assert np.allclose(moves[0][1], [x[49] * 297, 0])
+
+def test_arcs_split_at_feed_change():
+    t = np.linspace(0, 2 * np.pi, 2000)
+    x, y = 0.5 + 0.3 * np.cos(t), 0.5 + 0.3 * np.sin(t)
+    lines = list(iter_gcode(x, y, np.where(np.arange(2000) < 1000, 0.2, 0.8)))
+    assert [line.split()[0] for line in lines[3:]] == ['G3', 'G3']
+    assert feed_words(lines) == [280, 820]
@@ -0,0 +1,64 @@
+# Copyright 2025 Beau Ayres
+# Proprietary Software - All Rights Reserved
+#
+# This software is proprietary and confidential. Unauthorized copying,
+# distribution, modification, or use is strictly prohibited without
+# express written permission from Beau Ayres.
+#
+# AGPL-3.0-or-later licensed
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os
+import subprocess
+import sys
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import geometry
+from geometry import MeshParams, build_mesh, build_meshes, pod_curve, stl_bytes
+
+def test_geometry_import_is_headless():
+    """Importing the geometry core must not pull in matplotlib."""
+    code = "import sys, geometry; print('matplotlib' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(geometry.__file__),
+                         capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "False"
+
+def test_build_meshes_pool_matches_inline():
+    """Headless batch over a process pool gives the same meshes as inline builds."""
+    params = MeshParams(num_points=24, fractal_level=1)
+    jobs = [pod_curve(60, phase, params) + (params,) for phase in (0.0, 0.3)]
+    pooled = build_meshes(jobs, workers=2)
+    for (x, y, z, p), (vertices, faces) in zip(jobs, pooled):
+        ref_vertices, ref_faces = build_mesh(x, y, z, params=p)
+        assert np.allclose(vertices, ref_vertices)
+        assert faces == ref_faces
+
+def test_stl_bytes_layout():
+    vertices, faces = build_mesh(*pod_curve(40), params=MeshParams(fractal_level=0))
+    data = stl_bytes(vertices, faces)
+    assert len(data) == 84 + 50 * len(faces)
+
+def test_package_import_resolves_curve_helpers():
+    """green_curve/nurks_surface helpers load when tetra is imported as a package."""
+    code = ("import numpy as np; from tetra import geometry, nurks_surface; "
+            "x, y = geometry.green_curve(np.array([[0., 0.], [1., 1.], [2., 0.], [3., 1.]]), [0.5] * 4); "
+            "print(len(x))")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(geometry.__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=root,
+                         capture_output=True, text=True, check=True).stdout
+    assert int(out.strip()) > 0
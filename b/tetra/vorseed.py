@@ -78,81 +78,82 @@ def export_to_stl(triangles, filename, surface_id):
             for p in tri:
                 f.write(struct.pack('<3f', *p[1:]))
             f.write(struct.pack('<H', 0)) # Attribute byte count.
-# Interactive visualization.
-fig = plt.figure(figsize=(10, 8))
-ax = fig.add_subplot(111, projection='3d')
-X, Y, Z, surface_id, X_cap, Y_cap, Z_cap = generate_nurks_surface()
-surf = ax.plot_surface(X, Y, Z, cmap='viridis', alpha=0.8)
-ax.set_title('Interactive NURKS Surface')
-ax.set_xlabel('X')
-ax.set_ylabel('Y')
-ax.set_zlabel('Z')
-# Adjust layout for sliders.
-plt.subplots_adjust(left=0.25, bottom=0.35)
-# Sliders for all parameters (positioned vertically).
-slider_params = [
-    ('NS Diam', 0.5, 2.0, 1.0),
-    ('SW/NE Diam', 0.5, 2.0, 1.0),
-    ('NW/SE Diam', 0.5, 2.0, 1.0),
-    ('Twist', -np.pi, np.pi, 0.0),
-    ('Amplitude', -1.0, 1.0, 0.3),
-    ('Radii', 0.5, 2.0, 1.0),
-    ('Kappa', 0.1, 5.0, 1.0),
-    ('Height', 0.5, 2.0, 1.0),
-    ('Inflection', 0.0, 1.0, 0.5),
-    ('Morph', 0.0, 2.0, 0.0) # Add morph slider
-]
-sliders = []
-y_pos = 0.25
-for label, vmin, vmax, vinit in slider_params:
-    ax_slider = plt.axes([0.1, y_pos, 0.65, 0.03])
-    slider = Slider(ax_slider, label, vmin, vmax, valinit=vinit)
-    sliders.append(slider)
-    y_pos -= 0.03
-# Hex mode toggle using Button.
-ax_hex = plt.axes([0.1, 0.01, 0.1, 0.03])
-btn_hex = Button(ax_hex, 'Hex Mode: Off')
-hex_mode = False
-def toggle_hex(event):
-    global hex_mode
-    hex_mode = not hex_mode
-    btn_hex.label.set_text(f'Hex Mode: {"On" if hex_mode else "Off"}')
-    update(None)
-btn_hex.on_clicked(toggle_hex)
-def update(val):
-    """Update surface based on current slider values."""
-    params = [s.val for s in sliders[:-1]] + [sliders[-1].val, hex_mode] # Morph is last slider
-    X, Y, Z, surface_id, X_cap, Y_cap, Z_cap = generate_nurks_surface(*params)
-    global surf, surf_cap
-    surf.remove()
+def main():
+    """Interactive NURKS editor; figures and sliders are only built when run, not on import."""
+    fig = plt.figure(figsize=(10, 8))
+    ax = fig.add_subplot(111, projection='3d')
+    X, Y, Z, surface_id, X_cap, Y_cap, Z_cap = generate_nurks_surface()
     surf = ax.plot_surface(X, Y, Z, cmap='viridis', alpha=0.8)
-    if hex_mode:
-        if surf_cap is not None:
-            surf_cap.remove()
-        surf_cap = ax.plot_surface(X_cap, Y_cap, Z_cap, cmap='viridis', alpha=0.8)
-    else:
-        if surf_cap is not None:
-            surf_cap.remove()
-        surf_cap = None
-    fig.canvas.draw_idle()
-for s in sliders:
-    s.on_changed(update)
-# Export button.
-ax_export = plt.axes([0.8, 0.05, 0.1, 0.075])
-btn_export = Button(ax_export, 'Export STL')
-u_num = 36
-v_num = 20
-v_num_cap = 10
-def on_export(event):
-    params = [s.val for s in sliders[:-1]] + [sliders[-1].val, hex_mode] # Morph is last slider
-    X, Y, Z, surface_id, X_cap, Y_cap, Z_cap = generate_nurks_surface(*params)
-    triangles_main = tessellate_mesh(X, Y, Z, u_num, v_num)
-    triangles = triangles_main
-    if hex_mode:
-        triangles_cap = tessellate_mesh(X_cap, Y_cap, Z_cap, u_num, v_num_cap, is_cap=True)
-        triangles += triangles_cap
-    export_to_stl(triangles, 'nurks_surface.stl', surface_id)
-    print(f"Exported to nurks_surface.stl with ID: {surface_id}")
-btn_export.on_clicked(on_export)
-surf_cap = None
-plt.show()
+    surf_cap = None
+    ax.set_title('Interactive NURKS Surface')
+    ax.set_xlabel('X')
+    ax.set_ylabel('Y')
+    ax.set_zlabel('Z')
+    # Adjust layout for sliders.
+    plt.subplots_adjust(left=0.25, bottom=0.35)
+    # Sliders for all parameters (positioned vertically).
+    slider_params = [
+        ('NS Diam', 0.5, 2.0, 1.0),
+        ('SW/NE Diam', 0.5, 2.0, 1.0),
+        ('NW/SE Diam', 0.5, 2.0, 1.0),
+        ('Twist', -np.pi, np.pi, 0.0),
+        ('Amplitude', -1.0, 1.0, 0.3),
+        ('Radii', 0.5, 2.0, 1.0),
+        ('Kappa', 0.1, 5.0, 1.0),
+        ('Height', 0.5, 2.0, 1.0),
+        ('Inflection', 0.0, 1.0, 0.5),
+        ('Morph', 0.0, 2.0, 0.0) # Add morph slider
+    ]
+    sliders = []
+    y_pos = 0.25
+    for label, vmin, vmax, vinit in slider_params:
+        ax_slider = plt.axes([0.1, y_pos, 0.65, 0.03])
+        slider = Slider(ax_slider, label, vmin, vmax, valinit=vinit)
+        sliders.append(slider)
+        y_pos -= 0.03
+    # Hex mode toggle using Button.
+    ax_hex = plt.axes([0.1, 0.01, 0.1, 0.03])
+    btn_hex = Button(ax_hex, 'Hex Mode: Off')
+    hex_mode = False
+    def toggle_hex(event):
+        nonlocal hex_mode
+        hex_mode = not hex_mode
+        btn_hex.label.set_text(f'Hex Mode: {"On" if hex_mode else "Off"}')
+        update(None)
+    btn_hex.on_clicked(toggle_hex)
+    def update(val):
+        """Update surface based on current slider values."""
+        params = [s.val for s in sliders[:-1]] + [sliders[-1].val, hex_mode] # Morph is last slider
+        X, Y, Z, surface_id, X_cap, Y_cap, Z_cap = generate_nurks_surface(*params)
+        nonlocal surf, surf_cap
+        surf.remove()
+        surf = ax.plot_surface(X, Y, Z, cmap='viridis', alpha=0.8)
+        if hex_mode:
+            if surf_cap is not None:
+                surf_cap.remove()
+            surf_cap = ax.plot_surface(X_cap, Y_cap, Z_cap, cmap='viridis', alpha=0.8)
+        else:
+            if surf_cap is not None:
+                surf_cap.remove()
+            surf_cap = None
+        fig.canvas.draw_idle()
+    for s in sliders:
+        s.on_changed(update)
+    # Export button.
+    ax_export = plt.axes([0.8, 0.05, 0.1, 0.075])
+    btn_export = Button(ax_export, 'Export STL')
+    def on_export(event):
+        params = [s.val for s in sliders[:-1]] + [sliders[-1].val, hex_mode] # Morph is last slider
+        X, Y, Z, surface_id, X_cap, Y_cap, Z_cap = generate_nurks_surface(*params)
+        triangles_main = tessellate_mesh(X, Y, Z, u_num, v_num)
+        triangles = triangles_main
+        if hex_mode:
+            triangles_cap = tessellate_mesh(X_cap, Y_cap, Z_cap, u_num, v_num_cap, is_cap=True)
+            triangles += triangles_cap
+        export_to_stl(triangles, 'nurks_surface.stl', surface_id)
+        print(f"Exported to nurks_surface.stl with ID: {surface_id}")
+    btn_export.on_clicked(on_export)
+    plt.show()
+
+if __name__ == "__main__":
+    main()